@@ -0,0 +1,4 @@
+"""Benchmarks for course manager, run against synthetic course trees.
+
+Run with `python3 -m benchmarks --help` from the repository root.
+"""
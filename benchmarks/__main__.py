@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import platform
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import click
+from benchmarks.generator import TreeSize, generate_tree
+from benchmarks.cases import run_startup_case, run_tree_cases
+
+DEFAULT_SIZES = ['10x5x10', '50x10x50', '200x20x100']
+
+
+@click.command()
+@click.option('-s', '--size', 'sizes', multiple=True, default=DEFAULT_SIZES, show_default=True,
+              help='Tree size as NxMxK: N courses, M projects per course, K todos per scope.')
+@click.option('-r', '--repeat', type=click.IntRange(min=1), default=5, show_default=True,
+              help='Number of times each case is run.')
+@click.option('-o', '--output', type=click.Path(dir_okay=False),
+              help='File to write the results to as JSON.')
+@click.option('-c', '--compare', type=click.Path(exists=True, dir_okay=False),
+              help='Results of a previous run to compare against.')
+@click.option('-t', '--threshold', type=float, default=1.2, show_default=True,
+              help='Slowdown ratio of median times that counts as a regression.')
+def main(sizes: List[str], repeat: int, output: Optional[str], compare: Optional[str],
+         threshold: float):
+    """Benchmark course manager against synthetic course trees.
+
+    Exit with status code 1 if --compare is given and any case regressed.
+    """
+    home = tempfile.mkdtemp(prefix='cm_bench_')
+    # Must be set before course manager is imported, since the home path is read on import
+    os.environ['HOME'] = home
+
+    try:
+        results = _run(home, [TreeSize.from_str(s) for s in sizes], repeat)
+    finally:
+        shutil.rmtree(home)
+
+    if output is not None:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if compare is not None:
+        with open(compare, 'r') as f:
+            baseline = json.load(f)
+
+        if _compare(baseline, results, threshold):
+            sys.exit(1)
+
+
+def _run(home: str, sizes: List[TreeSize], repeat: int) -> Dict[str, Any]:
+    """Generate a tree for each of <sizes> in <home>, and time the cases on each."""
+    from course_manager.helpers import config_helper
+
+    results: Dict[str, Any] = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'repeat': repeat,
+        },
+        'results': {},
+    }
+
+    click.echo('startup')
+    results['results']['startup'] = {'cm config': run_startup_case(home, repeat)}
+    _echo_cases(results['results']['startup'])
+
+    for size in sizes:
+        config_helper.set_config(config_helper.KEY_BASE_DIRECTORY, f'courses_{size.label}')
+
+        click.echo(f'{size.label}: generating tree')
+        generate_tree(size)
+
+        results['results'][size.label] = run_tree_cases(repeat)
+        _echo_cases(results['results'][size.label])
+
+    return results
+
+
+def _echo_cases(cases: Dict[str, Dict[str, float]]):
+    """Echo the median time of each case."""
+    for name, stats in cases.items():
+        click.echo(f'  {name:<40} {stats["median"] * 1000:10.2f} ms')
+
+
+def _compare(baseline: Dict[str, Any], results: Dict[str, Any], threshold: float) -> bool:
+    """Echo the ratio of median times in <results> to those in <baseline>.
+
+    Return True iff any case is slower than <threshold> times its baseline.
+    """
+    regressed = False
+
+    for label, cases in results['results'].items():
+        for name, stats in cases.items():
+            try:
+                base = baseline['results'][label][name]['median']
+            except KeyError:
+                continue
+
+            ratio = stats['median'] / base if base > 0 else 1.0
+            is_regression = ratio > threshold
+            regressed = regressed or is_regression
+
+            click.secho(f'{label:<12} {name:<40} {ratio:6.2f}x', fg='red' if is_regression else None)
+
+    return regressed
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import os
+import sys
+import time
+import subprocess
+from statistics import mean, median
+from typing import Any, Callable, Dict, List, Optional
+
+# Phrases and date strings parsed by the date parsing cases
+READABLE_PHRASES = ['today', 'tmr 5pm', 'next week', 'next friday 11:59pm', 'in 3 days',
+                    'tomorrow evening', 'today in 30 min', 'next monday noon']
+DATE_STRINGS = ['2020-09-01', '2020-09-01 17:00', 'Sep 1 2020', '09/01/2020 5pm',
+                '2020-09-01T23:59:00']
+
+
+def time_case(func: Callable[[], Any], repeat: int,
+              setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """Time <func> <repeat> times, calling <setup> before each run outside of the timing.
+
+    Return a dictionary of timing statistics in seconds.
+    """
+    times = []
+
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return {'min': min(times), 'median': median(times), 'mean': mean(times), 'repeat': repeat}
+
+
+def run_tree_cases(repeat: int) -> Dict[str, Dict[str, float]]:
+    """Time the course manager code paths against the tree in the configured base directory.
+
+    Return a dictionary matching case name to its timing statistics.
+    """
+    from click.testing import CliRunner
+    from course_manager import app
+    from course_manager.helpers import (course_helper, date_helper, index_helper, path_helper,
+                                        readable_date_parser, schedule_helper, todo_helper)
+    from course_manager.models.todo_item import TodoItem
+
+    courses = course_helper.get_course_codes()
+    index_path = path_helper.get_path(index_helper.INDEX_FILE)
+
+    def remove_index():
+        if index_path.exists():
+            os.remove(index_path)
+
+    schedule = schedule_helper.get_schedule(courses)
+    runner = CliRunner()
+
+    results = {
+        'schedule_helper.get_schedule (cold)': time_case(
+            lambda: schedule_helper.get_schedule(courses), repeat, setup=remove_index),
+        'schedule_helper.get_schedule (warm)': time_case(
+            lambda: schedule_helper.get_schedule(courses), repeat),
+        'Schedule.get_schedule': time_case(schedule.get_schedule, repeat),
+        'cmd_show': time_case(lambda: runner.invoke(app.run, ['show']), repeat),
+        'cmd_schedule': time_case(lambda: runner.invoke(app.run, ['schedule']), repeat),
+        'todo_helper.add_todo_item': time_case(
+            lambda: todo_helper.add_todo_item(None, TodoItem('Benchmark')), repeat),
+        'readable_date_parser.parse': time_case(
+            lambda: [readable_date_parser.parse(s) for s in READABLE_PHRASES * 100], repeat),
+        'date_helper.parse_date': time_case(
+            lambda: [date_helper.parse_date(s) for s in DATE_STRINGS * 100], repeat),
+    }
+
+    return results
+
+
+def run_startup_case(home: str, repeat: int) -> Dict[str, Any]:
+    """Time `cm config base_directory` in a new interpreter, and count the modules it imports.
+
+    Return a dictionary of timing statistics in seconds, along with the module count.
+    """
+    env = dict(os.environ, HOME=home)
+    script = ('import sys\n'
+              'from course_manager.__main__ import main\n'
+              'sys.argv = ["cm", "config", "base_directory"]\n'
+              'try:\n'
+              '    main()\n'
+              'except SystemExit:\n'
+              '    pass\n'
+              'print(len(sys.modules), file=sys.stderr)\n')
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    modules: List[int] = []
+
+    def run():
+        proc = subprocess.run([sys.executable, '-c', script], env=env, cwd=cwd,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+        modules.append(int(proc.stderr.decode().split()[-1]))
+
+    stats: Dict[str, Any] = time_case(run, repeat)
+    stats['modules'] = max(modules)
+    return stats
@@ -0,0 +1,81 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+# Fixed start date so that generated trees are the same between runs
+START_DATE = datetime(2020, 9, 1)
+
+
+@dataclass
+class TreeSize:
+    """The size of a synthetic course tree.
+
+    === Attributes ===
+    courses: the number of current courses
+    projects: the number of projects in each course
+    todos: the number of todo items in each course, and in the global scope
+    archived: the number of archived courses
+    templates: the number of templates
+    """
+    courses: int
+    projects: int
+    todos: int
+    archived: int = 0
+    templates: int = 0
+
+    @property
+    def label(self) -> str:
+        """Return a short label of the size, such as "10x5x20"."""
+        return f'{self.courses}x{self.projects}x{self.todos}'
+
+    @staticmethod
+    def from_str(s: str) -> 'TreeSize':
+        """Parse a size of the form "NxMxK", which has N courses, M projects and K todos.
+
+        Archived courses and templates are a tenth of the number of courses.
+        """
+        courses, projects, todos = (int(n) for n in s.lower().split('x'))
+        return TreeSize(courses, projects, todos, courses // 10, courses // 10)
+
+
+def generate_tree(size: TreeSize, seed: int = 0):
+    """Generate a synthetic course tree of <size> in the configured base directory.
+
+    Uses the course manager helpers, so the tree has the same layout as one created by the CLI.
+    Roughly one in ten projects has no due date.
+
+    Precondition: the base directory does not exist yet.
+    """
+    from course_manager.helpers import course_helper, project_helper, template_helper, todo_helper
+    from course_manager.models.project_settings import ProjectSettings
+    from course_manager.models.todo_item import TodoItem
+
+    rand = random.Random(seed)
+
+    def random_date():
+        return START_DATE + timedelta(days=rand.randrange(120), minutes=rand.randrange(24 * 4) * 15)
+
+    def add_todos(scope):
+        for i in range(size.todos):
+            due_date = random_date() if rand.random() < 0.5 else None
+            todo_helper.add_todo_item(scope, TodoItem(f'Todo {i}', '', rand.random() < 0.3,
+                                                      due_date, rand.randrange(4)))
+
+    for c in range(size.courses + size.archived):
+        course_code = f'c{c:05}'
+        course_helper.add_course(course_code)
+
+        for p in range(size.projects):
+            due_date = random_date() if rand.random() < 0.9 else None
+            settings = ProjectSettings(f'Project {p}', f'p{p:04}', due_date, 'open .')
+            project_helper.create_project(course_code, settings)
+
+        add_todos(course_code)
+
+        if c >= size.courses:
+            course_helper.archive_course(course_code)
+
+    for t in range(size.templates):
+        template_helper.create_template(f'template_{t}')
+
+    add_todos(None)
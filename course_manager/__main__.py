@@ -1,7 +1,14 @@
-from course_manager import app
+import sys
+from course_manager.helpers import daemon_helper
 
 
 def main():
+    # Forward the command to the daemon if it is running, otherwise run it in process
+    exit_code = daemon_helper.forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from course_manager import app
     app.run()
 
 
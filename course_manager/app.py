@@ -1,12 +1,59 @@
 import click
+from typing import List, Optional
 from course_manager.commands import commands
+from course_manager.cli import get_params, opts
+from course_manager.cli.lazy_group import LazyGroup
+from course_manager.helpers import timing_helper
 
 
-@click.group()
-def run():
+@click.group(cls=LazyGroup, lazy_commands=commands)
+@get_params(opts.PROFILE)
+def run(profile_path: Optional[str]):
     """Course manager CLI application."""
+    if profile_path is not None:
+        timing_helper.start_profile(profile_path)
+        click.get_current_context().call_on_close(_report_profile)
 
 
-# Add each command to the group
-for cmd in commands:
-    run.add_command(cmd)
+def invoke(argv: List[str], color: Optional[bool] = None) -> int:
+    """Run the command with arguments <argv> in this process, and return its exit code.
+
+    Errors are shown the same way as when the command is run from the shell, but do not exit
+    the process.
+    """
+    try:
+        result = run.main(argv, prog_name='cm', standalone_mode=False, color=color)
+        return result if isinstance(result, int) else 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Abort:
+        click.echo('Aborted!', err=True)
+        return 1
+    except click.exceptions.Exit as e:
+        return e.exit_code
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+
+
+def _report_profile():
+    """Stop profiling the command, and echo the time spent in each phase to stderr."""
+    elapsed = timing_helper.stop_profile()
+    timings = timing_helper.get_timings()
+
+    click.echo(err=True)
+    click.secho('Phase     Seconds', bold=True, err=True)
+    for phase in timing_helper.PHASES:
+        click.echo(f'{phase:<10}{timings.get(phase, 0.0):7.3f}', err=True)
+
+    # Time outside of the timed phases, such as parsing arguments and importing modules
+    other = elapsed - sum(timings.values())
+    if other > 0:
+        click.echo(f'{"other":<10}{other:7.3f}', err=True)
+    click.echo(f'{"total":<10}{elapsed:7.3f}', err=True)
+
+    if other < 0:
+        click.echo('Phases overlapped in worker threads, so they add up to more than the total.',
+                   err=True)
+
+    click.echo(f'Profile written to {timing_helper.get_profile_path()}.', err=True)
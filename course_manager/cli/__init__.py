@@ -1,6 +1,7 @@
 from course_manager.cli.repeat_prompt import repeat_prompt, Validator, ValidateResult
 from course_manager.cli import arguments as args, options as opts
 from course_manager.cli import colors
+from course_manager.cli.renderer import Renderer
 from course_manager.cli.validators import *
 
 
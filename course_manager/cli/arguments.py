@@ -2,13 +2,16 @@ import click
 
 _arg = click.argument
 
+BATCH_FILE = _arg('file', type=click.File('r'), default='-')
+COMMAND_ARGS = _arg('command_args', nargs=-1, type=click.UNPROCESSED)
 CONFIG_NAME = _arg('config_name', type=str)
 COURSE_CODE = _arg('course_code', type=str)
 COURSE_CODES = _arg('course_codes', nargs=-1)
 COURSE_CODE_OPTIONAL = _arg('course_code', type=str, required=False)
 FILE_OPTIONAL = _arg('file', type=str, required=False)
+IMPORT_FILE = _arg('file', type=click.File('r'))
 PATHS = _arg('paths', type=str, nargs=-1)
 PROJECT_ID = _arg('project_id', type=str)
 PROJECT_ID_OPTIONAL = _arg('project_id', type=str, required=False)
 TEMPLATE = _arg('template', type=str)
-TODO_INDEX = _arg('todo_index', type=int)
+TODO_TARGETS = _arg('targets', type=str, nargs=-1)
@@ -1,5 +1,4 @@
 from typing import List
-from random import shuffle
 
 COLORS = [
     'white',
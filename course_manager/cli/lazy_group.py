@@ -0,0 +1,34 @@
+import click
+from importlib import import_module
+from typing import Dict, List, Optional
+
+
+class LazyGroup(click.Group):
+    """A click group which imports its subcommands only when they are needed.
+
+    === Attributes ===
+    lazy_commands: dictionary matching command name to the import path of the command,
+    in the form "package.module:attribute"
+    """
+    lazy_commands: Dict[str, str]
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Return the sorted names of both loaded and lazy commands."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return the command with <cmd_name>, importing it if it is not loaded yet."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(_load_command(self.lazy_commands[cmd_name]), cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+
+def _load_command(import_path: str) -> click.Command:
+    """Import and return the command at <import_path>, in the form "package.module:attribute"."""
+    module_name, attr = import_path.split(':')
+    return getattr(import_module(module_name), attr)
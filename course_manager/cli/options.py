@@ -1,12 +1,63 @@
 import click
+from course_manager.cli.validators import date_option_callback
 
 _opt = click.option
 
 ARCHIVED = _opt('--archived', is_flag=True,
                 help='Option to echo archived courses.')
+COMPLETED = _opt('--completed', is_flag=True,
+                 help='Only select completed todo items.')
+COMPRESS = _opt('--compress', 'compression', type=click.Choice(['none', 'gz', 'xz']),
+                help='Compress the course into a single archive. '
+                     'Defaults to config archive_compression.')
 COURSE_CODE = _opt('-c', '--course-code', type=str,
                    help='Course code of the course.')
+COURSE_FILTER = _opt('--course', 'course_codes', type=str, multiple=True,
+                     help='Only include this course. Can be given more than once.')
+DETACH = _opt('-d', '--detach', is_flag=True,
+              help='Run in the background.')
+DUE_BEFORE = _opt('--due-before', type=str, callback=date_option_callback,
+                  help='Only include todo items due before this date.')
+FROM_DATE = _opt('--from', 'from_date', type=str, callback=date_option_callback,
+                 help='Only show projects due at or after this date.')
+IMPORT_FORMAT = _opt('-f', '--format', 'file_format', type=click.Choice(['csv', 'json']),
+                     help='Format of the file. Defaults to csv for .csv files, otherwise json.')
+INCOMPLETE = _opt('--incomplete', is_flag=True,
+                  help='Only include incomplete todo items.')
+LIMIT = _opt('-l', '--limit', type=click.IntRange(min=0),
+             help='Only show this many of the projects due first.')
+LINK = _opt('--link', is_flag=True,
+            help='Hard link template files instead of copying them. Linked files share their '
+                 'content with the template, so only use for files that will not be modified.')
+MIN_PRIORITY = _opt('--min-priority', type=int,
+                    help='Only include todo items with at least this priority.')
+NEXT = _opt('-n', '--next', 'next_n', type=click.IntRange(min=0),
+            help='Only show the next N projects due from now, or from --from if given.')
+ON_ERROR = _opt('--on-error', type=click.Choice(['stop', 'continue']), default='stop',
+                show_default=True, help='Whether to stop or continue after a failed operation.')
+OUTPUT_FORMAT = _opt('--format', 'output_format',
+                     type=click.Choice(['text', 'json', 'ndjson', 'csv']), default='text',
+                     help='Format of the output. Formats other than text are not styled, '
+                          'and are meant for other programs.')
+PAGER = _opt('--pager', is_flag=True,
+             help='Show the output in a pager as it is produced.')
+POLL = _opt('--poll', is_flag=True,
+            help='Check for changes periodically, instead of being notified by the system.')
+SORT = _opt('-s', '--sort', type=click.Choice(['due', 'priority', 'scope']), default='due',
+            show_default=True, help='Order of the todo items.')
+PROFILE = _opt('--profile', 'profile_path', type=click.Path(dir_okay=False),
+               help='Profile the command, write the pstats dump to this file, and show the '
+                    'time spent in each phase.')
 TEMPLATE = _opt('-t', '--template', type=str,
                 help='The template to use for the project.')
+TOP = _opt('--top', type=click.IntRange(min=0),
+           help='Only show the first N todo items in sorted order.')
+TO_DATE = _opt('--to', 'to_date', type=str, callback=date_option_callback,
+               help='Only show projects due before this date.')
+UNDO = _opt('-u', '--undo', is_flag=True,
+             help='Mark the todo items as incomplete instead.')
+WORKERS = _opt('-j', '--workers', type=click.IntRange(min=1),
+               help='Number of threads used to scan courses or copy files. '
+                    'Defaults to config scan_workers.')
 WRITE = _opt('-w', '--write', type=str,
              help='If given, the content to write to config.')
@@ -0,0 +1,61 @@
+import csv
+import json
+from typing import Any, Dict, Iterable, List
+from course_manager.cli.renderer import Renderer
+
+Record = Dict[str, Any]
+
+# Output formats of listings. Text is styled for people, and the others are for other programs
+FORMAT_TEXT = 'text'
+FORMAT_JSON = 'json'
+FORMAT_NDJSON = 'ndjson'
+FORMAT_CSV = 'csv'
+FORMATS = [FORMAT_TEXT, FORMAT_JSON, FORMAT_NDJSON, FORMAT_CSV]
+
+
+def write_records(records: Iterable[Record], output_format: str, fields: List[str]):
+    """Write <records> to stdout in <output_format>, without any styling.
+
+    Each record is written as soon as it is produced by <records>, and not kept after, so
+    listings of any size are written in constant memory:
+
+    - json: an array of objects
+    - ndjson: one object per line
+    - csv: a header row of <fields>, then a row of the values of <fields> for each record.
+    Missing values are empty, booleans are true or false, and lists are joined with ';'
+
+    Precondition: <output_format> is in FORMATS and is not FORMAT_TEXT.
+    """
+    with Renderer(color=False) as renderer:
+        if output_format == FORMAT_JSON:
+            _write_json(renderer, records)
+        elif output_format == FORMAT_NDJSON:
+            for record in records:
+                renderer.line(json.dumps(record))
+        else:
+            writer = csv.writer(renderer, lineterminator='\n')
+            writer.writerow(fields)
+            for record in records:
+                writer.writerow([_get_csv_value(record.get(field)) for field in fields])
+
+
+def _write_json(renderer: Renderer, records: Iterable[Record]):
+    """Write <records> with <renderer> as a json array, one object per line."""
+    separator = '[\n'
+
+    for record in records:
+        renderer.write(separator + json.dumps(record))
+        separator = ',\n'
+
+    renderer.line('[]' if separator == '[\n' else '\n]')
+
+
+def _get_csv_value(value: Any) -> Any:
+    """Return the csv representation of <value>."""
+    if value is None:
+        return ''
+    elif isinstance(value, bool):
+        return 'true' if value else 'false'
+    elif isinstance(value, list):
+        return ';'.join(map(str, value))
+    return value
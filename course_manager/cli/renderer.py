@@ -0,0 +1,90 @@
+import sys
+import click
+from click import utils as click_utils
+from click.globals import resolve_color_default
+from typing import Dict, List, Optional, Tuple
+
+# Number of characters buffered before they are written to the output
+BUFFER_SIZE = 64 * 1024
+
+
+class Renderer:
+    """Renders styled text to stdout, buffered and written in large chunks.
+
+    Styled fragments are memoized, so a fragment repeated on many rows, such as the course tag
+    of a schedule, is styled only once. Styling is turned off entirely if colors are disabled,
+    which is the case by default when stdout is not a terminal.
+
+    The renderer is a context manager which flushes the buffer when exiting.
+
+    === Attributes ===
+    color: whether text is styled
+
+    === Private attributes ===
+    _buffer_size: the number of characters buffered before flushing
+    _buffer: the text written since the last flush
+    _buffered: the total length of the text in the buffer
+    _styles: the memoized styled fragments, by their text and styles
+    """
+    color: bool
+    _buffer_size: int
+    _buffer: List[str]
+    _buffered: int
+    _styles: Dict[Tuple[str, Tuple], str]
+
+    def __init__(self, color: Optional[bool] = None, buffer_size: int = BUFFER_SIZE):
+        """Initialize the renderer.
+
+        If <color> is not given, the color setting of the running command is used, and if that
+        is not set either, text is styled iff stdout is a terminal.
+        """
+        if color is None:
+            # Same as click.echo, which strips styles when not writing to a terminal
+            color = not click_utils.should_strip_ansi(sys.stdout, resolve_color_default())
+
+        self.color = color
+        self._buffer_size = buffer_size
+        self._buffer = []
+        self._buffered = 0
+        self._styles = {}
+
+    def __enter__(self) -> 'Renderer':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def style(self, text: str, **styles) -> str:
+        """Return <text> with <styles>, as given to click.style.
+
+        Return <text> as is if colors are disabled.
+        """
+        if not self.color:
+            return text
+
+        key = (text, tuple(sorted(styles.items())))
+        styled = self._styles.get(key)
+
+        if styled is None:
+            styled = self._styles[key] = click.style(text, **styles)
+
+        return styled
+
+    def write(self, text: str):
+        """Add <text> to the buffer, flushing it if full."""
+        self._buffer.append(text)
+        self._buffered += len(text)
+
+        if self._buffered >= self._buffer_size:
+            self.flush()
+
+    def line(self, text: str = ''):
+        """Add <text> followed by a newline to the buffer, flushing it if full."""
+        self.write(text + '\n')
+
+    def flush(self):
+        """Write the buffered text to stdout."""
+        if self._buffer:
+            click.echo(''.join(self._buffer), nl=False, color=self.color)
+            self._buffer.clear()
+            self._buffered = 0
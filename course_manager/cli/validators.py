@@ -1,4 +1,7 @@
-from course_manager.helpers import date_helper, readable_date_parser
+import click
+from typing import Optional
+from course_manager.helpers import date_helper
+
 
 def date_validator(s: str):
     """Validator for due date prompt."""
@@ -6,9 +9,7 @@ def date_validator(s: str):
 
     if s.strip() == '':
         is_valid, res = True, None
-    elif (date := date_helper.parse_date(s)) is not None:
-        is_valid, res = True, date
-    elif (date := readable_date_parser.parse(s)) is not None:
+    elif (date := date_helper.parse_due_date(s)) is not None:
         is_valid, res = True, date
     else:
         msg = ('Please enter a date with one of the common formats, such as "YYYY-MM-DD".\n'
@@ -16,3 +17,15 @@ def date_validator(s: str):
                'Leave blank to not set a due date.')
 
     return is_valid, res, msg
+
+
+def date_option_callback(ctx, param, value: Optional[str]):
+    """Callback of click options which parses the value with the due date formats."""
+    if value is None:
+        return None
+
+    is_valid, res, msg = date_validator(value)
+    if not is_valid or res is None:
+        raise click.BadParameter(f'Cannot parse date "{value}".')
+
+    return res
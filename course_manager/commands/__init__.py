@@ -1,15 +1,15 @@
-from course_manager.commands import (
-    cmd_config, cmd_course, cmd_open, cmd_project, cmd_schedule, cmd_show,
-    cmd_template, cmd_todo,
-)
-
-commands = [
-    cmd_config.cmd_config,
-    cmd_course.cmd_course,
-    cmd_open.cmd_open,
-    cmd_project.cmd_project,
-    cmd_schedule.cmd_schedule,
-    cmd_show.cmd_show,
-    cmd_template.cmd_template,
-    cmd_todo.cmd_todo,
-]
+# Import paths of commands, which are only imported when the command is invoked
+commands = {
+    'batch': 'course_manager.commands.cmd_batch:cmd_batch',
+    'config': 'course_manager.commands.cmd_config:cmd_config',
+    'course': 'course_manager.commands.cmd_course:cmd_course',
+    'daemon': 'course_manager.commands.cmd_daemon:cmd_daemon',
+    'debug': 'course_manager.commands.cmd_debug:cmd_debug',
+    'open': 'course_manager.commands.cmd_open:cmd_open',
+    'project': 'course_manager.commands.cmd_project:cmd_project',
+    'schedule': 'course_manager.commands.cmd_schedule:cmd_schedule',
+    'show': 'course_manager.commands.cmd_show:cmd_show',
+    'template': 'course_manager.commands.cmd_template:cmd_template',
+    'todo': 'course_manager.commands.cmd_todo:cmd_todo',
+    'watch': 'course_manager.commands.cmd_watch:cmd_watch',
+}
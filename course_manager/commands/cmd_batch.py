@@ -0,0 +1,36 @@
+import sys
+import json
+import click
+from typing import TextIO
+from course_manager.cli import get_params, args, opts
+from course_manager.helpers import batch_helper, file_helper
+
+
+@click.command('batch')
+@get_params(args.BATCH_FILE, opts.ON_ERROR)
+def cmd_batch(file: TextIO, on_error: str):
+    """Run many operations in one process.
+
+    Operations are read from <file>, or from stdin if not given, as one json object per line.
+    The result of each operation is echoed as one json object per line.
+
+    Operations have an "op" field, which is one of:
+
+    - course.add: course_code
+
+    - project.add: course_code, project_id, and optionally name, due_date, open_method
+
+    - todo.add: title, and optionally course_code, project_id, description, due_date, priority
+
+    Exit with status code 1 if any operation failed.
+    """
+    failed = False
+
+    # Flush each written file and directory to disk only once, at the end of the batch
+    with file_helper.group_commit():
+        for result in batch_helper.run_batch(file, stop_on_error=on_error == 'stop'):
+            failed = failed or not result['ok']
+            click.echo(json.dumps(result))
+
+    if failed:
+        sys.exit(1)
@@ -30,6 +30,12 @@ def cmd_config(config_name: str, write: Optional[str]):
         click.echo(f'Invalid config key "{config_name}".')
         exit(1)
 
+    except config_helper.ConfigOverriddenError:
+        # The config is set by environment variables
+        click.echo(f'Cannot write config "{config_name}", since it is overridden by '
+                   'environment variables.')
+        exit(1)
+
 
 def _post_write_handler(config_name: str, prev: str, new: str):
     """Special handlers for writing certain configurations."""
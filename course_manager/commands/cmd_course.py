@@ -1,6 +1,7 @@
 import sys
 import click
-from course_manager.cli import get_params, args
+from typing import Optional
+from course_manager.cli import get_params, args, opts
 from course_manager.helpers import course_helper
 from course_manager.commands.common import check_course_exists
 
@@ -43,13 +44,29 @@ def cmd_course_remove(course_code: str):
 
 
 @cmd_course.command('archive')
-@get_params(args.COURSE_CODE)
-def cmd_course_archive(course_code: str):
-    """Move a course into archive folder."""
+@get_params(args.COURSE_CODE, opts.COMPRESS, opts.WORKERS)
+def cmd_course_archive(course_code: str, compression: Optional[str], workers: Optional[int]):
+    """Move a course into archive folder.
+
+    With --compress, the course is written into a single compressed archive instead, which is
+    compressed in parallel by --workers threads.
+    """
     course_code = _validate_course_code(course_code)
     check_course_exists(course_code)
 
-    course_helper.archive_course(course_code)
+    if course_helper.course_archived(course_code):
+        click.echo(f'A course with code "{course_code}" is already in archive.')
+        sys.exit(1)
+
+    # Imported here, since only archiving needs tarfile
+    from course_manager.helpers import archive_helper
+
+    try:
+        course_helper.archive_course(course_code, compression, workers)
+    except archive_helper.FilterError as e:
+        click.echo(f'The course with code "{course_code}" cannot be archived: {e}.')
+        sys.exit(1)
+
     click.echo(f'The course with code {course_code} is moved into archive.')
 
 
@@ -60,7 +77,18 @@ def cmd_course_unarchive(course_code: str):
     course_code = _validate_course_code(course_code)
     _check_course_archived(course_code)
 
-    course_helper.unarchive_course(course_code)
+    # Imported here, since only archiving needs tarfile
+    from course_manager.helpers import archive_helper
+
+    try:
+        course_helper.unarchive_course(course_code)
+    except archive_helper.FilterError as e:
+        click.echo(f'The course with code "{course_code}" cannot be extracted: {e}.')
+        sys.exit(1)
+    except course_helper.ArchiveManifestError as e:
+        click.echo(str(e))
+        sys.exit(1)
+
     click.echo(f'The course with code {course_code} is moved from archive to courses.')
 
 
@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+import click
+from course_manager.cli import get_params, opts
+from course_manager.helpers import daemon_helper
+
+# Seconds to wait for a detached daemon to start listening
+START_TIMEOUT = 5
+
+
+@click.group('daemon')
+def cmd_daemon():
+    """Start, stop, or check the daemon serving commands.
+
+    While the daemon is running, commands which only read courses, such as schedule and show,
+    are forwarded to it and run without starting up or rescanning courses.
+    """
+
+
+@cmd_daemon.command('start')
+@get_params(opts.DETACH)
+def cmd_daemon_start(detach: bool):
+    """Start the daemon. It runs in the foreground unless --detach is given."""
+    if _is_running():
+        click.echo('The daemon is already running.')
+        sys.exit(1)
+
+    # Checked before starting, so that the error is shown even when detached
+    try:
+        daemon_helper.remove_stale_socket()
+    except daemon_helper.DaemonSocketError as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+    if not detach:
+        click.echo(f'Daemon listening on {daemon_helper.get_socket_path()}.')
+        daemon_helper.serve()
+        return
+
+    if os.fork() == 0:
+        # Detach the child from the terminal, then serve
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in range(3):
+            os.dup2(devnull, fd)
+        try:
+            daemon_helper.serve()
+        finally:
+            os._exit(0)
+
+    # Wait for the daemon to start listening
+    deadline = time.monotonic() + START_TIMEOUT
+    while not _is_running():
+        if time.monotonic() > deadline:
+            click.echo('Failed to start the daemon.')
+            sys.exit(1)
+        time.sleep(0.05)
+
+    click.echo('Daemon started.')
+
+
+@cmd_daemon.command('stop')
+def cmd_daemon_stop():
+    """Stop the daemon."""
+    try:
+        daemon_helper.send_request({'type': daemon_helper.REQUEST_STOP})
+        click.echo('Daemon stopped.')
+    except daemon_helper.DaemonNotRunningError:
+        click.echo('The daemon is not running.')
+        sys.exit(1)
+
+
+@cmd_daemon.command('status')
+def cmd_daemon_status():
+    """Check whether the daemon is running."""
+    try:
+        response = daemon_helper.send_request({'type': daemon_helper.REQUEST_PING})
+        click.echo(f'The daemon is running with pid {response["pid"]}.')
+    except daemon_helper.DaemonNotRunningError:
+        click.echo('The daemon is not running.')
+        sys.exit(1)
+
+
+def _is_running() -> bool:
+    """Return True iff the daemon is running."""
+    try:
+        daemon_helper.send_request({'type': daemon_helper.REQUEST_PING})
+        return True
+    except daemon_helper.DaemonNotRunningError:
+        return False
@@ -0,0 +1,69 @@
+import sys
+import click
+from typing import Dict, Tuple
+from course_manager.cli import args, get_params
+from course_manager.helpers import io_stats_helper
+
+# Column headers of the counters in the stats table
+_COUNTER_HEADERS = {
+    io_stats_helper.DIRS_LISTED: 'Listed',
+    io_stats_helper.STATS: 'Stats',
+    io_stats_helper.FILES_OPENED: 'Opened',
+    io_stats_helper.BYTES_READ: 'Read',
+    io_stats_helper.BYTES_WRITTEN: 'Written',
+    io_stats_helper.JSON_DECODED: 'Decoded',
+}
+
+
+@click.group('debug')
+def cmd_debug():
+    """Inspect what commands do."""
+
+
+@cmd_debug.command('stats', context_settings={'ignore_unknown_options': True,
+                                              'allow_interspersed_args': False})
+@get_params(args.COMMAND_ARGS)
+def cmd_debug_stats(command_args: Tuple[str, ...]):
+    """Run the command given by COMMAND_ARGS, and echo the file system work done by each helper
+    to stderr.
+
+    The counts are directories listed, files and directories stat'ed, files opened, bytes read
+    and written, and json documents decoded. Exits with the exit code of the command.
+    """
+    from course_manager import app
+
+    if len(command_args) == 0:
+        click.echo('Please provide a command to run.')
+        sys.exit(1)
+
+    io_stats_helper.enable()
+    exit_code = app.invoke(list(command_args))
+
+    _echo_counts(io_stats_helper.get_counts())
+    sys.exit(exit_code)
+
+
+def _echo_counts(counts: Dict[str, Dict[str, int]]):
+    """Echo a table of <counts> of each helper, followed by their total, to stderr."""
+    helper_width = max([len('Helper'), len('total'), *map(len, counts)]) + 2
+    headers = [_COUNTER_HEADERS[counter] for counter in io_stats_helper.COUNTERS]
+    widths = [max(len(name), 8) + 2 for name in headers]
+
+    click.echo(err=True)
+    header = 'Helper'.ljust(helper_width) + ''.join(
+        name.rjust(width) for name, width in zip(headers, widths))
+    click.secho(header, bold=True, err=True)
+
+    totals = {counter: 0 for counter in io_stats_helper.COUNTERS}
+
+    for helper in sorted(counts):
+        values = [counts[helper].get(counter, 0) for counter in io_stats_helper.COUNTERS]
+        click.echo(helper.ljust(helper_width) + ''.join(
+            str(value).rjust(width) for value, width in zip(values, widths)), err=True)
+
+        for counter, value in zip(io_stats_helper.COUNTERS, values):
+            totals[counter] += value
+
+    click.echo('total'.ljust(helper_width) + ''.join(
+        str(totals[counter]).rjust(width)
+        for counter, width in zip(io_stats_helper.COUNTERS, widths)), err=True)
@@ -1,9 +1,10 @@
 import sys
 import click
-from typing import Optional
+from typing import Optional, TextIO
 from course_manager.cli import get_params, args, opts, repeat_prompt, date_validator
 from course_manager.models.project_settings import ProjectSettings
-from course_manager.helpers import course_helper, project_helper
+from course_manager.helpers import course_helper, import_helper, path_helper, project_helper
+from course_manager.helpers import template_helper
 from course_manager.constants import MAX_PROJECT_NAME_CHARS, MAX_PROJECT_ID_CHARS
 from course_manager.commands.common import check_course_exists
 
@@ -14,25 +15,31 @@ def cmd_project():
 
 
 @cmd_project.command('add')
-@get_params(args.COURSE_CODE, opts.TEMPLATE)
-def cmd_project_add(course_code: str, template: Optional[str]):
+@get_params(args.COURSE_CODE, opts.LINK, opts.TEMPLATE, opts.WORKERS)
+def cmd_project_add(course_code: str, link: bool, template: Optional[str],
+                    workers: Optional[int]):
     """Add a project to the course with given course code. User will be prompted with options.
 
-    If template is given, will create the project with template.
+    If template is given, will create the project with a copy of the template. The course's
+    template is used if it has one with that name. Files are cloned on file systems that
+    support it, so large templates are copied without duplicating their data.
     """
     check_course_exists(course_code)
 
-    # TODO: Should adjust based on template?
+    template_path = None
+    if template is not None:
+        template_path = _find_template(template, course_code)
+
     project_id = repeat_prompt('Project id', _get_project_id_validator(course_code))
     name = repeat_prompt('Name', _project_name_validator, default=project_id)
-    due_date = repeat_prompt('Due date', repeat_prompt.date_validator)
+    due_date = repeat_prompt('Due date', date_validator)
     open_method = click.prompt('Open method', default='open .', type=str)
 
     # Create settings based on given options
     settings = ProjectSettings(name, project_id, due_date, open_method)
 
     # Create project
-    project_helper.create_project(course_code, settings)
+    project_helper.create_project(course_code, settings, template_path, link, workers)
     click.echo(f'Project "{project_id}" created successfully!')
 
 
@@ -53,6 +60,38 @@ def cmd_command_remove(course_code: str, project_id: str):
     click.echo(f'The project "{project_id}" is is deleted from "{course_code}".')
 
 
+@cmd_project.command('import')
+@get_params(args.IMPORT_FILE, opts.COURSE_CODE, opts.IMPORT_FORMAT, opts.WORKERS)
+def cmd_project_import(file: TextIO, course_code: Optional[str], file_format: Optional[str],
+                       workers: Optional[int]):
+    """Import projects from a csv or json file.
+
+    A csv file has a header with columns course_code, project_id, name, due_date, and
+    open_method. A json file has a list of objects with the same keys. Only project_id is
+    required, and course_code can be given with --course-code for all rows instead.
+
+    All rows are validated before any project is created. Rows that fail are reported, and do
+    not stop other rows from being imported.
+    """
+    try:
+        rows = import_helper.read_rows(file, file_format)
+    except import_helper.ImportFileError as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+    results = import_helper.import_projects(rows, course_code, workers)
+    failed = [result for result in results if result.error is not None]
+
+    for result in failed:
+        project = f' ({result.course_code}/{result.project_id})' if result.project_id else ''
+        click.echo(f'Row {result.row}{project}: {result.error}')
+
+    click.echo(f'Imported {len(results) - len(failed)} projects, {len(failed)} failed.')
+
+    if failed:
+        sys.exit(1)
+
+
 def _check_project_exists(course_code: str, project_id: str):
     """Check that the course with <course_code> exists, and it has a project with id <project_id>.
 
@@ -65,6 +104,22 @@ def _check_project_exists(course_code: str, project_id: str):
         sys.exit(1)
 
 
+def _find_template(template: str, course_code: str) -> path_helper.Path:
+    """Get the path to the template to use for a project in the course with <course_code>.
+
+    If the template does not exist, display message and exit with status code 1.
+    """
+    template_path = None
+    if template_helper.template_name_is_valid(template):
+        template_path = template_helper.find_template(template, course_code)
+
+    if template_path is None:
+        click.echo(f'Template with name "{template}" does not exist.')
+        sys.exit(1)
+
+    return template_path
+
+
 def _get_project_id_validator(course_code: str):
     """Get the validator for project id, given <course_code>."""
     def project_id_validator(s: str):
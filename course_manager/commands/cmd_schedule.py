@@ -1,19 +1,37 @@
 import click
-from typing import List, Optional
-from course_manager.cli import get_params, args, colors
-from course_manager.helpers import course_helper, schedule_helper
-from course_manager.models.schedule import ScheduleProject
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from course_manager.cli import get_params, args, opts, colors, record_writer, Renderer
+from course_manager.helpers import course_helper, schedule_helper, timing_helper
+from course_manager.models.schedule import ScheduledProjects, ScheduleProject
 from course_manager import constants
 
 PROJECT_PREFIX = '  '
 
+# Fields of the records of projects, when not output as text
+RECORD_FIELDS = ['course_code', 'project_id', 'name', 'due_date', 'due_time']
+
+_NO_DUE_TIME = ''.ljust(constants.MAX_DUE_TIME_CHARS + 1)
+
 
 @click.command('schedule')
-@get_params(args.COURSE_CODES)
-def cmd_schedule(course_codes: List[str]):
+@get_params(args.COURSE_CODES, opts.FROM_DATE, opts.TO_DATE, opts.NEXT, opts.LIMIT, opts.PAGER,
+            opts.OUTPUT_FORMAT, opts.WORKERS)
+def cmd_schedule(course_codes: List[str], from_date: Optional[datetime],
+                 to_date: Optional[datetime], next_n: Optional[int], limit: Optional[int],
+                 pager: bool, output_format: str, workers: Optional[int]):
     """Show due dates of projects in order.
 
     If course_codes are given, show due dates for only those courses.
+
+    If --from, --to, --next, or --limit is given, only show scheduled projects in that range.
+
+    If --format is given, each project is output as a record with its course code, project
+    id, name, due date, and due time, where unscheduled projects have no due date. --pager
+    only applies to text.
+
+    Projects are shown once all courses are scanned, since any course may have the project
+    due first. Only the header is shown before.
     """
     if len(course_codes) == 0:
         # Show all courses
@@ -24,57 +42,152 @@ def cmd_schedule(course_codes: List[str]):
                    if course_helper.course_code_is_valid(course)
                    and course_helper.course_exists(course)]
 
-    # Get schedule using courses
-    schedule = schedule_helper.get_schedule(courses)
-    scheduled, unscheduled = schedule.get_schedule()
+    if next_n is not None:
+        # The next projects are the first projects due from now
+        from_date = from_date or datetime.now()
+        limit = next_n if limit is None else min(limit, next_n)
+
+    if output_format != record_writer.FORMAT_TEXT:
+        records = _iter_schedule_records(courses, from_date, to_date, limit, workers)
+
+        with timing_helper.phase(timing_helper.PHASE_RENDER):
+            record_writer.write_records(records, output_format, RECORD_FIELDS)
+        return
+
+    renderer = Renderer()
+
+    # Lines are generated lazily, so that the header is rendered before courses are scanned.
+    # Projects follow once the whole schedule is built, as it is ordered across all courses
+    lines = _iter_schedule_lines(renderer, courses, from_date, to_date, limit, workers)
 
+    with timing_helper.phase(timing_helper.PHASE_RENDER):
+        if pager:
+            click.echo_via_pager(lines, color=renderer.color)
+        else:
+            with renderer:
+                # Show the header before courses are scanned
+                renderer.write(next(lines))
+                renderer.flush()
+
+                for line in lines:
+                    renderer.write(line)
+
+
+def _iter_schedule_lines(renderer: Renderer, courses: List[str], from_date: Optional[datetime],
+                         to_date: Optional[datetime], limit: Optional[int],
+                         workers: Optional[int]) -> Iterator[str]:
+    """Yield the lines of the schedule of <courses> styled by <renderer>, each ending with a
+    newline.
+
+    If any of <from_date>, <to_date>, or <limit> is given, only scheduled projects in that
+    range are shown. The header is yielded first, and the projects only once every course is
+    scanned.
+    """
     # TODO: consider adding color in separate course settings
 
-    # Get a random color for each course
+    # Get a random color for each course, and style the tag of each course once
     course_colors = colors.get_colors(len(courses))
-    course_to_color = {}
-    for i in range(len(courses)):
-        course_to_color[courses[i]] = course_colors[i]
+    course_tags = {}
+    for course, color in zip(courses, course_colors):
+        course_tags[course] = _get_course_tag(renderer, course, color)
 
     # Display header
-    click.secho(PROJECT_PREFIX +
-                'Date/Time'.ljust(constants.MAX_DUE_TIME_CHARS + 1) +
-                'Course'.ljust(constants.MAX_COURSE_CODE_CHARS + 2 + 1) +
-                'Name'.ljust(constants.MAX_PROJECT_NAME_CHARS + 1) +
-                'Project Id'.ljust(constants.MAX_PROJECT_ID_CHARS + 2) + '\n',
-                bold=True)
+    yield renderer.style(PROJECT_PREFIX +
+                         'Date/Time'.ljust(constants.MAX_DUE_TIME_CHARS + 1) +
+                         'Course'.ljust(constants.MAX_COURSE_CODE_CHARS + 2 + 1) +
+                         'Name'.ljust(constants.MAX_PROJECT_NAME_CHARS + 1) +
+                         'Project Id'.ljust(constants.MAX_PROJECT_ID_CHARS + 2) + '\n',
+                         bold=True) + '\n'
+
+    scheduled, unscheduled = _get_schedule(courses, from_date, to_date, limit, workers)
 
     # Display scheduled projects
     for date, projects in scheduled:
-        click.secho(date, bold=True)
+        yield renderer.style(date, bold=True) + '\n'
+        yield from _iter_project_lines(projects, course_tags)
 
-        for project in projects:
-            click.echo(_get_project_str(project, course_to_color[project.course_code],
-                                        prefix=PROJECT_PREFIX))
-
-    # Display unscheduled projects
-    if len(unscheduled) == 0:
-        click.secho('No unscheduled projects.', bold=True)
+    # Display unscheduled projects, unless only showing a range of the schedule
+    if unscheduled is None:
+        return
+    elif len(unscheduled) == 0:
+        yield renderer.style('No unscheduled projects.', bold=True) + '\n'
     else:
-        click.secho('Unscheduled', bold=True)
-        for project in unscheduled:
-            click.echo(_get_project_str(project, course_to_color[project.course_code],
-                                        prefix=PROJECT_PREFIX))
+        yield renderer.style('Unscheduled', bold=True) + '\n'
+        yield from _iter_project_lines(unscheduled, course_tags)
+
+
+def _iter_schedule_records(courses: List[str], from_date: Optional[datetime],
+                           to_date: Optional[datetime], limit: Optional[int],
+                           workers: Optional[int]) -> Iterator[record_writer.Record]:
+    """Yield the record of each project in the schedule of <courses>, in order.
+
+    If any of <from_date>, <to_date>, or <limit> is given, only scheduled projects in that
+    range are yielded. Records are yielded once every course is scanned, since the project due
+    first can be in any course.
+    """
+    scheduled, unscheduled = _get_schedule(courses, from_date, to_date, limit, workers)
+
+    for _, projects in scheduled:
+        yield from map(_get_project_record, projects)
+
+    if unscheduled is not None:
+        yield from map(_get_project_record, unscheduled)
+
+
+def _get_schedule(courses: List[str], from_date: Optional[datetime],
+                  to_date: Optional[datetime], limit: Optional[int], workers: Optional[int]
+                  ) -> Tuple[ScheduledProjects, Optional[List[ScheduleProject]]]:
+    """Get a tuple containing (scheduled, unscheduled) projects of <courses>, as returned by
+    Schedule.get_schedule.
+
+    If any of <from_date>, <to_date>, or <limit> is given, only scheduled projects in that
+    range are included, and unscheduled is None.
+    """
+    if from_date is None and to_date is None and limit is None:
+        schedule = schedule_helper.get_schedule(courses, workers)
+        with timing_helper.phase(timing_helper.PHASE_MODEL):
+            return schedule.get_schedule()
+
+    schedule = schedule_helper.get_schedule_range(courses, from_date, to_date, limit, workers)
+    with timing_helper.phase(timing_helper.PHASE_MODEL):
+        return schedule.get_schedule()[0], None
+
+
+def _iter_project_lines(projects: List[ScheduleProject],
+                        course_tags: Dict[str, str]) -> Iterator[str]:
+    """Yield the line of each of <projects>, each ending with a newline."""
+    for project in projects:
+        yield _get_project_str(project, course_tags[project.course_code],
+                               prefix=PROJECT_PREFIX) + '\n'
+
+
+def _get_project_record(project: ScheduleProject) -> record_writer.Record:
+    """Get the record of <project>."""
+    return {
+        'course_code': project.course_code,
+        'project_id': project.project_id,
+        'name': project.name,
+        'due_date': project.due_date,
+        'due_time': project.due_time,
+    }
+
+
+def _get_course_tag(renderer: Renderer, course_code: str, course_color: Optional[str] = None
+                    ) -> str:
+    """Get the padded tag of the course with <course_code>, styled by <renderer>."""
+    return renderer.style(f'[{course_code}]'.ljust(constants.MAX_COURSE_CODE_CHARS + 2),
+                          bold=True, fg=course_color)
 
 
-def _get_project_str(project: ScheduleProject, course_color: Optional[str] = None,
-                     prefix: str = '') -> str:
-    """Get the styled string for a project, with an optional prefix."""
-    course = click.style(f'[{project.course_code}]'.ljust(constants.MAX_COURSE_CODE_CHARS + 2),
-                         bold=True, fg=course_color)
+def _get_project_str(project: ScheduleProject, course_tag: str, prefix: str = '') -> str:
+    """Get the string for a project with the styled <course_tag>, with an optional prefix."""
     project_id = f'({project.project_id})'.ljust(constants.MAX_PROJECT_ID_CHARS + 2)
     project_name = project.name.ljust(constants.MAX_PROJECT_NAME_CHARS)
 
     # Hide times at 00:00 or those that don't exist
     if project.due_time == '00:00' or project.due_time is None:
-        due_time = ''
+        due_time = _NO_DUE_TIME
     else:
-        due_time = project.due_time
-    due_time = due_time.ljust(constants.MAX_DUE_TIME_CHARS + 1)
+        due_time = project.due_time.ljust(constants.MAX_DUE_TIME_CHARS + 1)
 
-    return f'{prefix}{due_time}{course} {project_name} {project_id}'
+    return f'{prefix}{due_time}{course_tag} {project_name} {project_id}'
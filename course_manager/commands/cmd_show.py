@@ -1,15 +1,23 @@
 import sys
 import click
-from typing import Optional
-from course_manager.cli import get_params, args, opts
-from course_manager.helpers import course_helper, project_helper, date_helper
+from typing import Iterator, List, Optional, Tuple
+from course_manager.cli import get_params, args, opts, record_writer, Renderer
+from course_manager.helpers import course_helper, project_helper, date_helper, index_helper
+from course_manager.helpers import timing_helper
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.commands.common import check_course_exists
 
 MAX_TITLE_CHAR = 18
 
+# Fields of the records of projects, when not output as text
+RECORD_FIELDS = ['course_code', 'project_id', 'name', 'due_date', 'open_method']
+
 
 @click.command('show')
-@get_params(opts.ARCHIVED, args.COURSE_CODE_OPTIONAL, args.PROJECT_ID_OPTIONAL)
-def cmd_show(archived: bool, course_code: Optional[str], project_id: Optional[str]):
+@get_params(opts.ARCHIVED, opts.OUTPUT_FORMAT, opts.WORKERS, args.COURSE_CODE_OPTIONAL,
+            args.PROJECT_ID_OPTIONAL)
+def cmd_show(archived: bool, output_format: str, workers: Optional[int],
+             course_code: Optional[str], project_id: Optional[str]):
     """Show courses, projects, and more.
 
     When given:
@@ -19,18 +27,29 @@ def cmd_show(archived: bool, course_code: Optional[str], project_id: Optional[st
     - Only course_code: show info related to course
 
     - course_code and project_id: show info related to specific project from course
+
+    If --format is given, each project shown is output as a record with its course code,
+    project id, name, due date, and open method.
     """
     # TODO: add more options, such as filter by date
-    if course_code is None:
-        _show_all_courses(archived)
-    elif project_id is None:
-        _show_course(course_code)
-    else:
-        _show_project(course_code, project_id)
+    if output_format != record_writer.FORMAT_TEXT:
+        records = _iter_records(archived, workers, course_code, project_id)
+
+        with timing_helper.phase(timing_helper.PHASE_RENDER):
+            record_writer.write_records(records, output_format, RECORD_FIELDS)
+        return
+
+    with timing_helper.phase(timing_helper.PHASE_RENDER), Renderer() as renderer:
+        if course_code is None:
+            _show_all_courses(renderer, archived, workers)
+        elif project_id is None:
+            _show_course(renderer, course_code)
+        else:
+            _show_project(renderer, course_code, project_id)
 
 
-def _show_all_courses(archived: bool):
-    """Show all courses.
+def _show_all_courses(renderer: Renderer, archived: bool, workers: Optional[int] = None):
+    """Show all courses with <renderer>, scanned by at most <workers> threads.
 
     If archived is True, show archived courses instead.
     """
@@ -41,17 +60,27 @@ def _show_all_courses(archived: bool):
 
     if len(courses) == 0:
         if archived:
-            click.echo('There are currently no archived courses.')
+            renderer.line('There are currently no archived courses.')
         else:
-            click.echo('There are currently no courses.')
-    else:
+            renderer.line('There are currently no courses.')
+    elif archived:
+        # Compressed courses are listed from their manifests, without decompressing them
         for course_code in courses:
-            _show_course(course_code)
-            click.echo()
+            projects = _get_archived_projects(course_code)
+            _echo_course(renderer, course_code, [project_id for project_id, _ in projects])
+            renderer.line()
+            renderer.flush()
+    else:
+        # Read projects of all courses through the project index, showing each course as
+        # soon as it is scanned, so the buffer is flushed after each course
+        for course_code, projects in index_helper.iter_projects(courses, workers):
+            _echo_course(renderer, course_code, [project_id for project_id, _ in projects])
+            renderer.line()
+            renderer.flush()
 
 
-def _show_course(course_code: str):
-    """Show info related to course with <course_code>.
+def _show_course(renderer: Renderer, course_code: str):
+    """Show info related to course with <course_code> with <renderer>.
 
     If course does not exist, display message and exit with status code 1.
     """
@@ -59,17 +88,41 @@ def _show_course(course_code: str):
         click.echo(f'The course with code "{course_code}" does not exist.')
         sys.exit(1)
 
-    _echo_styled_str('Course', course_code)
+    _echo_course(renderer, course_code, project_helper.get_project_ids(course_code))
+
+
+def _echo_course(renderer: Renderer, course_code: str, project_ids: List[str]):
+    """Echo info related to course with <course_code> and its <project_ids> with <renderer>."""
+    _echo_styled_str(renderer, 'Course', course_code)
 
-    project_ids = project_helper.get_project_ids(course_code)
     project_str = 'No projects' if not project_ids else ', '.join(project_ids)
-    _echo_styled_str('Projects', project_str)
+    _echo_styled_str(renderer, 'Projects', project_str)
 
     # TODO: add templates here after implementing
 
 
-def _show_project(course_code: str, project_id: str):
-    """Show info related to project with <project_id> from course with <course_code>."""
+def _show_project(renderer: Renderer, course_code: str, project_id: str):
+    """Show info related to project with <project_id> from course with <course_code> with
+    <renderer>."""
+    settings = _read_project_settings(course_code, project_id)
+
+    _echo_styled_str(renderer, 'Project id', project_id)
+    _echo_styled_str(renderer, 'Name', settings.name)
+
+    if settings.due_date is not None:
+        date_str = date_helper.str_from_date(settings.due_date)
+        _echo_styled_str(renderer, 'Due date', date_str)
+
+    if settings.open_method is not None:
+        _echo_styled_str(renderer, 'Open method', settings.open_method)
+
+
+def _read_project_settings(course_code: str, project_id: str) -> ProjectSettings:
+    """Read the settings of the project with <project_id> from course with <course_code>.
+
+    If the course or project does not exist, or the settings cannot be read, display message
+    and exit with status code 1.
+    """
     if not course_helper.course_exists(course_code):
         click.echo(f'The course with code "{course_code}" does not exist.')
         sys.exit(1)
@@ -85,22 +138,74 @@ def _show_project(course_code: str, project_id: str):
                    'The file could have invalid format or does not exist.')
         sys.exit(1)
 
-    _echo_styled_str('Project id', project_id)
-    _echo_styled_str('Name', settings.name)
+    return settings
 
-    if settings.due_date is not None:
-        date_str = date_helper.str_from_date(settings.due_date)
-        _echo_styled_str('Due date', date_str)
 
-    if settings.open_method is not None:
-        _echo_styled_str('Open method', settings.open_method)
+def _iter_records(archived: bool, workers: Optional[int], course_code: Optional[str],
+                  project_id: Optional[str]) -> Iterator[record_writer.Record]:
+    """Get an iterator over the record of each project shown for the arguments of cmd_show.
+
+    Records are produced as each course is scanned, by at most <workers> threads. The
+    arguments are checked before this returns, so errors are shown before any output: if the
+    course or project does not exist, display message and exit with status code 1.
+    """
+    if project_id is not None:
+        settings = _read_project_settings(course_code, project_id)
+        return iter([_get_project_record(course_code, project_id, settings)])
+
+    if course_code is not None:
+        check_course_exists(course_code)
+        courses = index_helper.iter_projects([course_code], workers)
+    elif archived:
+        # Manifests are small, so they are all read first to report a corrupt one before output
+        courses = [(archived_code, _get_archived_projects(archived_code))
+                   for archived_code in course_helper.get_archived_course_codes()]
+    else:
+        courses = index_helper.iter_projects(course_helper.get_course_codes(), workers)
+
+    return (_get_project_record(listed_code, listed_id, settings)
+            for listed_code, projects in courses
+            for listed_id, settings in projects)
+
+
+def _get_archived_projects(course_code: str) -> List[Tuple[str, Optional[ProjectSettings]]]:
+    """Get the projects of the archived course with <course_code>, as in
+    course_helper.get_archived_projects.
+
+    If the manifest of the course cannot be read, display message and exit with status code 1.
+    """
+    try:
+        return course_helper.get_archived_projects(course_code)
+    except course_helper.ArchiveManifestError as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+
+def _get_project_record(course_code: str, project_id: str,
+                        settings: Optional[ProjectSettings]) -> record_writer.Record:
+    """Get the record of the project with <project_id> from course with <course_code>.
+
+    Only the course code and project id are known if its <settings> could not be read.
+    """
+    record = dict.fromkeys(RECORD_FIELDS)
+    record['course_code'] = course_code
+    record['project_id'] = project_id
+
+    if settings is not None:
+        record['name'] = settings.name
+        record['open_method'] = settings.open_method
+
+        if settings.due_date is not None:
+            record['due_date'] = date_helper.str_from_date(settings.due_date)
+
+    return record
 
 
-def _style_title(title: str) -> str:
-    """Return the styled string for <title>."""
-    return click.style(title, bold=True)
+def _style_title(renderer: Renderer, title: str) -> str:
+    """Return the padded string for <title>, styled by <renderer>."""
+    return renderer.style(f'{title}: '.ljust(MAX_TITLE_CHAR), bold=True)
 
 
-def _echo_styled_str(title: str, value: str = ''):
-    """Echo the styled string of <title> and <value>."""
-    click.echo(_style_title(f'{title}: '.ljust(MAX_TITLE_CHAR)) + value)
+def _echo_styled_str(renderer: Renderer, title: str, value: str = ''):
+    """Echo the styled string of <title> and <value> with <renderer>."""
+    renderer.line(_style_title(renderer, title) + value)
@@ -1,13 +1,25 @@
+import re
 import sys
+import itertools
 from course_manager.helpers.todo_helper import TodoScope
 import click
-from typing import Optional
-from course_manager.cli import get_params, args, repeat_prompt, date_validator
-from course_manager.helpers import todo_helper
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+from course_manager.cli import get_params, args, opts, repeat_prompt, date_validator, record_writer
+from course_manager.helpers import course_helper, date_helper, timing_helper, todo_helper
+from course_manager.helpers import todo_query_helper
 from course_manager.models.todo_item import TodoItem
 from course_manager.commands.common import check_course_exists, check_project_exists
 
 
+# Indexes of todo items, as a list of numbers or ranges such as 1,3-5
+INDEXES_PATTERN = re.compile(r'^\d+(-\d+)?(,\d+(-\d+)?)*$')
+
+# Fields of the records of todo items, when not output as text
+RECORD_FIELDS = ['scope', 'course_code', 'project_id', 'index', 'title', 'description',
+                 'is_complete', 'due_date', 'priority']
+
+
 @click.group('todo')
 def cmd_todo():
     """Add, manage, or remove todo items."""
@@ -28,22 +40,94 @@ def cmd_todo_add(course_code: Optional[str], project_id: Optional[str]):
 
     item = TodoItem(title, description, False, due_date, priority)
 
-    todo_helper.add_todo_item(scope, item)
+    try:
+        todo_helper.add_todo_item(scope, item)
+    except todo_helper.TodoFileError as e:
+        click.echo(str(e))
+        sys.exit(1)
+
+
+@cmd_todo.command('list')
+@get_params(opts.COURSE_FILTER, opts.DUE_BEFORE, opts.MIN_PRIORITY, opts.INCOMPLETE, opts.SORT,
+            opts.TOP, opts.OUTPUT_FORMAT, opts.WORKERS)
+def cmd_todo_list(course_codes: List[str], due_before: Optional[datetime],
+                  min_priority: Optional[int], incomplete: bool, sort: str, top: Optional[int],
+                  output_format: str, workers: Optional[int]):
+    """List the todo items of all courses and projects.
+
+    Each item is shown with its scope and its index in that scope, which can be given to
+    remove. If --course is given, only list the items of those courses and their projects.
+
+    If --format is given, each item is output as a record with its scope, course code,
+    project id, index, and fields. Items sorted by scope are output as each scope is read.
+    """
+    for course_code in course_codes:
+        check_course_exists(course_code)
+
+    todo_filter = todo_query_helper.TodoFilter(due_before, min_priority, incomplete,
+                                               list(course_codes) or None)
+
+    if output_format != record_writer.FORMAT_TEXT:
+        if sort == todo_query_helper.SORT_SCOPE and top is None:
+            # Already in the order of scopes, so nothing needs to be held to sort
+            matches = todo_query_helper.iter_todo_items(todo_filter, workers)
+        else:
+            matches = todo_query_helper.list_todo_items(todo_filter, sort, top, workers)
+
+        with timing_helper.phase(timing_helper.PHASE_RENDER):
+            record_writer.write_records(_iter_match_records(matches), output_format,
+                                        RECORD_FIELDS)
+        return
+
+    matches = todo_query_helper.list_todo_items(todo_filter, sort, top, workers)
+
+    if len(matches) == 0:
+        click.echo('There are no todo items.')
+        return
+
+    with timing_helper.phase(timing_helper.PHASE_RENDER):
+        for match in matches:
+            click.echo(_get_match_str(match))
 
 
 @cmd_todo.command('mark')
-@get_params(args.COURSE_CODE_OPTIONAL, args.PROJECT_ID_OPTIONAL)
-def cmd_todo_mark(course_code: Optional[str], project_id: Optional[str]):
-    """Mark a todo item as complete or incomplete."""
+@get_params(args.TODO_TARGETS, opts.COMPLETED, opts.DUE_BEFORE, opts.UNDO)
+def cmd_todo_mark(targets: Tuple[str, ...], completed: bool, due_before: Optional[datetime],
+                  undo: bool):
+    """Mark todo items as complete, or as incomplete if --undo is given.
+
+    TARGETS are the indexes of the items, followed by the course code and project id of their
+    scope, if any. See remove for how items are selected.
+    """
+    scope, item_ids = _select_todo_items(targets, completed, due_before, 'mark')
+
+    try:
+        todo_helper.mark_todo_items(scope, item_ids, not undo)
+    except todo_helper.TodoFileError as e:
+        click.echo(str(e))
+        sys.exit(1)
 
 
 @cmd_todo.command('remove')
-@get_params(args.TODO_INDEX, args.COURSE_CODE_OPTIONAL, args.PROJECT_ID_OPTIONAL)
-def cmd_todo_remove(todo_index: int, course_code: Optional[str], project_id: Optional[str]):
-    """Remove a todo item."""
-    scope = _get_todo_scope(course_code, project_id)
-    _check_todo_index(todo_index, scope)
-    todo_helper.remove_todo_item(scope, todo_index)
+@get_params(args.TODO_TARGETS, opts.COMPLETED, opts.DUE_BEFORE)
+def cmd_todo_remove(targets: Tuple[str, ...], completed: bool, due_before: Optional[datetime]):
+    """Remove todo items.
+
+    TARGETS are the indexes of the items, followed by the course code and project id of their
+    scope, if any. Each index can be a number, a range such as 3-10, or a list of both
+    separated by commas, such as 1,3-5. A number which is the code of an existing course is
+    taken as the course code.
+
+    If --completed or --due-before is given, only the items matching them are selected, out of
+    all items if no index is given. Indexes refer to the items before any of them change.
+    """
+    scope, item_ids = _select_todo_items(targets, completed, due_before, 'remove')
+
+    try:
+        todo_helper.remove_todo_items(scope, item_ids)
+    except todo_helper.TodoFileError as e:
+        click.echo(str(e))
+        sys.exit(1)
 
 
 def _get_todo_scope(course_code: Optional[str], project_id: Optional[str]) -> todo_helper.TodoScope:
@@ -64,16 +148,122 @@ def _get_todo_scope(course_code: Optional[str], project_id: Optional[str]) -> to
     return scope
 
 
-def _check_todo_index(todo_index: int, scope: TodoScope):
-    """Check that the <todo_index> is valid for given <scope>.
+def _get_match_str(match: todo_query_helper.TodoMatch) -> str:
+    """Get the string to display for the todo item of <match>."""
+    item = match.item
+    status = '[x]' if item.is_complete else '[ ]'
+    scope = f'{todo_query_helper.get_scope_label(match.scope)} #{match.index}'
 
-    If it is not valid, display a message and exit with status code 1.
+    details = []
+    if item.due_date is not None:
+        details.append('due ' + date_helper.str_from_date(item.due_date,
+                                                          date_helper.DATE_FORMAT_DATE_TIME))
+    if item.priority != 0:
+        details.append(f'priority {item.priority}')
+
+    detail_str = f' ({", ".join(details)})' if details else ''
+    return f'{status} {click.style(scope, bold=True)}  {item.title}{detail_str}'
+
+
+def _iter_match_records(matches: Iterable[todo_query_helper.TodoMatch]
+                        ) -> Iterator[record_writer.Record]:
+    """Yield the record of the todo item of each of <matches>."""
+    for match in matches:
+        if match.scope is None:
+            course_code, project_id = None, None
+        elif isinstance(match.scope, str):
+            course_code, project_id = match.scope, None
+        else:
+            course_code, project_id = match.scope
+
+        item = match.item
+        yield {
+            'scope': todo_query_helper.get_scope_label(match.scope),
+            'course_code': course_code,
+            'project_id': project_id,
+            'index': match.index,
+            'title': item.title,
+            'description': item.description,
+            'is_complete': item.is_complete,
+            'due_date': (date_helper.str_from_date(item.due_date)
+                         if item.due_date is not None else None),
+            'priority': item.priority,
+        }
+
+
+def _select_todo_items(targets: Tuple[str, ...], completed: bool, due_before: Optional[datetime],
+                       action: str) -> Tuple[TodoScope, List[str]]:
+    """Select the todo items to <action> given the <targets> and filters of mark or remove.
+
+    The todo file of the scope is read only once. Return a tuple containing (scope, item ids
+    of the selected items, in order).
+
+    If the targets or indexes are invalid, display a message and exit with status code 1.
     """
-    num_items = len(todo_helper.get_todo_items(scope))
+    index_strs = list(itertools.takewhile(_is_index_target, targets))
+    scope_args = targets[len(index_strs):]
+
+    if len(scope_args) > 2:
+        click.echo(f'Unexpected argument "{scope_args[2]}". '
+                   'Indexes must come before the course code and project id.')
+        sys.exit(1)
+
+    course_code = scope_args[0] if len(scope_args) > 0 else None
+    project_id = scope_args[1] if len(scope_args) > 1 else None
+
+    if len(index_strs) == 0 and not completed and due_before is None:
+        click.echo(f'Please provide the indexes of the todo items to {action}, '
+                   'or --completed or --due-before.')
+        sys.exit(1)
+
+    scope = _get_todo_scope(course_code, project_id)
+    items = todo_helper.get_todo_items(scope)
 
+    if len(index_strs) == 0:
+        indexes = range(len(items))
+    else:
+        indexes = sorted(set(_parse_indexes(index_strs, len(items), action)))
+
+    item_ids = [items[i].item_id for i in indexes
+                if (not completed or items[i].is_complete)
+                and (due_before is None
+                     or (items[i].due_date is not None and items[i].due_date < due_before))]
+
+    return scope, item_ids
+
+
+def _is_index_target(target: str) -> bool:
+    """Return True iff <target> of mark or remove is indexes rather than a course code."""
+    return (INDEXES_PATTERN.match(target) is not None
+            and not (course_helper.course_code_is_valid(target)
+                     and course_helper.course_exists(target)))
+
+
+def _parse_indexes(index_strs: List[str], num_items: int, action: str) -> Iterator[int]:
+    """Yield the indexes given by <index_strs>, which each match INDEXES_PATTERN, of a scope
+    with <num_items> items.
+
+    The bounds of a range can be given in either order. Each range is checked before it is
+    expanded, and if it is not valid, display a message and exit with status code 1.
+    """
+    for index_str in index_strs:
+        for part in index_str.split(','):
+            first, _, last = part.partition('-')
+            low, high = sorted((int(first), int(last or first)))
+
+            _check_todo_index(low, num_items, action)
+            _check_todo_index(high, num_items, action)
+            yield from range(low, high + 1)
+
+
+def _check_todo_index(todo_index: int, num_items: int, action: str):
+    """Check that the <todo_index> is valid for a scope with <num_items> items, to <action>.
+
+    If it is not valid, display a message and exit with status code 1.
+    """
     if not 0 <= todo_index < num_items:
         if num_items == 0:
-            click.echo('There are no todo items to remove.')
+            click.echo(f'There are no todo items to {action}.')
         else:
             click.echo(f'Invalid index, enter a number between 0 and {num_items - 1}.')
         sys.exit(1)
@@ -0,0 +1,26 @@
+import sys
+import click
+from course_manager.cli import get_params, opts
+from course_manager.helpers import path_helper, watch_helper
+
+
+@click.command('watch')
+@get_params(opts.POLL)
+def cmd_watch(poll: bool):
+    """Echo changes to courses, projects, and todo lists as they happen.
+
+    Each change is echoed on its own line as the kind of change followed by the course code and
+    project id, if any. Runs until interrupted.
+    """
+    if not path_helper.get_base_path().is_dir():
+        click.echo('There are currently no courses.')
+        sys.exit(1)
+
+    with watch_helper.open_watcher(poll=poll) as watcher:
+        try:
+            while True:
+                for event in watcher.read_events():
+                    location = '/'.join(part for part in event[1:] if part is not None)
+                    click.echo(f'{event.kind} {location}'.rstrip())
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,210 @@
+import os
+import copy
+import gzip
+import lzma
+import tarfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Deque, Optional, Union
+from course_manager.helpers import file_helper, scan_helper
+
+PathLike = Union[str, os.PathLike]
+
+COMPRESSION_NONE = 'none'
+
+# File extension of the archive for each compression
+ARCHIVE_EXTENSIONS = {
+    'gz': '.tar.gz',
+    'xz': '.tar.xz',
+}
+
+COMPRESSIONS = [COMPRESSION_NONE, *ARCHIVE_EXTENSIONS]
+
+# Size of the chunks of the tar stream which are compressed independently. Both gzip and xz
+# files can be made of several streams one after another, which are read back as one
+CHUNK_SIZE = 8 * 1024 * 1024
+
+_COMPRESSORS = {
+    'gz': lambda data: gzip.compress(data, mtime=0),
+    'xz': lambda data: lzma.compress(data, format=lzma.FORMAT_XZ),
+}
+
+_OPENERS = {
+    'gz': gzip.open,
+    'xz': lzma.open,
+}
+
+if hasattr(tarfile, 'FilterError'):
+    FilterError = tarfile.FilterError
+else:
+    class FilterError(Exception):
+        """Never raised, since tarfile cannot filter the members of an archive."""
+
+
+class _ChunkCompressor:
+    """A writable stream which compresses the data written to it in independent chunks.
+
+    Chunks are compressed concurrently, since zlib and lzma release the GIL, and written to
+    the underlying file in order. Only a few chunks per worker are kept in memory at a time.
+
+    === Private attributes ===
+    _file: the file the compressed chunks are written to
+    _compress: function compressing a single chunk
+    _executor: the thread pool compressing the chunks, or None if there is a single worker
+    _max_pending: the number of chunks compressed at once before waiting for the oldest
+    _pending: the chunks being compressed, in the order they were written
+    _buffer: the data written since the last full chunk
+    """
+    _file: BinaryIO
+    _compress: Callable[[bytes], bytes]
+    _executor: Optional[ThreadPoolExecutor]
+    _max_pending: int
+    _pending: Deque[Future]
+    _buffer: bytearray
+
+    def __init__(self, file: BinaryIO, compression: str, workers: int):
+        self._file = file
+        self._compress = _COMPRESSORS[compression]
+        self._executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        self._max_pending = 2 * workers
+        self._pending = deque()
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        """Write <data> to the stream, compressing every full chunk."""
+        self._buffer += data
+
+        while len(self._buffer) >= CHUNK_SIZE:
+            self._submit(bytes(self._buffer[:CHUNK_SIZE]))
+            del self._buffer[:CHUNK_SIZE]
+
+        return len(data)
+
+    def close(self):
+        """Compress the remaining data and wait for all chunks to be written."""
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+
+            while self._pending:
+                self._file.write(self._pending.popleft().result())
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+
+    def _submit(self, chunk: bytes):
+        """Compress <chunk>, writing the oldest compressed chunks if too many are pending."""
+        if self._executor is None:
+            self._file.write(self._compress(chunk))
+            return
+
+        self._pending.append(self._executor.submit(self._compress, chunk))
+
+        while len(self._pending) > self._max_pending:
+            self._file.write(self._pending.popleft().result())
+
+
+def get_archive_name(name: str, compression: str) -> str:
+    """Get the file name of the archive of <name> with <compression>.
+
+    Precondition: <compression> is a key of ARCHIVE_EXTENSIONS.
+    """
+    return name + ARCHIVE_EXTENSIONS[compression]
+
+
+def create_archive(directory: PathLike, archive_path: PathLike, compression: str,
+                   workers: Optional[int] = None):
+    """Write the directory <directory> into a compressed tar archive at <archive_path>.
+
+    The directory is stored under its own name. The tar stream is compressed in chunks by at
+    most <workers> threads, or the configured number of scan workers if not given. The
+    archive is written to a temporary file first, and only replaces <archive_path> once it is
+    complete and flushed to disk.
+
+    Each member is checked as it is added, so that an archive which extract_archive would
+    reject is never written. Raise FilterError if a member would be rejected.
+
+    Precondition: <compression> is a key of ARCHIVE_EXTENSIONS.
+    """
+    if workers is None:
+        workers = scan_helper.get_scan_workers()
+
+    directory = os.fspath(directory)
+    archive_path = os.fspath(archive_path)
+    tmp_path = archive_path + '.tmp'
+    # Members are checked as if extracted into a directory which does not exist, so that they
+    # are checked by name instead of through the links of <directory>
+    check_path = os.path.abspath(tmp_path) + '.check'
+
+    try:
+        with open(tmp_path, 'wb') as f:
+            compressor = _ChunkCompressor(f, compression, workers)
+
+            try:
+                with tarfile.open(fileobj=compressor, mode='w|') as tar:
+                    tar.add(directory, arcname=os.path.basename(directory),
+                            filter=lambda member: _check_member(member, check_path))
+            finally:
+                compressor.close()
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, archive_path)
+
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    file_helper.sync_directory(os.path.dirname(archive_path) or '.')
+
+
+def extract_archive(archive_path: PathLike, destination: PathLike, compression: str):
+    """Extract the compressed tar archive at <archive_path> into the directory <destination>.
+
+    The archive is decompressed and extracted as a stream, without being read into memory or
+    decompressed to a temporary file. Members which would be written outside of
+    <destination> are rejected with FilterError when supported by tarfile. Symbolic links are
+    extracted with their targets as they are, since linked template files point to absolute
+    paths.
+
+    Precondition: <compression> is a key of ARCHIVE_EXTENSIONS.
+    """
+    with _OPENERS[compression](archive_path, 'rb') as f:
+        with tarfile.open(fileobj=f, mode='r|') as tar:
+            if hasattr(tarfile, 'data_filter'):
+                tar.extractall(destination, filter=_extraction_filter)
+            else:
+                tar.extractall(destination)
+
+
+def _extraction_filter(member: tarfile.TarInfo, destination: str) -> tarfile.TarInfo:
+    """Return <member> as it is extracted into <destination>, or raise FilterError if it
+    would be written outside of <destination>.
+
+    Members are filtered as by the 'data' filter of tarfile, except that the targets of
+    symbolic links are kept. Members extracted through a link are still checked, since the
+    links they go through are resolved.
+
+    Precondition: tarfile supports filters.
+    """
+    if not member.issym():
+        return tarfile.data_filter(member, destination)
+
+    # Check where the link itself is written as if it were a file, then restore its target
+    as_file = copy.copy(member)
+    as_file.type, as_file.linkname = tarfile.REGTYPE, ''
+
+    checked = tarfile.data_filter(as_file, destination)
+    checked.type, checked.linkname = tarfile.SYMTYPE, member.linkname
+    return checked
+
+
+def _check_member(member: tarfile.TarInfo, destination: str) -> tarfile.TarInfo:
+    """Return <member> unchanged, or raise FilterError if extract_archive would reject it
+    when extracting into <destination>."""
+    if hasattr(tarfile, 'data_filter'):
+        _extraction_filter(member, destination)
+    return member
@@ -0,0 +1,264 @@
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.models.todo_item import TodoItem
+from course_manager.helpers import course_helper, date_helper, project_helper, todo_helper
+from course_manager.constants import MAX_PROJECT_ID_CHARS, MAX_PROJECT_NAME_CHARS
+
+Operation = Dict[str, Any]
+Result = Dict[str, Any]
+
+
+class BatchError(Exception):
+    """Exception indicating that a batch operation failed, with a message explaining why."""
+
+
+class BatchState:
+    """State shared by the operations of a batch, so that it is only read from disk once.
+
+    === Attributes ===
+    now: the time that relative due dates are resolved against
+
+    === Private attributes ===
+    _courses: dictionary matching course code to whether the course exists
+    _projects: dictionary matching course code to the ids of its projects
+    """
+    now: datetime
+    _courses: Dict[str, bool]
+    _projects: Dict[str, Set[str]]
+
+    def __init__(self, now: Optional[datetime] = None):
+        self.now = now or datetime.now()
+        self._courses = {}
+        self._projects = {}
+
+    def course_exists(self, course_code: str) -> bool:
+        """Return True iff the course with <course_code> exists."""
+        if course_code not in self._courses:
+            self._courses[course_code] = course_helper.course_exists(course_code)
+        return self._courses[course_code]
+
+    def project_exists(self, course_code: str, project_id: str) -> bool:
+        """Return True iff the project with <project_id> exists in course with <course_code>.
+
+        Precondition: the course with <course_code> exists.
+        """
+        if course_code not in self._projects:
+            self._projects[course_code] = set(project_helper.get_project_ids(course_code))
+        return project_id in self._projects[course_code]
+
+    def add_course(self, course_code: str):
+        """Record that the course with <course_code> was created."""
+        self._courses[course_code] = True
+        self._projects[course_code] = set()
+
+    def add_project(self, course_code: str, project_id: str):
+        """Record that the project with <project_id> was created in course with <course_code>."""
+        if course_code in self._projects:
+            self._projects[course_code].add(project_id)
+
+
+def run_batch(lines: Iterable[str], stop_on_error: bool = True,
+              state: Optional[BatchState] = None) -> Iterator[Result]:
+    """Run the operations in <lines>, each a json object, and yield the result of each.
+
+    Blank lines are skipped. If <stop_on_error> is True, stop after the first failed operation.
+    """
+    state = state or BatchState()
+
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip() == '':
+            continue
+
+        result = run_operation(line, state)
+        result['line'] = line_number
+        yield result
+
+        if stop_on_error and not result['ok']:
+            return
+
+
+def run_operation(line: str, state: BatchState) -> Result:
+    """Run the operation in json string <line>, using <state>.
+
+    Return the result of the operation, which contains whether it succeeded, or its error.
+    """
+    try:
+        op = json.loads(line)
+    except json.decoder.JSONDecodeError as e:
+        return {'ok': False, 'error': f'Invalid json: {e}.'}
+
+    # The name is checked to be a string first, since lists and objects cannot be looked up
+    if (not isinstance(op, dict) or not isinstance(op.get('op'), str)
+            or op['op'] not in OPERATIONS):
+        return {'ok': False, 'error': 'Unknown operation, expected one of '
+                                      f'{", ".join(OPERATIONS)}.'}
+
+    try:
+        result = OPERATIONS[op['op']](op, state)
+    except BatchError as e:
+        return {'op': op['op'], 'ok': False, 'error': str(e)}
+    except OSError as e:
+        # Only this operation failed, such as when a file cannot be written
+        return {'op': op['op'], 'ok': False, 'error': f'{e.strerror or e}.'}
+    except (TypeError, ValueError, OverflowError) as e:
+        # A field has a value the operation cannot use, such as a date out of range
+        return {'op': op['op'], 'ok': False, 'error': f'Invalid field value: {e}.'}
+
+    return {'op': op['op'], 'ok': True, **result}
+
+
+def check_course_code(course_code: str):
+    """Check that <course_code> is a valid course code, before any path is built from it.
+
+    Raise BatchError if it is invalid.
+    """
+    if not course_helper.course_code_is_valid(course_code):
+        raise BatchError(f'The course code "{course_code}" is invalid. A course code can only '
+                         'contain letters, numbers, or underscores.')
+
+
+def check_project_id(project_id: str):
+    """Check that <project_id> is a valid project id, before any path is built from it.
+
+    Raise BatchError if it is invalid.
+    """
+    if not project_helper.project_id_is_valid(project_id):
+        raise BatchError('The project id is invalid. A project id can only contain letters, '
+                         f'numbers, or underscores with at most {MAX_PROJECT_ID_CHARS} characters.')
+
+
+def check_new_project(course_code: str, project_id: str, name: str, state: BatchState):
+    """Check that a project with <project_id> and <name> can be created in <course_code>.
+
+    Raise BatchError if it cannot be created.
+    """
+    check_course_code(course_code)
+    if not state.course_exists(course_code):
+        raise BatchError(f'The course with code "{course_code}" does not exist.')
+    check_project_id(project_id)
+    if state.project_exists(course_code, project_id):
+        raise BatchError(f'The project with id "{project_id}" already exists in "{course_code}".')
+    if not project_helper.project_name_is_valid(name):
+        raise BatchError('The project name is invalid. A project name must have between 1 and '
+                         f'{MAX_PROJECT_NAME_CHARS} characters.')
+
+
+def parse_due_date(value: Any, state: BatchState) -> Optional[datetime]:
+    """Parse the due date <value> of an operation, which is None or an empty string if not set.
+
+    Raise BatchError if it cannot be parsed.
+    """
+    if value is None or (isinstance(value, str) and value.strip() == ''):
+        return None
+
+    try:
+        date = date_helper.parse_due_date(value, state.now) if isinstance(value, str) else None
+    except OverflowError:
+        # Numbers too large for a date
+        date = None
+
+    if date is None:
+        raise BatchError(f'Cannot parse due date "{value}".')
+
+    return date
+
+
+def _get(op: Operation, key: str, expected_type: type, default: Any = ...) -> Any:
+    """Get the field <key> of <op>, which must have type <expected_type>.
+
+    If <default> is not given, the field is required. Raise BatchError if the field is missing
+    or has a different type.
+    """
+    if key not in op or op[key] is None:
+        if default is ...:
+            raise BatchError(f'Missing field "{key}".')
+        return default
+
+    value = op[key]
+
+    # Note bool is a subclass of int, but should not be accepted as an int
+    if not isinstance(value, expected_type) or (isinstance(value, bool)
+                                                and expected_type is not bool):
+        raise BatchError(f'Field "{key}" must be of type {expected_type.__name__}.')
+
+    return value
+
+
+def _course_add(op: Operation, state: BatchState) -> Result:
+    """Add a course, with field course_code."""
+    course_code = _get(op, 'course_code', str).lower()
+
+    check_course_code(course_code)
+    if state.course_exists(course_code):
+        raise BatchError(f'A course with code "{course_code}" already exists.')
+    if course_helper.course_archived(course_code):
+        raise BatchError(f'A course with code "{course_code}" is already in archive.')
+
+    course_helper.add_course(course_code)
+    state.add_course(course_code)
+    return {'course_code': course_code}
+
+
+def _project_add(op: Operation, state: BatchState) -> Result:
+    """Add a project, with fields course_code, project_id, and optionally name, due_date,
+    and open_method."""
+    course_code = _get(op, 'course_code', str).lower()
+    project_id = _get(op, 'project_id', str)
+    name = _get(op, 'name', str, project_id)
+    due_date = parse_due_date(op.get('due_date'), state)
+    open_method = _get(op, 'open_method', str, 'open .')
+
+    check_new_project(course_code, project_id, name, state)
+
+    project_helper.create_project(course_code,
+                                  ProjectSettings(name, project_id, due_date, open_method))
+    state.add_project(course_code, project_id)
+    return {'course_code': course_code, 'project_id': project_id}
+
+
+def _todo_add(op: Operation, state: BatchState) -> Result:
+    """Add a todo item, with field title, and optionally course_code, project_id, description,
+    due_date, and priority."""
+    course_code = _get(op, 'course_code', str, None)
+    project_id = _get(op, 'project_id', str, None)
+    title = _get(op, 'title', str)
+    description = _get(op, 'description', str, '')
+    due_date = parse_due_date(op.get('due_date'), state)
+    priority = _get(op, 'priority', int, 0)
+
+    scope: todo_helper.TodoScope = None
+    if course_code is not None:
+        course_code = course_code.lower()
+        check_course_code(course_code)
+
+        if not state.course_exists(course_code):
+            raise BatchError(f'The course with code "{course_code}" does not exist.')
+        scope = course_code
+
+        if project_id is not None:
+            if (not project_helper.project_id_is_valid(project_id)
+                    or not state.project_exists(course_code, project_id)):
+                raise BatchError(f'The project with id "{project_id}" does not exist '
+                                 f'for the course "{course_code}".')
+            scope = (course_code, project_id)
+    elif project_id is not None:
+        raise BatchError('Field "course_code" is required when "project_id" is given.')
+
+    item = TodoItem(title, description, False, due_date, priority)
+
+    try:
+        todo_helper.add_todo_item(scope, item)
+    except todo_helper.TodoFileError as e:
+        raise BatchError(str(e))
+
+    return {'item_id': item.item_id}
+
+
+# Handlers of each operation, which return the fields to add to the result
+OPERATIONS: Dict[str, Callable[[Operation, BatchState], Result]] = {
+    'course.add': _course_add,
+    'project.add': _project_add,
+    'todo.add': _todo_add,
+}
@@ -0,0 +1,110 @@
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.models.todo_item import TodoItem
+
+# Tag of the compact representation of ProjectSettings, a json array of
+# [COMPACT_TAG, name, project_id, due date in seconds since day 1, open method]
+COMPACT_TAG = 'cm1'
+SECONDS_PER_DAY = 24 * 60 * 60
+
+RawDocument = Union[str, bytes]
+
+
+def decode_project_settings(raw: RawDocument) -> Optional[ProjectSettings]:
+    """Decode a project settings document, in either the json or compact representation.
+
+    Return None if the document is invalid.
+    """
+    try:
+        return decode_project_settings_obj(json.loads(raw))
+    except (json.decoder.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def decode_project_settings_many(raws: Iterable[RawDocument]) -> List[Optional[ProjectSettings]]:
+    """Decode many project settings documents at once, in the same order as <raws>.
+
+    The documents are parsed as a single json array, so the json decoder is only called once.
+    If any document is invalid, fall back to decoding the documents one at a time, where the
+    invalid documents are decoded into None.
+    """
+    raws = [raw.decode() if isinstance(raw, bytes) else raw for raw in raws]
+
+    try:
+        objs = json.loads('[' + ','.join(raws) + ']')
+    except json.decoder.JSONDecodeError:
+        return [decode_project_settings(raw) for raw in raws]
+
+    if len(objs) != len(raws):
+        # A document contained more than one value, such as "1, 2"
+        return [decode_project_settings(raw) for raw in raws]
+
+    return [decode_project_settings_obj(obj) for obj in objs]
+
+
+def decode_project_settings_obj(obj: Any) -> Optional[ProjectSettings]:
+    """Decode a parsed project settings document, in either the json or compact representation.
+
+    Return None if the document is invalid.
+    """
+    if isinstance(obj, list):
+        return _decode_compact(obj)
+    elif isinstance(obj, dict):
+        return ProjectSettings.from_obj(obj)
+    return None
+
+
+def encode_project_settings(settings: ProjectSettings, compact: bool = False) -> str:
+    """Encode <settings> into a document, using the compact representation if <compact>."""
+    if compact:
+        return json.dumps(encode_project_settings_obj(settings, compact=True),
+                          separators=(',', ':'))
+    return settings.to_json()
+
+
+def encode_project_settings_obj(settings: ProjectSettings, compact: bool = False) -> Any:
+    """Encode <settings> into a json object, using the compact representation if <compact>."""
+    if not compact:
+        return settings.to_obj()
+
+    due_date = None
+    if settings.due_date is not None:
+        due_date = (settings.due_date.toordinal() * SECONDS_PER_DAY
+                    + settings.due_date.hour * 3600
+                    + settings.due_date.minute * 60
+                    + settings.due_date.second)
+
+    return [COMPACT_TAG, settings.name, settings.project_id, due_date, settings.open_method]
+
+
+def decode_todo_items(objs: Iterable[Dict[str, Any]]) -> List[Optional[TodoItem]]:
+    """Decode many parsed todo item objects, in the same order as <objs>.
+
+    Invalid objects are decoded into None.
+    """
+    return [TodoItem.from_json(obj) for obj in objs]
+
+
+def _decode_compact(obj: List[Any]) -> Optional[ProjectSettings]:
+    """Decode project settings in the compact representation.
+
+    Return None if the representation is invalid.
+    """
+    try:
+        tag, name, project_id, due_date, open_method = obj
+    except ValueError:
+        return None
+
+    if tag != COMPACT_TAG or not isinstance(name, str) or not isinstance(project_id, str):
+        return None
+
+    if due_date is not None:
+        try:
+            days, seconds = divmod(due_date, SECONDS_PER_DAY)
+            due_date = datetime.fromordinal(days) + timedelta(seconds=seconds)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    return ProjectSettings(name, project_id, due_date, open_method)
@@ -1,12 +1,25 @@
+import io
+import os
 import configparser
-from course_manager.helpers import path_helper
+from typing import Dict, Optional
+from course_manager.helpers import io_stats_helper, path_helper
 
 CONFIG_FILE = '.cm_config.ini'
 
+# Prefix of environment variables that override configurations, such as CM_BASE_DIRECTORY.
+# If the base directory is overridden, the config file is neither read nor written
+ENV_PREFIX = 'CM_'
+
 KEY_BASE_DIRECTORY = 'base_directory'
+KEY_SCAN_WORKERS = 'scan_workers'
+KEY_COMPACT_SETTINGS = 'compact_settings'
+KEY_ARCHIVE_COMPRESSION = 'archive_compression'
 
 ALLOWED_CONFIG_KEYS = {
     KEY_BASE_DIRECTORY,
+    KEY_SCAN_WORKERS,
+    KEY_COMPACT_SETTINGS,
+    KEY_ARCHIVE_COMPRESSION,
 }
 
 
@@ -14,56 +27,147 @@ class ConfigKeyInvalidError(Exception):
     """Exception indicating that a config key is invalid."""
 
 
+class ConfigOverriddenError(Exception):
+    """Exception indicating that the config cannot be written, since the config file is
+    overridden by environment variables."""
+
+
+def _get_config() -> configparser.ConfigParser:
+    """Get the loaded configurations.
+
+    The configurations are read from file the first time they are needed. If the config file
+    is overridden, default values are used instead.
+    """
+    global _config
+
+    if _config is None:
+        _config = configparser.ConfigParser()
+
+        if _file_is_overridden():
+            _config['DEFAULT'] = _default_config()
+        else:
+            _read_config()
+
+    return _config
+
+
+def _default_config() -> Dict[str, str]:
+    """Get the default value of each configuration."""
+    return {
+        KEY_BASE_DIRECTORY: path_helper.DEFAULT_BASE_DIRECTORY,
+        KEY_SCAN_WORKERS: '1',
+        KEY_COMPACT_SETTINGS: 'false',
+        KEY_ARCHIVE_COMPRESSION: 'none',
+    }
+
+
+def reload_config():
+    """Discard the loaded configurations, so they are read again the next time they are needed."""
+    global _config
+
+    _config = None
+    path_helper.get_base_path.cache_clear()
+
+
+def get_config_file_path() -> path_helper.Path:
+    """Get the path to the config file."""
+    return path_helper.get_home_path(CONFIG_FILE)
+
+
+def _get_env_key(key: str) -> str:
+    """Get the name of the environment variable overriding the config with <key>."""
+    return ENV_PREFIX + key.upper()
+
+
+def _file_is_overridden() -> bool:
+    """Return True iff the config file is bypassed, since the base directory is overridden."""
+    return _get_env_key(KEY_BASE_DIRECTORY) in os.environ
+
+
 def _read_config():
     """Read configurations from files.
 
     If the file does not exist, initialize with default options.
     """
-    data_sets = _config.read(path_helper.get_home_path(CONFIG_FILE))
-
-    if len(data_sets) == 0:
+    try:
+        with open(get_config_file_path(), 'r') as f:
+            content = f.read()
+    except FileNotFoundError:
         # The file does not exist, will initialize with default values
         _initialize_config()
+        return
+
+    io_stats_helper.count_read('config_helper', content)
+    _config.read_string(content, source=str(get_config_file_path()))
 
 
 def _write_config():
-    """Write configurations to the file."""
-    with open(str(path_helper.get_home_path(CONFIG_FILE)), 'w') as configfile:
-        _config.write(configfile)
+    """Write configurations to the file atomically."""
+    # Imported here, since most commands only read configurations
+    from course_manager.helpers import file_helper
+
+    content = io.StringIO()
+    _config.write(content)
+
+    io_stats_helper.count_write('config_helper', content.getvalue())
+    file_helper.write_atomic(get_config_file_path(), content.getvalue())
 
 
 def _initialize_config():
     """Initialize configurations with default values."""
-    _config['DEFAULT'] = {
-        KEY_BASE_DIRECTORY: path_helper.DEFAULT_BASE_DIRECTORY,
-    }
+    _config['DEFAULT'] = _default_config()
     _write_config()
 
 
 def get_config(key: str) -> str:
     """Get the configuration with key <item>.
 
+    If the environment variable CM_<KEY> is set, return its value instead. If the key is
+    allowed but missing from the config file, return its default value.
+
     Raise ConfigKeyInvalidError if the key does not exist in config.
     """
     lower_key = key.lower()
     if lower_key not in ALLOWED_CONFIG_KEYS:
         raise ConfigKeyInvalidError
 
-    return _config['DEFAULT'][lower_key]
+    if (value := os.environ.get(_get_env_key(lower_key))) is not None:
+        return value
+
+    return _get_config()['DEFAULT'].get(lower_key, _default_config()[lower_key])
+
+
+def get_config_bool(key: str) -> bool:
+    """Get the configuration with key <key> as a boolean.
+
+    Values such as "true", "yes", "on", and "1" are True, and all other values are False.
+
+    Raise ConfigKeyInvalidError if the key does not exist in config.
+    """
+    value = get_config(key).strip().lower()
+    return configparser.ConfigParser.BOOLEAN_STATES.get(value, False)
 
 
 def set_config(key: str, value: str):
     """Set the configuration of key <key> to <value>.
 
     Raise ConfigKeyInvalidError if the config key is not allowed.
+    Raise ConfigOverriddenError if the config file or the key is overridden by environment
+    variables.
     """
     lower_key = key.lower()
     if lower_key not in ALLOWED_CONFIG_KEYS:
         raise ConfigKeyInvalidError
 
-    _config['DEFAULT'][lower_key] = value
+    if _file_is_overridden() or _get_env_key(lower_key) in os.environ:
+        raise ConfigOverriddenError
+
+    _get_config()['DEFAULT'][lower_key] = value
     _write_config()
 
+    if lower_key == KEY_BASE_DIRECTORY:
+        path_helper.get_base_path.cache_clear()
+
 
-_config = configparser.ConfigParser()
-_read_config()
+# Loaded on first use, so that importing this module does not touch the config file
+_config: Optional[configparser.ConfigParser] = None
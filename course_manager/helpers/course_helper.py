@@ -1,11 +1,41 @@
+import os
 import re
+import json
 import shutil
-from typing import List, Optional
-from course_manager.helpers import path_helper, template_helper
+import tempfile
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.helpers import codec_helper, config_helper, file_helper
+from course_manager.helpers import io_stats_helper, path_helper, project_helper, scan_helper
+from course_manager.helpers import template_helper
 from course_manager.constants import MAX_COURSE_CODE_CHARS
 
 ARCHIVED_DIRECTORY = '.course_manager_archived'
 
+# Suffix of the manifest written next to a compressed course archive, which lists the
+# projects of the course so that they can be shown without decompressing the archive
+MANIFEST_SUFFIX = '.manifest.json'
+MANIFEST_VERSION = 1
+
+
+class ArchiveManifestError(Exception):
+    """Exception indicating that the manifest of a compressed course is missing or corrupt, with
+    a message explaining why."""
+
+
+class CourseEntry(NamedTuple):
+    """A course found while scanning the base directory.
+
+    === Attributes ===
+    course_code: the code of the course
+    archived: whether the course is in archive
+    projects: the projects of the course, or None if projects were not scanned or the
+    course is archived
+    """
+    course_code: str
+    archived: bool
+    projects: Optional[List[project_helper.ProjectEntry]]
+
 
 def course_code_is_valid(course_code: str) -> bool:
     """Return True iff <course_code> is a valid course code.
@@ -43,28 +73,200 @@ def remove_course(course_code: str):
     shutil.rmtree(path_helper.get_path(course_code))
 
 
-def archive_course(course_code: str):
-    """Move the course with code <course_code> from archived to courses.
+def archive_course(course_code: str, compression: Optional[str] = None,
+                   workers: Optional[int] = None):
+    """Move the course with code <course_code> from courses to archived.
+
+    If <compression> is not given, use the archive_compression config. With compression "none",
+    the course directory is moved as it is. Otherwise, the course is written to a single
+    compressed archive by at most <workers> threads, along with its manifest, and the course
+    directory is removed once both are written.
 
     Preconditions:
     - the course code is valid
-    - the course exists
+    - the course exists, and is not in archive
+    - <compression> is in archive_helper.COMPRESSIONS if given
     """
+    # Imported here, since the compression modules are only needed to archive and unarchive
+    from course_manager.helpers import archive_helper
+
+    if compression is None:
+        compression = get_archive_compression()
+
     src = path_helper.get_path(course_code)
-    dest = path_helper.get_path(ARCHIVED_DIRECTORY, course_code)
-    shutil.move(str(src), str(dest))
+    archived_path = path_helper.get_path(ARCHIVED_DIRECTORY)
+    archived_path.mkdir(parents=True, exist_ok=True)
+
+    if compression == archive_helper.COMPRESSION_NONE:
+        shutil.move(str(src), str(archived_path / course_code))
+        return
+
+    # Read the projects before archiving, as the manifest is what makes the archive visible
+    projects = [(project_id, project_helper.read_project_settings(course_code, project_id))
+                for project_id in sorted(project_helper.get_project_ids(course_code))]
+
+    archive_name = archive_helper.get_archive_name(course_code, compression)
+    archive_helper.create_archive(src, archived_path / archive_name, compression, workers)
+    _write_manifest(course_code, compression, archive_name, projects)
+
+    shutil.rmtree(src)
 
 
 def unarchive_course(course_code: str):
     """Move the course with code <course_code> from archived to courses.
 
+    A compressed course is extracted from its archive as a stream, and the archive and its
+    manifest are removed once the course is restored. Raise ArchiveManifestError if its
+    manifest cannot be read, leaving the archive as it is.
+
     Preconditions:
     - the course code is valid
     - the course exists in archive
     """
+    from course_manager.helpers import archive_helper
+
     src = path_helper.get_path(ARCHIVED_DIRECTORY, course_code)
     dest = path_helper.get_path(course_code)
-    shutil.move(str(src), str(dest))
+
+    if src.is_dir():
+        shutil.move(str(src), str(dest))
+        return
+
+    manifest = _get_archive_manifest(course_code)
+    compression = manifest['compression']
+
+    if (compression not in archive_helper.ARCHIVE_EXTENSIONS
+            or manifest['archive'] != archive_helper.get_archive_name(course_code, compression)):
+        raise ArchiveManifestError(f'The manifest of the archived course "{course_code}" does '
+                                   'not name its archive.')
+
+    archive_path = path_helper.get_path(ARCHIVED_DIRECTORY, manifest['archive'])
+
+    # Extract next to the destination first, so that a failed extraction leaves no course
+    tmp_dir = tempfile.mkdtemp(prefix='.cm_unarchive_', dir=str(dest.parent))
+    try:
+        archive_helper.extract_archive(archive_path, tmp_dir, compression)
+        os.rename(os.path.join(tmp_dir, course_code), dest)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    file_helper.sync_directory(dest.parent)
+    os.remove(archive_path)
+    os.remove(_get_manifest_path(course_code))
+
+
+def get_archive_compression() -> str:
+    """Get the configured compression of archived courses.
+
+    Return "none" if the configured value is not a supported compression.
+    """
+    from course_manager.helpers import archive_helper
+
+    compression = config_helper.get_config(config_helper.KEY_ARCHIVE_COMPRESSION).strip().lower()
+    if compression not in archive_helper.COMPRESSIONS:
+        return archive_helper.COMPRESSION_NONE
+    return compression
+
+
+def read_archive_manifest(course_code: str) -> Optional[Dict[str, Any]]:
+    """Read the manifest of the compressed archive of the course with <course_code>.
+
+    Return None if the course is not in a compressed archive, or the manifest cannot be read.
+
+    Precondition: the course code is valid.
+    """
+    try:
+        with open(_get_manifest_path(course_code), 'r') as f:
+            content = f.read()
+
+        io_stats_helper.count_read('course_helper', content)
+        io_stats_helper.count('course_helper', io_stats_helper.JSON_DECODED)
+        manifest = json.loads(content)
+
+        if _manifest_is_valid(manifest):
+            return manifest
+
+    except (FileNotFoundError, json.decoder.JSONDecodeError):
+        pass
+
+    return None
+
+
+def _manifest_is_valid(manifest: Any) -> bool:
+    """Return True iff <manifest> has the fields of a manifest of the current version."""
+    return (isinstance(manifest, dict)
+            and manifest.get('version') == MANIFEST_VERSION
+            and isinstance(manifest.get('archive'), str)
+            and isinstance(manifest.get('compression'), str)
+            and isinstance(manifest.get('projects'), list)
+            and all(isinstance(project, dict) and isinstance(project.get('project_id'), str)
+                    for project in manifest['projects']))
+
+
+def _get_archive_manifest(course_code: str) -> Dict[str, Any]:
+    """Read the manifest of the compressed archive of the course with <course_code>.
+
+    Raise ArchiveManifestError if the manifest is missing or cannot be read.
+
+    Precondition: the course code is valid.
+    """
+    manifest = read_archive_manifest(course_code)
+
+    if manifest is None:
+        raise ArchiveManifestError(f'The manifest of the archived course "{course_code}" is '
+                                   'missing or corrupt.')
+
+    return manifest
+
+
+def get_archived_projects(course_code: str) -> List[Tuple[str, Optional[ProjectSettings]]]:
+    """Get the projects of the archived course with <course_code>, sorted by project id.
+
+    Return a list of tuples containing (project id, settings), where settings is None if it
+    cannot be read. Compressed courses are read from their manifest, without decompressing.
+    Raise ArchiveManifestError if the manifest cannot be read.
+
+    Preconditions:
+    - the course code is valid
+    - the course exists in archive
+    """
+    course_path = path_helper.get_path(ARCHIVED_DIRECTORY, course_code)
+
+    if course_path.is_dir():
+        entries = sorted(scan_helper.list_directories(course_path, helper='course_helper'),
+                         key=lambda entry: entry.name)
+        raws = [project_helper.read_settings_file_raw(entry.path) for entry in entries]
+        return [(entry.name, codec_helper.decode_project_settings(raw)
+                 if raw is not None else None) for entry, raw in zip(entries, raws)]
+
+    manifest = _get_archive_manifest(course_code)
+    return [(project['project_id'],
+             codec_helper.decode_project_settings_obj(project.get('settings')))
+            for project in manifest['projects']]
+
+
+def _write_manifest(course_code: str, compression: str, archive_name: str,
+                    projects: List[Tuple[str, Optional[ProjectSettings]]]):
+    """Write the manifest of the compressed archive of the course with <course_code>."""
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'course_code': course_code,
+        'compression': compression,
+        'archive': archive_name,
+        'projects': [{'project_id': project_id,
+                      'settings': codec_helper.encode_project_settings_obj(settings)
+                      if settings is not None else None}
+                     for project_id, settings in projects],
+    }
+    content = json.dumps(manifest, indent=2)
+
+    io_stats_helper.count_write('course_helper', content)
+    file_helper.write_atomic(_get_manifest_path(course_code), content)
+
+
+def _get_manifest_path(course_code: str) -> path_helper.Path:
+    """Get the path to the manifest of the compressed archive of the course with <course_code>."""
+    return path_helper.get_path(ARCHIVED_DIRECTORY, course_code + MANIFEST_SUFFIX)
 
 
 def course_exists(course_code: str) -> bool:
@@ -72,15 +274,22 @@ def course_exists(course_code: str) -> bool:
 
     Precondition: the course code is valid.
     """
-    return path_helper.get_path(course_code).exists()
+    return _path_exists(path_helper.get_path(course_code))
 
 
 def course_archived(course_code: str) -> bool:
-    """Return True iff the course with <course_code> exists in archive.
+    """Return True iff the course with <course_code> exists in archive, compressed or not.
 
     Precondition: the course code is valid.
     """
-    return path_helper.get_path(ARCHIVED_DIRECTORY, course_code).exists()
+    return (_path_exists(path_helper.get_path(ARCHIVED_DIRECTORY, course_code))
+            or _path_exists(_get_manifest_path(course_code)))
+
+
+def _path_exists(path: path_helper.Path) -> bool:
+    """Return True iff <path> exists, counting the stat call."""
+    io_stats_helper.count('course_helper', io_stats_helper.STATS)
+    return path.exists()
 
 
 def get_course_codes() -> List[str]:
@@ -89,36 +298,65 @@ def get_course_codes() -> List[str]:
 
 
 def get_archived_course_codes() -> List[str]:
-    """Get the list of course codes of archived courses, sorted alphabetically."""
-    return _get_course_codes(path_helper.get_path(ARCHIVED_DIRECTORY))
+    """Get the list of course codes of archived courses, sorted alphabetically.
+
+    Compressed courses are found from their manifests, without opening the archives.
+    """
+    # Both the course directories and the manifests are found in a single listing
+    entries = scan_helper.list_entries(path_helper.get_path(ARCHIVED_DIRECTORY),
+                                       helper='course_helper')
+    codes = set(_get_course_codes_from_entries([entry for entry in entries if entry.is_dir()]))
+
+    for entry in entries:
+        code = entry.name[:-len(MANIFEST_SUFFIX)]
+        if entry.name.endswith(MANIFEST_SUFFIX) and course_code_is_valid(code):
+            codes.add(code)
+
+    return sorted(codes)
 
 
 def get_all_course_codes() -> List[str]:
     """Get the sorted list of course codes of all courses, both archive and current."""
-    lst = get_course_codes() + get_archived_course_codes()
+    lst = [entry.course_code for entry in scan_courses(include_archived=True,
+                                                       include_projects=False)]
     lst.sort()
     return lst
 
 
+def scan_courses(include_archived: bool = False,
+                 include_projects: bool = True) -> Iterator[CourseEntry]:
+    """Yield the courses in the base directory in a single pass.
+
+    Current courses are yielded first, followed by archived courses if <include_archived> is
+    True, each sorted alphabetically. If <include_projects> is True, the projects of each
+    current course and whether they have a settings file are scanned as well.
+    """
+    entries = scan_helper.list_directories(path_helper.get_base_path(), helper='course_helper')
+
+    for code in _get_course_codes_from_entries(entries):
+        projects = project_helper.scan_projects(code) if include_projects else None
+        yield CourseEntry(code, False, projects)
+
+    if include_archived and any(entry.name == ARCHIVED_DIRECTORY for entry in entries):
+        for code in get_archived_course_codes():
+            yield CourseEntry(code, True, None)
+
+
 def _get_course_codes(directory: path_helper.Path) -> List[str]:
     """Utility function to get the list containing all course codes in <directory>.
 
     The returned list is sorted alphabetically.
     """
-    # Check if the given path is a directory
-    if not directory.is_dir():
-        return []
+    return _get_course_codes_from_entries(scan_helper.list_directories(directory,
+                                                                       helper='course_helper'))
 
-    def get_code(path: path_helper.Path) -> Optional[str]:
-        """Get the course code for the directory <path>.
 
-        Return None if it is not a valid course code, or if path is not a directory.
-        """
-        if path.is_dir():
-            code = path.name
-            if code != ARCHIVED_DIRECTORY and course_code_is_valid(code):
-                return code
+def _get_course_codes_from_entries(entries: List[os.DirEntry]) -> List[str]:
+    """Get the sorted list of course codes from the directory <entries>.
 
-    lst = [code for path in directory.iterdir() if (code := get_code(path)) is not None]
+    Entries that are the archive directory or have invalid course codes are skipped.
+    """
+    lst = [entry.name for entry in entries
+           if entry.name != ARCHIVED_DIRECTORY and course_code_is_valid(entry.name)]
     lst.sort()
     return lst
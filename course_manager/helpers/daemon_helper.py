@@ -0,0 +1,307 @@
+import os
+import sys
+import stat
+from typing import Any, Dict, List, Optional, Tuple
+
+# Note: only light modules are imported at the top, since this module is imported on every
+# startup. Modules such as json and socket are imported where they are used, once a command
+# is forwarded, and the modules needed to serve commands are imported when the daemon starts
+
+# Commands which are forwarded to the daemon, since they do not prompt and only read state
+FORWARDED_COMMANDS = {'schedule', 'show'}
+# Options which need the terminal of the client, so the command is not forwarded
+LOCAL_OPTIONS = {'--pager'}
+
+ENV_SOCKET = 'CM_DAEMON_SOCKET'
+ENV_FORWARDED = ('HOME', 'CM_')
+
+REQUEST_RUN = 'run'
+REQUEST_PING = 'ping'
+REQUEST_STOP = 'stop'
+
+CONNECT_TIMEOUT = 0.5
+
+# Modification time of the config file when the daemon last read it
+_config_mtime: Optional[int] = None
+# Watcher of the base directory, which reports changes to the cached project index, and the
+# (device, inode) of the watched base directory
+_watcher = None
+_watched_base: Optional[Tuple[int, int]] = None
+
+
+class DaemonNotRunningError(Exception):
+    """Exception indicating that the daemon is not running."""
+
+
+class DaemonSocketError(Exception):
+    """Exception indicating that the daemon cannot listen on its socket path, with a message
+    explaining why."""
+
+
+def get_socket_path() -> str:
+    """Get the path to the socket of the daemon.
+
+    The path can be set with the environment variable CM_DAEMON_SOCKET, otherwise it is in
+    the runtime directory of the user. Since the path may be in a directory shared with other
+    users, such as /tmp, the socket is only trusted if it is owned by the current user.
+    """
+    if (path := os.environ.get(ENV_SOCKET)) is not None:
+        return path
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or '/tmp'
+    return os.path.join(runtime_dir, f'cm-daemon-{os.getuid()}.sock')
+
+
+def forward(argv: List[str]) -> Optional[int]:
+    """Run the command with arguments <argv> on the daemon, and echo its output.
+
+    Return the exit code of the command, or None if the command was not run by the daemon,
+    in which case it should be run in process. This is the case if the daemon is not running,
+    the command cannot be forwarded, or the daemon has a different environment.
+    """
+    if not _can_forward(argv):
+        return None
+
+    request = {
+        'type': REQUEST_RUN,
+        'argv': argv,
+        'env': get_forwarded_env(),
+        'color': sys.stdout.isatty(),
+    }
+
+    try:
+        response = send_request(request)
+    except DaemonNotRunningError:
+        return None
+
+    if response.get('fallback', False):
+        return None
+
+    sys.stdout.write(response['stdout'])
+    sys.stdout.flush()
+    sys.stderr.write(response['stderr'])
+    return response['exit_code']
+
+
+def send_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Send <request> to the daemon and return its response.
+
+    Raise DaemonNotRunningError if the daemon is not running, or if the socket or the process
+    listening on it belongs to another user, who must not be sent the command and environment.
+    """
+    import json
+    import socket
+
+    path = get_socket_path()
+
+    try:
+        path_stat = os.stat(path)
+    except FileNotFoundError:
+        raise DaemonNotRunningError
+
+    if not stat.S_ISSOCK(path_stat.st_mode) or path_stat.st_uid != os.getuid():
+        raise DaemonNotRunningError
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(path)
+            sock.settimeout(None)
+
+            # The socket could have been replaced since it was checked
+            if _get_peer_uid(sock) not in (None, os.getuid()):
+                raise DaemonNotRunningError
+
+            with sock.makefile('rwb') as f:
+                f.write(json.dumps(request).encode() + b'\n')
+                f.flush()
+                response = f.readline()
+
+    except (ConnectionRefusedError, FileNotFoundError, socket.timeout):
+        # The socket is left over from a daemon that is no longer running
+        raise DaemonNotRunningError
+
+    if not response:
+        raise DaemonNotRunningError
+
+    return json.loads(response)
+
+
+def _get_peer_uid(sock) -> Optional[int]:
+    """Get the user id of the process at the other end of the unix socket <sock>, or None if
+    it cannot be known on this platform."""
+    import socket
+    import struct
+
+    if not hasattr(socket, 'SO_PEERCRED'):
+        return None
+
+    # struct ucred contains the pid, uid, and gid of the peer
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    return struct.unpack('3i', creds)[1]
+
+
+def get_forwarded_env() -> Dict[str, str]:
+    """Get the environment variables that affect the result of commands."""
+    return {key: value for key, value in os.environ.items() if key.startswith(ENV_FORWARDED)}
+
+
+def _can_forward(argv: List[str]) -> bool:
+    """Return True iff the command with arguments <argv> can be run by the daemon."""
+    return (len(argv) > 0 and argv[0] in FORWARDED_COMMANDS
+            and not any(arg in LOCAL_OPTIONS for arg in argv))
+
+
+def serve():
+    """Serve commands on the daemon socket until a stop request is received.
+
+    Requests are handled one at a time. The project index is kept in memory between requests,
+    and only courses reported changed by a watcher of the base directory are refreshed.
+    Configurations are read again whenever the config file changes.
+
+    Raise DaemonSocketError if the socket path is taken, as in remove_stale_socket.
+    """
+    import json
+    import socketserver
+    import threading
+    from course_manager.helpers import index_helper
+
+    path = get_socket_path()
+    remove_stale_socket()
+
+    index_helper.keep_in_memory()
+    index_helper.track_changes()
+    env = get_forwarded_env()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            if _get_peer_uid(self.connection) not in (None, os.getuid()):
+                # Only serve the user running the daemon
+                return
+
+            request = json.loads(self.rfile.readline())
+
+            if request['type'] == REQUEST_RUN:
+                if request['env'] != env:
+                    response = {'fallback': True}
+                else:
+                    response = _run_command(request['argv'], request['color'])
+            elif request['type'] == REQUEST_STOP:
+                # Shutdown must be called from another thread than the one serving
+                threading.Thread(target=self.server.shutdown).start()
+                response = {'pid': os.getpid()}
+            else:
+                response = {'pid': os.getpid()}
+
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+
+    # Create the socket readable and writable by the current user only
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(path, Handler)
+    finally:
+        os.umask(umask)
+
+    with server:
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(path)
+            _close_watcher()
+
+
+def remove_stale_socket():
+    """Remove the socket left over at the socket path by a daemon that did not stop cleanly.
+
+    Nothing else is removed: raise DaemonSocketError if the path is not a socket owned by the
+    current user, or if a daemon is listening on it.
+    """
+    path = get_socket_path()
+
+    try:
+        path_stat = os.lstat(path)
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(path_stat.st_mode) or path_stat.st_uid != os.getuid():
+        raise DaemonSocketError(f'"{path}" exists and is not a daemon socket of the current '
+                                'user. Remove it or set CM_DAEMON_SOCKET to another path.')
+
+    try:
+        send_request({'type': REQUEST_PING})
+    except DaemonNotRunningError:
+        os.remove(path)
+        return
+
+    raise DaemonSocketError(f'Another daemon is already listening on "{path}".')
+
+
+def _run_command(argv: List[str], color: bool) -> Dict[str, Any]:
+    """Run the command with arguments <argv> in this process, capturing its output.
+
+    Return the response containing the exit code and the output of the command.
+    """
+    import io
+    from contextlib import redirect_stderr, redirect_stdout
+    from course_manager import app
+
+    _reload_config_if_changed()
+    _apply_changes()
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        exit_code = app.invoke(argv, color)
+
+    return {'exit_code': exit_code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()}
+
+
+def _reload_config_if_changed():
+    """Read configurations again if the config file changed since they were last read."""
+    global _config_mtime
+    from course_manager.helpers import config_helper
+
+    try:
+        mtime = os.stat(config_helper.get_config_file_path()).st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    if mtime != _config_mtime:
+        config_helper.reload_config()
+        _config_mtime = mtime
+
+
+def _apply_changes():
+    """Report the changes to the base directory since the last request to the project index.
+
+    The watcher is started again whenever the base directory is created, replaced, or changed
+    in the config, in which case all courses are refreshed.
+    """
+    global _watcher, _watched_base
+    from course_manager.helpers import index_helper, path_helper, watch_helper
+
+    try:
+        stat = os.stat(path_helper.get_base_path())
+        base = (stat.st_dev, stat.st_ino)
+    except FileNotFoundError:
+        base = None
+
+    if _watcher is not None and base == _watched_base:
+        index_helper.apply_change_events(_watcher.read_events(timeout=0))
+        return
+
+    _close_watcher()
+    index_helper.apply_change_events([watch_helper.ChangeEvent(watch_helper.RESCAN)])
+
+    if base is not None:
+        _watcher = watch_helper.open_watcher()
+        _watched_base = base
+
+
+def _close_watcher():
+    """Stop watching the base directory."""
+    global _watcher
+
+    if _watcher is not None:
+        _watcher.close()
+        _watcher = None
@@ -1,6 +1,5 @@
 from typing import Optional
 from datetime import datetime, date
-from dateutil.parser import parse
 
 DATE_FORMAT_FULL = '%Y-%m-%d %H:%M:%S'
 DATE_FORMAT_DATE_TIME = '%Y-%m-%d %H:%M'
@@ -13,23 +12,60 @@ def parse_date(date_str: str) -> Optional[datetime]:
 
     Return None if none of the formats match.
     """
+    # Imported here since dateutil.parser is slow to import
+    from dateutil.parser import parse
+
     try:
         return parse(date_str)
     except ValueError:
         return None
 
 
+def parse_due_date(date_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """Parse <date_str> using one of the common formats, or a readable phrase such as "tmr 5pm".
+
+    Readable phrases are resolved against <now>, which defaults to the current time.
+
+    Return None if the date cannot be parsed.
+    """
+    # Imported here since readable_date_parser imports dateutil, which is slow to import
+    from course_manager.helpers import readable_date_parser
+
+    if (date := parse_date(date_str)) is not None:
+        return date
+    return readable_date_parser.parse(date_str, now)
+
+
 def date_from_str(date_str: str, date_format: str = DATE_FORMAT_FULL) -> Optional[datetime]:
     """Parse <date_str> into datetime with format <date_format>.
 
     Return None if the date cannot be parsed.
+
+    Dates in DATE_FORMAT_FULL are parsed with the faster datetime.fromisoformat when possible,
+    falling back to datetime.strptime.
     """
+    if date_format == DATE_FORMAT_FULL and _is_iso_full(date_str):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+
     try:
         return datetime.strptime(date_str, date_format)
     except ValueError:
         return None
 
 
+def _is_iso_full(date_str: str) -> bool:
+    """Return True iff <date_str> has the shape of DATE_FORMAT_FULL, "YYYY-MM-DD HH:MM:SS".
+
+    Strings of other shapes are not given to fromisoformat, since it also accepts formats
+    that strptime would reject.
+    """
+    return (len(date_str) == 19 and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[10] == ' ' and date_str[13] == ':' and date_str[16] == ':')
+
+
 def str_from_date(date_obj: datetime, date_format: str = DATE_FORMAT_FULL) -> str:
     """Return the string representation of <date>, with format <date_format>."""
     return date_obj.strftime(date_format)
@@ -0,0 +1,251 @@
+import os
+import errno
+import shutil
+import stat
+import uuid
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Set, Union
+
+PathLike = Union[str, os.PathLike]
+
+# ioctl request from <linux/fs.h> which makes a file share the extents of another file, on file
+# systems with copy-on-write support such as Btrfs and XFS
+FICLONE = 0x40049409
+
+# Errors meaning a copy method is not supported for the files, rather than that copying failed
+_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTTY,
+                       errno.EBADF, errno.ETXTBSY, errno.EPERM}
+
+# Largest number of bytes copied by a single copy_file_range or sendfile call
+_COPY_CHUNK_SIZE = 1 << 30
+
+# State of group commit, shared by all threads so that bulk operations using a thread pool
+# are part of the same group
+_lock = threading.Lock()
+_group_depth = 0
+_pending_files: Set[str] = set()
+_pending_directories: Set[str] = set()
+
+
+def write_atomic(path: PathLike, data: str, sync: bool = True):
+    """Write <data> to the file at <path>, replacing its content atomically.
+
+    The data is written to a temporary file in the same directory, which is renamed over
+    <path>, so that an interrupted write never leaves a truncated file. If the file exists,
+    its permissions are kept.
+
+    If <sync> is True, the data is flushed to disk before the rename, and the directory is
+    flushed afterwards. Within group_commit, flushing the directory is deferred to the end of
+    the group.
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(path) or '.'
+    tmp_path = os.path.join(directory, f'.{os.path.basename(path)}.{uuid.uuid4().hex}.tmp')
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+
+        os.replace(tmp_path, path)
+
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if sync:
+        sync_directory(directory)
+
+
+def append_durable(path: PathLike, data: str):
+    """Append <data> to the file at <path>, creating it if it does not exist, and flush it to
+    disk.
+
+    Within group_commit, flushing is deferred to the end of the group, so each file is only
+    flushed once.
+    """
+    path = os.fspath(path)
+    created = not os.path.exists(path)
+
+    with open(path, 'a') as f:
+        f.write(data)
+        f.flush()
+
+        if not _defer(_pending_files, path):
+            os.fsync(f.fileno())
+
+    if created:
+        sync_directory(os.path.dirname(path) or '.')
+
+
+def copy_file(src: PathLike, dst: PathLike, link: bool = False) -> str:
+    """Copy the file at <src> to the new file <dst>, keeping its permissions.
+
+    If <link> is True, <dst> is made a hard link to <src> where possible, so both share the
+    same content and changes to one are seen in the other. Otherwise the file is cloned where
+    the file system supports it, which shares the data on disk until either file is modified,
+    and copied within the kernel with copy_file_range or sendfile otherwise.
+
+    Return the method used, which is one of 'link', 'reflink', or 'copy'.
+
+    Precondition: <dst> does not exist.
+    """
+    if link:
+        try:
+            os.link(src, dst)
+            return 'link'
+        except OSError as e:
+            # Not supported for the file system, or the files are on different devices
+            if e.errno not in _UNSUPPORTED_ERRNOS | {errno.EMLINK}:
+                raise
+
+    with open(src, 'rb') as fsrc:
+        src_stat = os.fstat(fsrc.fileno())
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, stat.S_IMODE(src_stat.st_mode))
+
+        with open(fd, 'wb') as fdst:
+            if _clone(fsrc, fdst):
+                return 'reflink'
+
+            _copy_contents(fsrc, fdst, src_stat.st_size)
+            return 'copy'
+
+
+def sync_directory(directory: PathLike):
+    """Flush the entries of <directory> to disk, such as created or renamed files.
+
+    Within group_commit, flushing is deferred to the end of the group, so each directory is
+    only flushed once.
+    """
+    directory = os.fspath(directory)
+
+    if not _defer(_pending_directories, directory):
+        _fsync_path(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+
+
+@contextmanager
+def group_commit() -> Iterator[None]:
+    """Context in which files and directories are flushed to disk once each, when the
+    outermost group exits, instead of once per write.
+
+    Writes are still atomic within the group, so bulk operations do not lose atomicity, only
+    the point at which they are durable is delayed to the end of the group.
+    """
+    global _group_depth
+
+    with _lock:
+        _group_depth += 1
+
+    try:
+        yield
+    finally:
+        with _lock:
+            _group_depth -= 1
+
+            if _group_depth == 0:
+                files = list(_pending_files)
+                directories = list(_pending_directories)
+                _pending_files.clear()
+                _pending_directories.clear()
+            else:
+                files, directories = [], []
+
+        # Files are flushed before directories, so that new entries point to flushed data
+        for path in files:
+            _fsync_path(path, os.O_RDONLY)
+        for directory in directories:
+            _fsync_path(directory, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+
+
+def _clone(fsrc: BinaryIO, fdst: BinaryIO) -> bool:
+    """Make <fdst> share the data of <fsrc> with the FICLONE ioctl.
+
+    Return True iff the file system supports it.
+    """
+    try:
+        import fcntl
+        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except ImportError:
+        return False
+    except OSError as e:
+        if e.errno in _UNSUPPORTED_ERRNOS:
+            return False
+        raise
+
+
+def _copy_contents(fsrc: BinaryIO, fdst: BinaryIO, size: int):
+    """Copy the <size> bytes of <fsrc> to the empty <fdst>.
+
+    Try copy_file_range and then sendfile, which copy within the kernel, continuing from where
+    the previous method stopped if it is not supported, and fall back to reading and writing.
+    """
+    copied = 0
+
+    for copy_chunk in (_copy_file_range_chunk, _sendfile_chunk):
+        try:
+            while copied < size:
+                count = copy_chunk(fsrc.fileno(), fdst.fileno(), copied,
+                                   min(size - copied, _COPY_CHUNK_SIZE))
+                if count == 0:
+                    return
+                copied += count
+            return
+
+        except AttributeError:
+            # Not available on this platform
+            continue
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+
+    fsrc.seek(copied)
+    fdst.seek(copied)
+    shutil.copyfileobj(fsrc, fdst)
+
+
+def _copy_file_range_chunk(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy at most <count> bytes at <offset> of <src_fd> to the same offset of <dst_fd>."""
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile_chunk(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    """Copy at most <count> bytes at <offset> of <src_fd> to the same offset of <dst_fd>."""
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _defer(pending: Set[str], path: str) -> bool:
+    """Add <path> to <pending> if a group commit is active.
+
+    Return True iff the path was deferred.
+    """
+    with _lock:
+        if _group_depth > 0:
+            pending.add(path)
+            return True
+    return False
+
+
+def _fsync_path(path: str, flags: int):
+    """Flush the file or directory at <path> to disk, if it still exists."""
+    try:
+        fd = os.open(path, flags)
+    except FileNotFoundError:
+        return
+
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,148 @@
+import csv
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, TextIO, Tuple
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.helpers import batch_helper, file_helper, project_helper, scan_helper
+
+# Fields of each imported row, which are also the header of csv files
+IMPORT_FIELDS = ('course_code', 'project_id', 'name', 'due_date', 'open_method')
+
+DEFAULT_OPEN_METHOD = 'open .'
+
+Row = Dict[str, Any]
+
+
+class ImportFileError(Exception):
+    """Exception indicating that the import file cannot be read, with a message explaining why."""
+
+
+class RowResult(NamedTuple):
+    """The result of importing a row.
+
+    === Attributes ===
+    row: the number of the row, starting from 1
+    course_code: the course code of the row, if given
+    project_id: the project id of the row, if given
+    error: the reason the row failed, or None if the project was created
+    """
+    row: int
+    course_code: Optional[str]
+    project_id: Optional[str]
+    error: Optional[str]
+
+
+def read_rows(file: TextIO, file_format: Optional[str] = None) -> List[Row]:
+    """Read the rows from <file>, which is either a csv file with a header of IMPORT_FIELDS,
+    or a json list of objects with IMPORT_FIELDS as keys.
+
+    If <file_format> is not given, it is chosen by the file extension, where files that are not
+    .csv are read as json.
+
+    Raise ImportFileError if the file cannot be parsed.
+    """
+    if file_format is None:
+        file_format = 'csv' if getattr(file, 'name', '').lower().endswith('.csv') else 'json'
+
+    if file_format == 'csv':
+        try:
+            return [dict(row) for row in csv.DictReader(file)]
+        except csv.Error as e:
+            raise ImportFileError(f'Invalid csv: {e}.')
+
+    try:
+        rows = json.load(file)
+    except json.decoder.JSONDecodeError as e:
+        raise ImportFileError(f'Invalid json: {e}.')
+
+    if not isinstance(rows, list):
+        raise ImportFileError('The json file must contain a list of projects.')
+
+    return rows
+
+
+def import_projects(rows: List[Row], default_course_code: Optional[str] = None,
+                    workers: Optional[int] = None) -> List[RowResult]:
+    """Create a project for each of <rows>, and return the result of each row in order.
+
+    Every row is validated before any project is created, and rows that fail are reported
+    without stopping the other rows. Rows without a course code use <default_course_code>.
+    Projects are created concurrently by at most <workers> threads, or the configured number
+    of scan workers if not given.
+    """
+    state = batch_helper.BatchState()
+    results: List[Optional[RowResult]] = [None] * len(rows)
+    valid: List[Tuple[int, str, ProjectSettings]] = []
+
+    # Validate every row first
+    for i, row in enumerate(rows):
+        course_code, project_id = None, None
+
+        try:
+            course_code, settings = _parse_row(row, default_course_code, state)
+            project_id = settings.project_id
+
+            batch_helper.check_new_project(course_code, project_id, settings.name, state)
+            # Reserve the id, so that later rows with the same id fail
+            state.add_project(course_code, project_id)
+
+            valid.append((i, course_code, settings))
+
+        except batch_helper.BatchError as e:
+            results[i] = RowResult(i + 1, course_code, project_id, str(e))
+
+    # Create the valid projects in parallel, flushing each directory to disk only once
+    with file_helper.group_commit():
+        errors = scan_helper.map_ordered(lambda item: _create_project(item[1], item[2]),
+                                         valid, workers)
+
+    for (i, course_code, settings), error in zip(valid, errors):
+        results[i] = RowResult(i + 1, course_code, settings.project_id, error)
+
+    return results
+
+
+def _parse_row(row: Any, default_course_code: Optional[str],
+               state: batch_helper.BatchState) -> Tuple[str, ProjectSettings]:
+    """Parse <row> into a tuple containing (course code, project settings).
+
+    Empty values are treated as not given. Raise BatchError if the row is invalid.
+    """
+    if not isinstance(row, dict):
+        raise batch_helper.BatchError('The row must be an object.')
+
+    # Treat empty csv cells as not given
+    row = {key: value for key, value in row.items() if value not in (None, '')}
+
+    course_code = row.get('course_code', default_course_code)
+    project_id = row.get('project_id')
+
+    if course_code is None:
+        raise batch_helper.BatchError('Missing field "course_code".')
+    if project_id is None:
+        raise batch_helper.BatchError('Missing field "project_id".')
+
+    name = row.get('name', project_id)
+    due_date = batch_helper.parse_due_date(row.get('due_date'), state)
+    open_method = row.get('open_method', DEFAULT_OPEN_METHOD)
+
+    if not all(isinstance(value, str) for value in (course_code, project_id, name, open_method)):
+        raise batch_helper.BatchError('Fields must be strings.')
+
+    # Reject paths such as .. before the row gets any further
+    course_code = course_code.lower()
+    batch_helper.check_course_code(course_code)
+    batch_helper.check_project_id(project_id)
+
+    return course_code, ProjectSettings(name, project_id, due_date, open_method)
+
+
+def _create_project(course_code: str, settings: ProjectSettings) -> Optional[str]:
+    """Create the project with <settings> in course with <course_code>.
+
+    Return the error message if it cannot be created, otherwise None.
+    """
+    try:
+        project_helper.create_project(course_code, settings)
+        return None
+    except OSError as e:
+        return f'Failed to create project: {e.strerror or e}.'
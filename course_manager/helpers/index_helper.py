@@ -0,0 +1,248 @@
+import os
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.helpers import codec_helper, file_helper, io_stats_helper, path_helper
+from course_manager.helpers import project_helper, scan_helper, timing_helper, watch_helper
+
+INDEX_FILE = '.cm_index.json'
+INDEX_VERSION = 2
+
+ProjectEntries = List[Tuple[str, Optional[ProjectSettings]]]
+
+# Whether indexes are kept in memory between calls instead of read from file each time,
+# which is set by long running processes such as the daemon
+_keep_in_memory = False
+_memory_indexes: Dict[str, Dict[str, Any]] = {}
+
+# Courses whose index entries are up to date, since no change to them was reported by a
+# watcher since they were last refreshed, or None if changes are not tracked
+_clean_courses: Optional[Set[str]] = None
+
+
+def keep_in_memory():
+    """Keep indexes in memory after they are first read, instead of reading the file each call.
+
+    The entries are still refreshed from the file system as usual.
+    """
+    global _keep_in_memory
+    _keep_in_memory = True
+
+
+def track_changes():
+    """Trust the changes reported to apply_change_events, instead of checking the file system
+    for changes to courses which were already refreshed.
+
+    Changes must be reported from a watch_helper watcher started before the first refresh.
+    Indexes should be kept in memory, so that the index file cannot change in between.
+    """
+    global _clean_courses
+    _clean_courses = set()
+
+
+def apply_change_events(events: Iterable[watch_helper.ChangeEvent]):
+    """Mark the index entries of courses changed by <events> to be refreshed on next use."""
+    if _clean_courses is None:
+        return
+
+    for event in events:
+        if event.kind == watch_helper.RESCAN:
+            _clean_courses.clear()
+        elif event.kind != watch_helper.TODOS_CHANGED:
+            _clean_courses.discard(event.course_code)
+
+
+def get_projects(course_codes: List[str],
+                 workers: Optional[int] = None) -> Dict[str, ProjectEntries]:
+    """Get the projects of each course in <course_codes>, using the on-disk index.
+
+    Return a dictionary matching each course code to a list of tuples containing
+    (project id, settings), where settings is None if it cannot be read. The courses are in
+    the same order as <course_codes>.
+
+    See iter_projects for how the index is refreshed.
+
+    Precondition: all courses in <course_codes> exist.
+    """
+    return dict(iter_projects(course_codes, workers))
+
+
+def iter_projects(course_codes: List[str],
+                  workers: Optional[int] = None) -> Iterator[Tuple[str, ProjectEntries]]:
+    """Yield the projects of each course in <course_codes>, using the on-disk index.
+
+    Yield tuples containing (course code, projects), in the same order as <course_codes>, as
+    soon as each course is refreshed. Projects are a list of tuples containing
+    (project id, settings), where settings is None if it cannot be read.
+
+    Only the index entries whose course directory or settings file changed since the
+    index was last written are refreshed, or only the courses with reported changes if changes
+    are tracked, and the index is written back if anything changed
+    once the generator is exhausted or closed. Courses are refreshed concurrently by at most
+    <workers> threads, or the configured number of scan workers if not given.
+
+    Precondition: all courses in <course_codes> exist.
+    """
+    index = _read_index()
+    courses = index['courses']
+    changed = False
+
+    refreshed = scan_helper.imap_ordered(
+        lambda course_code: _refresh_course_if_changed(course_code, courses.get(course_code)),
+        course_codes, workers)
+
+    try:
+        for course_code, (entry, entry_changed) in zip(course_codes, refreshed):
+            courses[course_code] = entry
+            changed = changed or entry_changed
+
+            if _clean_courses is not None:
+                _clean_courses.add(course_code)
+
+            with timing_helper.phase(timing_helper.PHASE_DECODE):
+                projects = [(project_id, _settings_from_entry(project))
+                            for project_id, project in entry['projects'].items()]
+
+            yield course_code, projects
+    finally:
+        refreshed.close()
+
+        if changed:
+            _write_index(index)
+
+
+def _refresh_course_if_changed(course_code: str,
+                               entry: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+    """Refresh the index entry of the course with <course_code>, unless changes are tracked and
+    none were reported since it was last refreshed.
+
+    Return a tuple containing (refreshed entry, whether the entry changed).
+    """
+    if entry is not None and not _entry_is_valid(entry):
+        entry = None
+
+    if entry is not None and _clean_courses is not None and course_code in _clean_courses:
+        return entry, False
+
+    with timing_helper.phase(timing_helper.PHASE_SCAN):
+        return _refresh_course(course_code, entry)
+
+
+def _refresh_course(course_code: str,
+                    entry: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+    """Refresh the index entry of the course with <course_code>.
+
+    Return a tuple containing (refreshed entry, whether the entry changed).
+    """
+    io_stats_helper.count('index_helper', io_stats_helper.STATS)
+    course_mtime = os.stat(path_helper.get_path(course_code)).st_mtime_ns
+    changed = False
+
+    if entry is not None and entry['mtime'] == course_mtime:
+        # Directory listing did not change, reuse the indexed project ids
+        old_projects = entry['projects']
+        scanned = [project_helper.ProjectEntry(
+                       project_id, project_helper.stat_project_settings(course_code, project_id))
+                   for project_id in old_projects]
+    else:
+        old_projects = entry['projects'] if entry is not None else {}
+        scanned = project_helper.scan_projects(course_code)
+        changed = True
+
+    projects = {}
+    changed_ids = []
+    for project in scanned:
+        stat = project.settings_stat
+        key = [stat.st_mtime_ns, stat.st_size] if stat is not None else None
+        old_project = old_projects.get(project.project_id)
+
+        if old_project is not None and old_project['key'] == key:
+            projects[project.project_id] = old_project
+        else:
+            projects[project.project_id] = {'key': key, 'settings': None}
+            changed = True
+
+            if key is not None:
+                changed_ids.append(project.project_id)
+
+    # Decode the changed settings files all at once
+    raws = [(project_id, raw) for project_id in changed_ids
+            if (raw := project_helper.read_project_settings_raw(course_code, project_id))
+            is not None]
+    io_stats_helper.count('index_helper', io_stats_helper.JSON_DECODED, len(raws))
+
+    with timing_helper.phase(timing_helper.PHASE_DECODE):
+        decoded = codec_helper.decode_project_settings_many(raw for _, raw in raws)
+
+        for (project_id, _), settings in zip(raws, decoded):
+            if settings is not None:
+                projects[project_id]['settings'] = codec_helper.encode_project_settings_obj(
+                    settings, compact=True)
+
+    return {'mtime': course_mtime, 'projects': projects}, changed
+
+
+def _entry_is_valid(entry: Any) -> bool:
+    """Return True iff <entry> has the fields of a course entry of the index."""
+    return (isinstance(entry, dict) and isinstance(entry.get('mtime'), int)
+            and isinstance(entry.get('projects'), dict)
+            and all(isinstance(project, dict) and 'key' in project and 'settings' in project
+                    for project in entry['projects'].values()))
+
+
+def _settings_from_entry(entry: Dict[str, Any]) -> Optional[ProjectSettings]:
+    """Get the ProjectSettings stored in the project index <entry>, in compact representation."""
+    obj = entry['settings']
+    return codec_helper.decode_project_settings_obj(obj) if obj is not None else None
+
+
+def _read_index() -> Dict[str, Any]:
+    """Read the index from the base directory, or from memory if it is kept in memory.
+
+    Return an empty index if the file does not exist, cannot be parsed, or has another version.
+    Course entries which are corrupt are refreshed as if they were not indexed.
+    """
+    path = str(path_helper.get_path(INDEX_FILE))
+
+    if _keep_in_memory and path in _memory_indexes:
+        return _memory_indexes[path]
+
+    index = {'version': INDEX_VERSION, 'courses': {}}
+
+    try:
+        with open(path, 'r') as f:
+            content = f.read()
+
+        io_stats_helper.count_read('index_helper', content)
+        io_stats_helper.count('index_helper', io_stats_helper.JSON_DECODED)
+
+        with timing_helper.phase(timing_helper.PHASE_DECODE):
+            stored = json.loads(content)
+
+        if (isinstance(stored, dict) and stored.get('version') == INDEX_VERSION
+                and isinstance(stored.get('courses'), dict)):
+            index = stored
+
+    except (FileNotFoundError, json.decoder.JSONDecodeError):
+        pass
+
+    if _keep_in_memory:
+        _memory_indexes[path] = index
+
+    return index
+
+
+def _write_index(index: Dict[str, Any]):
+    """Write the index to the base directory, if the base directory exists.
+
+    The index is replaced atomically but not flushed to disk, since it can be rebuilt.
+    """
+    path = path_helper.get_path(INDEX_FILE)
+
+    if not path.parent.is_dir():
+        return
+
+    content = json.dumps(index)
+
+    io_stats_helper.count_write('index_helper', content)
+    file_helper.write_atomic(path, content, sync=False)
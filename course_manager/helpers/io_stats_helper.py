@@ -0,0 +1,66 @@
+import threading
+from typing import Dict, Union
+
+# Counters of file system work
+DIRS_LISTED = 'dirs_listed'
+STATS = 'stats'
+FILES_OPENED = 'files_opened'
+BYTES_READ = 'bytes_read'
+BYTES_WRITTEN = 'bytes_written'
+JSON_DECODED = 'json_decoded'
+COUNTERS = [DIRS_LISTED, STATS, FILES_OPENED, BYTES_READ, BYTES_WRITTEN, JSON_DECODED]
+
+_enabled = False
+_lock = threading.Lock()
+_counts: Dict[str, Dict[str, int]] = {}
+
+
+def enable():
+    """Enable counting, and reset the counts."""
+    global _enabled
+
+    with _lock:
+        _counts.clear()
+    _enabled = True
+
+
+def get_counts() -> Dict[str, Dict[str, int]]:
+    """Get the counts of each helper, as a dictionary matching the name of the helper to the
+    value of each of its counters which is not zero."""
+    with _lock:
+        return {helper: dict(counts) for helper, counts in _counts.items()}
+
+
+def count(helper: str, counter: str, amount: int = 1):
+    """Add <amount> to <counter> of <helper>, if counting is enabled."""
+    if not _enabled:
+        return
+
+    with _lock:
+        counts = _counts.setdefault(helper, {})
+        counts[counter] = counts.get(counter, 0) + amount
+
+
+def count_read(helper: str, content: Union[str, bytes]):
+    """Count a file opened by <helper> and its <content> read, if counting is enabled.
+
+    Text is counted by the size of its utf-8 encoding.
+    """
+    if _enabled:
+        count(helper, FILES_OPENED)
+        count(helper, BYTES_READ, _get_size(content))
+
+
+def count_write(helper: str, content: Union[str, bytes]):
+    """Count a file opened by <helper> and its <content> written, if counting is enabled.
+
+    Text is counted by the size of its utf-8 encoding.
+    """
+    if _enabled:
+        count(helper, FILES_OPENED)
+        count(helper, BYTES_WRITTEN, _get_size(content))
+
+
+def _get_size(content: Union[str, bytes]) -> int:
+    """Return the size of <content> in bytes."""
+    return len(content.encode()) if isinstance(content, str) else len(content)
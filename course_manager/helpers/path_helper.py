@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Union
 from pathlib import Path
 import course_manager.helpers.config_helper as config_helper
@@ -11,8 +12,13 @@ def get_home_path(*paths: Union[str, Path]) -> Path:
     return Path(HOME_PATH, *paths)
 
 
+@lru_cache(maxsize=None)
 def get_base_path() -> Path:
-    """Get the path to the base directory of courses."""
+    """Get the path to the base directory of courses.
+
+    The path is resolved once per process. Call get_base_path.cache_clear() after the base
+    directory config changes.
+    """
     return Path(HOME_PATH, config_helper.get_config(config_helper.KEY_BASE_DIRECTORY))
 
 
@@ -32,4 +38,5 @@ def rename_base_directory(prev: str, new: str) -> bool:
         return False
 
     Path(HOME_PATH, prev).rename(Path(HOME_PATH, new))
+    get_base_path.cache_clear()
     return True
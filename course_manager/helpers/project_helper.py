@@ -1,13 +1,31 @@
+import os
 import re
 import shutil
-from typing import Optional, List
+from typing import NamedTuple, Optional, List, Union
 from course_manager.models.project_settings import ProjectSettings
-from course_manager.helpers import path_helper
+from course_manager.helpers import codec_helper, config_helper, file_helper, path_helper
+from course_manager.helpers import io_stats_helper, scan_helper, template_helper, timing_helper
 from course_manager.constants import MAX_PROJECT_ID_CHARS, MAX_PROJECT_NAME_CHARS
 
 PROJECT_SETTINGS_FILE = '.cm_project_settings'
 
 
+class ProjectEntry(NamedTuple):
+    """A project found while scanning a course directory.
+
+    === Attributes ===
+    project_id: the id of the project
+    settings_stat: the stat of the project's settings file, or None if it does not exist
+    """
+    project_id: str
+    settings_stat: Optional[os.stat_result]
+
+    @property
+    def has_settings(self) -> bool:
+        """Return True iff the project has a settings file."""
+        return self.settings_stat is not None
+
+
 def project_id_is_valid(project_id: str) -> bool:
     """Return True iff the <project_id> is a valid project id.
 
@@ -26,6 +44,7 @@ def project_name_is_valid(project_name: str) -> bool:
 
 def project_exists(course_code: str, project_id: str) -> bool:
     """Check whether the project with <project_id> exist in course with <course_code>."""
+    io_stats_helper.count('project_helper', io_stats_helper.STATS)
     return path_helper.get_path(course_code, project_id).is_dir()
 
 
@@ -34,27 +53,64 @@ def get_project_ids(course_code: str) -> List[str]:
 
     Precondition: the course with <course_code> exists.
     """
-    project_ids = []
+    return [entry.name for entry in scan_helper.list_directories(path_helper.get_path(course_code),
+                                                                 helper='project_helper')]
+
+
+def scan_projects(course_code: str) -> List[ProjectEntry]:
+    """Return the list of projects of the course, along with the stat of their settings files.
+
+    The course directory is listed only once.
+
+    Precondition: the course with <course_code> exists.
+    """
+    with timing_helper.phase(timing_helper.PHASE_SCAN):
+        return [ProjectEntry(entry.name, _stat_settings_file(entry.path))
+                for entry in scan_helper.list_directories(path_helper.get_path(course_code),
+                                                          helper='project_helper')]
+
+
+def stat_project_settings(course_code: str, project_id: str) -> Optional[os.stat_result]:
+    """Return the stat of the project's settings file, or None if it does not exist."""
+    return _stat_settings_file(path_helper.get_path(course_code, project_id))
+
+
+def _stat_settings_file(project_path: Union[str, os.PathLike]) -> Optional[os.stat_result]:
+    """Return the stat of the settings file in the project directory <project_path>.
 
-    for path in path_helper.get_path(course_code).iterdir():
-        if path.is_dir():
-            project_ids.append(path.name)
+    Return None if the settings file does not exist.
+    """
+    io_stats_helper.count('project_helper', io_stats_helper.STATS)
 
-    return project_ids
+    try:
+        return os.stat(os.path.join(project_path, PROJECT_SETTINGS_FILE))
+    except FileNotFoundError:
+        return None
 
 
-def create_project(course_code: str, settings: ProjectSettings):
+def create_project(course_code: str, settings: ProjectSettings,
+                   template_path: Optional[path_helper.Path] = None, link: bool = False,
+                   workers: Optional[int] = None):
     """Create a new project with given course code and settings.
 
+    If <template_path> is given, the project starts with the contents of that template, see
+    template_helper.instantiate_template for <link> and <workers>. A settings file in the
+    template is replaced by the project's settings.
+
     Preconditions:
     - the course with <course_code> exists
     - the project id is valid and unique from other projects of the same course
+    - <template_path> is an existing template directory if given
     """
     project_dir = path_helper.get_path(course_code, settings.project_id)
     project_dir.mkdir(parents=True)
+    file_helper.sync_directory(project_dir.parent)
+
+    if template_path is not None:
+        template_helper.instantiate_template(template_path, project_dir, link=link,
+                                             exclude={PROJECT_SETTINGS_FILE}, workers=workers)
 
     write_project_settings(course_code, settings)
-    # TODO: other initializations, according to template?
 
 
 def delete_project(course_code: str, project_id: str):
@@ -68,16 +124,20 @@ def delete_project(course_code: str, project_id: str):
 
 
 def write_project_settings(course_code: str, settings: ProjectSettings):
-    """Write project settings to file.
+    """Write project settings to file atomically.
+
+    The compact representation is written if the compact_settings config is set.
 
     Preconditions:
     - the course with <course_code> exists
     - the project directory exists
     """
     settings_path = path_helper.get_path(course_code, settings.project_id, PROJECT_SETTINGS_FILE)
+    compact = config_helper.get_config_bool(config_helper.KEY_COMPACT_SETTINGS)
+    content = codec_helper.encode_project_settings(settings, compact)
 
-    with open(str(settings_path), 'w') as f:
-        f.write(settings.to_json())
+    io_stats_helper.count_write('project_helper', content)
+    file_helper.write_atomic(settings_path, content)
 
 
 def read_project_settings(course_code: str, project_id: str) -> Optional[ProjectSettings]:
@@ -89,12 +149,40 @@ def read_project_settings(course_code: str, project_id: str) -> Optional[Project
     - the course with <course_code> exists
     - the project directory exists
     """
-    settings_path = path_helper.get_path(course_code, project_id, PROJECT_SETTINGS_FILE)
+    content = read_project_settings_raw(course_code, project_id)
+    if content is None:
+        return None
 
-    try:
-        with open(str(settings_path), 'r') as f:
-            content = f.read()
-            return ProjectSettings.from_json(content)
+    io_stats_helper.count('project_helper', io_stats_helper.JSON_DECODED)
 
-    except FileNotFoundError:
-        return None
+    with timing_helper.phase(timing_helper.PHASE_DECODE):
+        return codec_helper.decode_project_settings(content)
+
+
+def read_project_settings_raw(course_code: str, project_id: str) -> Optional[str]:
+    """Read the undecoded content of the settings file of project with id.
+
+    Return None if the settings file does not exist.
+
+    Preconditions:
+    - the course with <course_code> exists
+    - the project directory exists
+    """
+    return read_settings_file_raw(path_helper.get_path(course_code, project_id))
+
+
+def read_settings_file_raw(project_path: Union[str, os.PathLike]) -> Optional[str]:
+    """Read the undecoded content of the settings file in the project directory <project_path>.
+
+    Return None if the settings file does not exist.
+    """
+    with timing_helper.phase(timing_helper.PHASE_SCAN):
+        try:
+            with open(os.path.join(project_path, PROJECT_SETTINGS_FILE), 'r') as f:
+                content = f.read()
+
+        except FileNotFoundError:
+            return None
+
+    io_stats_helper.count_read('project_helper', content)
+    return content
@@ -1,5 +1,5 @@
 import re
-from typing import cast, Optional
+from typing import Callable, Dict, Iterable, List, Match, Optional
 from datetime import datetime, date, time
 from dateutil.relativedelta import relativedelta, MO, TU, WE, TH, FR, SA, SU
 
@@ -15,37 +15,63 @@ WEEKDAY_NAMES = [
 ]
 WEEKDAYS_PATTERN = '|'.join('|'.join(names) for names in WEEKDAY_NAMES)
 
-# Date specifier patterns
-TODAY_PATTERN = re.compile('^today')
-TOMORROW_PATTERN = re.compile('^(tmr|tomorrow)')
-NEXT_DATE_PATTERN = re.compile('^next (week|month|year)')
-NEXT_WEEKDAY_PATTERN = re.compile(f'^next ({WEEKDAYS_PATTERN})')
-IN_X_DATE_PATTERN = re.compile(r'^in (\d+|a) (day|week|month|year)s?')
-DATE_SPECIFIER_PATTERNS = [TODAY_PATTERN, TOMORROW_PATTERN, NEXT_DATE_PATTERN,
-                           NEXT_WEEKDAY_PATTERN, IN_X_DATE_PATTERN]
-
-# Time specifier patterns
-MORNING_PATTERN = re.compile(' morning$')
-NOON_PATTERN = re.compile(' noon$')
-AFTERNOON_PATTERN = re.compile(' afternoon$')
-EVENING_PATTERN = re.compile(' evening$')
-NIGHT_PATTERN = re.compile(' night$')
-MIDNIGHT_PATTERN = re.compile(' midnight$')
-HH_MM_PATTERN = re.compile(r' (\d{1,2})(:(\d{2}))?\s*?(am|pm)?$')
-NOW_PATTERN = re.compile(' (now|same time)$')
-IN_X_TIME_PATTERN = re.compile(r' in (\d+) (min|minute|hr|hour)s?$')
-TIME_SPECIFIER_PATTERNS = [MORNING_PATTERN, NOON_PATTERN, AFTERNOON_PATTERN,
-                           EVENING_PATTERN, NIGHT_PATTERN, MIDNIGHT_PATTERN,
-                           HH_MM_PATTERN, NOW_PATTERN, IN_X_TIME_PATTERN]
-
-
-def parse(phrase: str) -> Optional[datetime]:
+# Date specifier patterns, each with a named group that is dispatched to a handler.
+# They are matched at the start of the phrase, in this order
+DATE_SPECIFIER_PATTERNS = [
+    r'(?P<today>today)',
+    r'(?P<tomorrow>tmr|tomorrow)',
+    r'(?P<next_date>next (?P<next_date_unit>week|month|year))',
+    rf'(?P<next_weekday>next (?P<next_weekday_name>{WEEKDAYS_PATTERN}))',
+    r'(?P<in_x_date>in (?P<in_x_date_n>\d+|a) (?P<in_x_date_unit>day|week|month|year)s?)',
+]
+
+# Time specifier patterns, each with a named group that is dispatched to a handler.
+# They are matched at the end of the phrase after a space, in this order
+TIME_SPECIFIER_PATTERNS = [
+    r'(?P<time_of_day>morning|noon|afternoon|evening|night|midnight)',
+    r'(?P<hh_mm>(?P<hour>\d{1,2})(:(?P<minute>\d{2}))?\s*?(?P<meridiem>am|pm)?)',
+    r'(?P<now>now|same time)',
+    r'(?P<in_x_time>in (?P<in_x_time_n>\d+) (?P<in_x_time_unit>min|minute|hr|hour)s?)',
+]
+
+# A single pattern matching the date specifier at the start and the time specifier at the end
+PHRASE_PATTERN = re.compile(
+    rf'^(?:{"|".join(DATE_SPECIFIER_PATTERNS)})?.*?(?: (?:{"|".join(TIME_SPECIFIER_PATTERNS)}))?$',
+    re.DOTALL)
+
+TIMES_OF_DAY = {
+    'morning': time(9),
+    'noon': time(12),
+    'afternoon': time(15),
+    'evening': time(18),
+    'night': time(21),
+    'midnight': time(0),
+}
+
+# Keyword arguments of relativedelta for each unit. Note the keyword must have s at the end,
+# if not, it will set that component to n instead of incrementing
+DELTA_UNITS = {
+    'min': 'minutes',
+    'minute': 'minutes',
+    'hr': 'hours',
+    'hour': 'hours',
+    'day': 'days',
+    'week': 'weeks',
+    'month': 'months',
+    'year': 'years',
+}
+
+
+def parse(phrase: str, now: Optional[datetime] = None) -> Optional[datetime]:
     """Try to parse date from readable, common phrases.
     A phrase consists of a date specifier followed by a time specifier.
     At least one must be specified.
     If date specifier is not given, default to today's date.
     If time specifier is not given, default to 00:00.
 
+    Relative phrases are resolved against <now>, which defaults to the current time.
+    Return None if the phrase cannot be parsed, or if its time specifier is not a valid time.
+
     Date specifiers:
     - today, tmr, tomorrow
     - next week, month, year, or a weekday (mon/monday, etc.)
@@ -53,108 +79,140 @@ def parse(phrase: str) -> Optional[datetime]:
 
     Time specifiers:
     - morning, noon, afternoon, evening, night, midnight
-    - HH:mm, or simply H or HH (for hour)
+    - HH:mm, or simply H or HH (for hour), with an optional am/pm where 12am is midnight
     - now / same time
     - in X min/minute/hr/hour, where X is a number
     """
-    phrase = phrase.strip().lower()
+    if now is None:
+        now = datetime.now()
+
+    match = PHRASE_PATTERN.match(phrase.strip().lower())
 
     # Parse date and time from phrase
-    d = _parse_readable_date_specifier(phrase)
-    t = _parse_readable_time_specifier(phrase)
+    d = _dispatch(match, DATE_HANDLERS, now)
+    t = _dispatch(match, TIME_HANDLERS, now)
+
+    if t is None and any(match.group(group) is not None for group in TIME_HANDLERS):
+        # The time specifier is out of range, such as 25 or 7:99, so reject the whole phrase
+        return None
 
     if d is None and t is None:
         # Must have at least date or time specified
         return None
 
-    return datetime.combine(d or date.today(),
+    return datetime.combine(d or now.date(),
                             t or time(0, 0, 0))
 
 
-def _parse_readable_date_specifier(phrase: str) -> Optional[date]:
-    """Parse the date specifier of phrase."""
-    for pattern in DATE_SPECIFIER_PATTERNS:
-        if (match := pattern.search(phrase)) is not None:
-            if pattern == TODAY_PATTERN:
-                return date.today()
-            elif pattern == TOMORROW_PATTERN:
-                return date.today() + relativedelta(days=+1)
-            elif pattern == NEXT_DATE_PATTERN:
-                specifier = match.group(1)
-                start_date = date.today()
-
-                # Set start date to start of month/year if necessary
-                if specifier == 'month':
-                    start_date = start_date.replace(day=1)
-                elif specifier == 'year':
-                    start_date = start_date.replace(day=1, month=1)
-
-                return start_date + _get_delta(1, specifier)
-
-            elif pattern == NEXT_WEEKDAY_PATTERN:
-                weekday = _get_weekday(match.group(1))
-                # Get the next weekday that is not today
-                return date.today() + relativedelta(days=+1,
-                                                    weekday=weekdays[weekday](1))
-            elif pattern == IN_X_DATE_PATTERN:
-                n = int(match.group(1))
-                specifier = match.group(2)
-                return date.today() + _get_delta(n, specifier)
+def parse_many(phrases: Iterable[str], now: Optional[datetime] = None) -> List[Optional[datetime]]:
+    """Parse each of <phrases> with parse, and return the results in the same order.
+
+    All phrases are resolved against the same <now>, which defaults to the current time,
+    and repeated phrases are only parsed once.
+    """
+    if now is None:
+        now = datetime.now()
+
+    parsed: Dict[str, Optional[datetime]] = {}
+    results = []
+
+    for phrase in phrases:
+        if phrase not in parsed:
+            parsed[phrase] = parse(phrase, now)
+        results.append(parsed[phrase])
+
+    return results
+
+
+def _dispatch(match: Match, handlers: Dict[str, Callable[[Match, datetime], Optional[object]]],
+              now: datetime) -> Optional[object]:
+    """Call the handler of the first group in <handlers> that is matched by <match>.
+
+    Return None if none of the groups are matched.
+    """
+    for group, handler in handlers.items():
+        if match.group(group) is not None:
+            return handler(match, now)
     return None
 
 
-def _parse_readable_time_specifier(phrase: str) -> Optional[time]:
-    """Parse the time specifier of phrase."""
-    for pattern in TIME_SPECIFIER_PATTERNS:
-        if (match := pattern.search(phrase)) is not None:
-            if pattern == MORNING_PATTERN:
-                return time(9)
-            elif pattern == NOON_PATTERN:
-                return time(12)
-            elif pattern == AFTERNOON_PATTERN:
-                return time(15)
-            elif pattern == EVENING_PATTERN:
-                return time(18)
-            elif pattern == NIGHT_PATTERN:
-                return time(21)
-            elif pattern == MIDNIGHT_PATTERN:
-                return time(0)
-            elif pattern == HH_MM_PATTERN:
-                hour = int(match.group(1))
-                minute = int(match.group(3) or '0')
-
-                if match.group(4) == 'pm' and hour < 12:
-                    # Note 12 pm hour is also 12
-                    return time(hour + 12, minute)
-
-                return time(hour, minute)
-
-            elif pattern == NOW_PATTERN:
-                return datetime.now().time()
-            elif pattern == IN_X_TIME_PATTERN:
-                n = int(match.group(1))
-                specifier = match.group(2)
-                return cast(datetime, datetime.now() + _get_delta(n, specifier)).time()
+def _handle_next_date(match: Match, now: datetime) -> date:
+    """Handle the date specifier "next week/month/year"."""
+    specifier = match.group('next_date_unit')
+    start_date = now.date()
+
+    # Set start date to start of month/year if necessary
+    if specifier == 'month':
+        start_date = start_date.replace(day=1)
+    elif specifier == 'year':
+        start_date = start_date.replace(day=1, month=1)
+
+    return start_date + _get_delta(1, specifier)
+
+
+def _handle_next_weekday(match: Match, now: datetime) -> date:
+    """Handle the date specifier "next <weekday>"."""
+    weekday = _get_weekday(match.group('next_weekday_name'))
+    # Get the next weekday that is not today
+    return now.date() + relativedelta(days=+1, weekday=weekdays[weekday](1))
+
+
+def _handle_in_x_date(match: Match, now: datetime) -> date:
+    """Handle the date specifier "in X day/week/month/year"."""
+    n = match.group('in_x_date_n')
+    return now.date() + _get_delta(1 if n == 'a' else int(n), match.group('in_x_date_unit'))
+
+
+def _handle_hh_mm(match: Match, now: datetime) -> Optional[time]:
+    """Handle the time specifier "HH:mm", with an optional am/pm.
+
+    Return None if it is not a valid time.
+    """
+    hour = int(match.group('hour'))
+    minute = int(match.group('minute') or '0')
+    meridiem = match.group('meridiem')
+
+    if meridiem == 'pm' and hour < 12:
+        # Note 12 pm hour is also 12
+        hour += 12
+    elif meridiem == 'am' and hour == 12:
+        hour = 0
+
+    try:
+        return time(hour, minute)
+    except ValueError:
+        return None
+
+
+def _handle_in_x_time(match: Match, now: datetime) -> time:
+    """Handle the time specifier "in X min/minute/hr/hour"."""
+    n = int(match.group('in_x_time_n'))
+    return (now + _get_delta(n, match.group('in_x_time_unit'))).time()
+
+
+# Handlers of each date specifier group, which return the date of the phrase
+DATE_HANDLERS = {
+    'today': lambda match, now: now.date(),
+    'tomorrow': lambda match, now: now.date() + relativedelta(days=+1),
+    'next_date': _handle_next_date,
+    'next_weekday': _handle_next_weekday,
+    'in_x_date': _handle_in_x_date,
+}
+
+# Handlers of each time specifier group, which return the time of the phrase
+TIME_HANDLERS = {
+    'time_of_day': lambda match, now: TIMES_OF_DAY[match.group('time_of_day')],
+    'hh_mm': _handle_hh_mm,
+    'now': lambda match, now: now.time(),
+    'in_x_time': _handle_in_x_time,
+}
 
 
 def _get_delta(n: int, specifier: str) -> relativedelta:
     """Return the time delta representing n times specifiers amount of time."""
-    # Note: the keyword argument passed into `relativedelta` is important to have s at the end
-    # If not, it will set that component to n instead of incrementing
-    if specifier == 'min' or specifier == 'minute':
-        return relativedelta(minutes=n)
-    elif specifier == 'hr' or specifier == 'hour':
-        return relativedelta(hours=n)
-    elif specifier == 'day':
-        return relativedelta(days=n)
-    elif specifier == 'week':
-        return relativedelta(weeks=n)
-    elif specifier == 'month':
-        return relativedelta(months=n)
-    elif specifier == 'year':
-        return relativedelta(years=n)
-    else:
-        return relativedelta()
+    if specifier in DELTA_UNITS:
+        return relativedelta(**{DELTA_UNITS[specifier]: n})
+    return relativedelta()
 
 
 def _get_weekday(weekday_str: str) -> int:
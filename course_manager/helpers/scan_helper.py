@@ -0,0 +1,88 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, TypeVar, Union
+from course_manager.helpers import config_helper, io_stats_helper, timing_helper
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def get_scan_workers() -> int:
+    """Get the number of workers used to scan courses, from the config.
+
+    Return 1 if the configured value is not a positive integer.
+    """
+    try:
+        return max(1, int(config_helper.get_config(config_helper.KEY_SCAN_WORKERS)))
+    except ValueError:
+        return 1
+
+
+def map_ordered(func: Callable[[T], R], items: Iterable[T],
+                workers: Optional[int] = None) -> List[R]:
+    """Apply <func> to each of <items> and return the results in the same order as <items>.
+
+    With more than one worker, the calls are made concurrently on a thread pool with at most
+    <workers> threads. If <workers> is not given, use the configured number of scan workers.
+    """
+    return list(imap_ordered(func, items, workers))
+
+
+def imap_ordered(func: Callable[[T], R], items: Iterable[T],
+                 workers: Optional[int] = None) -> Iterator[R]:
+    """Lazily apply <func> to each of <items>, yielding results in the same order as <items>.
+
+    Each result is yielded as soon as it and all results before it are ready.
+    With more than one worker, the calls are made concurrently on a thread pool with at most
+    <workers> threads. If <workers> is not given, use the configured number of scan workers.
+    """
+    items = list(items)
+
+    if workers is None:
+        workers = get_scan_workers()
+
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # Do not run the remaining calls if the generator is closed early
+            for future in futures:
+                future.cancel()
+
+
+def list_entries(path: Union[str, os.PathLike],
+                 helper: str = 'scan_helper') -> List[os.DirEntry]:
+    """Return the entries of the files and subdirectories of <path>.
+
+    Return an empty list if <path> is not an existing directory. The listing is counted
+    towards <helper> in the I/O stats.
+    """
+    io_stats_helper.count(helper, io_stats_helper.DIRS_LISTED)
+
+    with timing_helper.phase(timing_helper.PHASE_SCAN):
+        try:
+            with os.scandir(path) as it:
+                return list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+
+def list_directories(path: Union[str, os.PathLike],
+                     helper: str = 'scan_helper') -> List[os.DirEntry]:
+    """Return the entries of the subdirectories of <path>.
+
+    The entries come from os.scandir, so checking their type uses the file type already
+    returned by the listing instead of an extra stat per child.
+
+    Return an empty list if <path> is not an existing directory. The listing is counted
+    towards <helper> in the I/O stats.
+    """
+    return [entry for entry in list_entries(path, helper) if entry.is_dir()]
@@ -1,21 +1,72 @@
-from typing import List
-from course_manager.helpers import project_helper
+import heapq
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+from course_manager.helpers import index_helper, timing_helper
+from course_manager.models.project_settings import ProjectSettings
 from course_manager.models.schedule import Schedule
 
 
-def get_schedule(course_codes: List[str]) -> Schedule:
+def get_schedule(course_codes: List[str], workers: Optional[int] = None) -> Schedule:
     """Get a Schedule object containing projects of courses in <course_codes>.
 
+    Project settings are read through the project index, so only changed projects are read.
+    Courses are scanned by at most <workers> threads, or the configured number if not given.
+
     Precondition: all courses in <course_code> exists.
     """
     schedule = Schedule()
 
-    # For each course, add all projects into schedule
-    for course_code in course_codes:
-        for project_id in project_helper.get_project_ids(course_code):
-            settings = project_helper.read_project_settings(course_code, project_id)
+    # For each course, add all projects into schedule. The loop is timed once rather than per
+    # project, and the scanning it waits on is timed by its own nested phases
+    with timing_helper.phase(timing_helper.PHASE_MODEL):
+        for course_code, settings in iter_projects(course_codes, workers):
+            schedule.add_project(course_code, settings)
 
-            if settings is not None:
-                schedule.add_project(course_code, settings)
+    return schedule
+
+
+def get_schedule_range(course_codes: List[str], start: Optional[datetime] = None,
+                       end: Optional[datetime] = None, limit: Optional[int] = None,
+                       workers: Optional[int] = None) -> Schedule:
+    """Get a Schedule object containing the projects of courses in <course_codes> that are due
+    at or after <start> and before <end>, where either bound is optional.
+
+    If <limit> is given, only keep the <limit> projects that are due first. They are selected
+    with a heap while scanning, so at most <limit> projects are held at once.
+
+    Precondition: all courses in <course_code> exists.
+    """
+    projects = ((course_code, settings)
+                for course_code, settings in iter_projects(course_codes, workers)
+                if settings.due_date is not None
+                and (start is None or settings.due_date >= start)
+                and (end is None or settings.due_date < end))
+
+    if limit is not None:
+        # Break ties by order of scanning, which is the order of a full schedule
+        with timing_helper.phase(timing_helper.PHASE_MODEL):
+            numbered = heapq.nsmallest(limit, enumerate(projects),
+                                       key=lambda item: (item[1][1].due_date, item[0]))
+        projects = (project for _, project in numbered)
+
+    schedule = Schedule()
+    with timing_helper.phase(timing_helper.PHASE_MODEL):
+        for course_code, settings in projects:
+            schedule.add_project(course_code, settings)
 
     return schedule
+
+
+def iter_projects(course_codes: List[str],
+                  workers: Optional[int] = None) -> Iterator[Tuple[str, ProjectSettings]]:
+    """Yield tuples containing (course code, settings) for the projects of <course_codes>.
+
+    Projects are yielded as each course is scanned, and those whose settings cannot be read
+    are skipped.
+
+    Precondition: all courses in <course_code> exists.
+    """
+    for course_code, projects in index_helper.iter_projects(course_codes, workers):
+        for _, settings in projects:
+            if settings is not None:
+                yield course_code, settings
@@ -1,7 +1,9 @@
+import os
 import re
 import shutil
-from typing import Optional
-from course_manager.helpers import path_helper
+from collections import Counter
+from typing import Collection, Optional, Union
+from course_manager.helpers import file_helper, path_helper, scan_helper
 
 TEMPLATES_DIRECTORY = 'templates'
 
@@ -52,6 +54,66 @@ def delete_template(template: str, course_code: Optional[str] = None):
     shutil.rmtree(get_template_path(template, course_code))
 
 
+def find_template(template: str, course_code: Optional[str] = None) -> Optional[path_helper.Path]:
+    """Get the path to the template to use for a project.
+
+    If <course_code> is given, the course's template is preferred over the template with the
+    same name outside of courses. Return None if neither exists.
+
+    Precondition: <template> is a valid template name
+    """
+    if course_code is not None and template_exists(template, course_code):
+        return get_template_path(template, course_code)
+    if template_exists(template):
+        return get_template_path(template)
+    return None
+
+
+def instantiate_template(template_path: Union[str, os.PathLike],
+                         destination: Union[str, os.PathLike], link: bool = False,
+                         exclude: Collection[str] = (), workers: Optional[int] = None) -> Counter:
+    """Copy the contents of the template at <template_path> into the directory <destination>.
+
+    Files are copied concurrently by at most <workers> threads, or the configured number of
+    scan workers if not given. If <link> is True, files are hard linked to the template where
+    possible, so they must not be modified in place. Otherwise they are reflinked or copied,
+    see file_helper.copy_file. Symbolic links are recreated as they are. Top level entries with
+    names in <exclude> are skipped.
+
+    Return a Counter of the number of files copied with each method.
+
+    Preconditions:
+    - <template_path> is an existing directory
+    - <destination> is an existing directory without entries in common with the template
+    """
+    template_path = os.fspath(template_path)
+    destination = os.fspath(destination)
+    files = []
+
+    # Create the directories first, so that the files can be copied in any order
+    for root, dirnames, filenames in os.walk(template_path):
+        target = os.path.normpath(os.path.join(destination, os.path.relpath(root, template_path)))
+        if root == template_path:
+            dirnames[:] = [name for name in dirnames if name not in exclude]
+            filenames = [name for name in filenames if name not in exclude]
+        else:
+            os.mkdir(target)
+
+        for name in dirnames + filenames:
+            source = os.path.join(root, name)
+            if os.path.islink(source):
+                os.symlink(os.readlink(source), os.path.join(target, name))
+            elif name in filenames:
+                files.append((source, os.path.join(target, name)))
+
+        # Symbolic links to directories are not followed, as they are already recreated
+        dirnames[:] = [name for name in dirnames if not os.path.islink(os.path.join(root, name))]
+
+    methods = scan_helper.map_ordered(
+        lambda item: file_helper.copy_file(item[0], item[1], link=link), files, workers)
+    return Counter(methods)
+
+
 def get_template_path(template: str, course_code: Optional[str] = None) -> path_helper.Path:
     """Get the path to template."""
     if course_code is not None:
@@ -0,0 +1,131 @@
+import time
+import threading
+from contextlib import nullcontext
+from typing import ContextManager, Dict, List, Optional
+
+# Phases of a command which are timed when profiling
+PHASE_SCAN = 'scan'
+PHASE_DECODE = 'decode'
+PHASE_MODEL = 'model'
+PHASE_RENDER = 'render'
+PHASES = [PHASE_SCAN, PHASE_DECODE, PHASE_MODEL, PHASE_RENDER]
+
+_enabled = False
+_lock = threading.Lock()
+_totals: Dict[str, float] = {}
+# Stack of the timers running in each thread, so that nested phases are not counted twice
+_local = threading.local()
+
+_profiler = None
+_profile_path: Optional[str] = None
+_profile_start: Optional[float] = None
+
+_NO_TIMER = nullcontext()
+
+
+class _PhaseTimer:
+    """Adds the time spent in its context to the total of a phase, excluding the time spent in
+    nested phases.
+
+    === Attributes ===
+    name: the name of the phase
+    start: the time the context was entered
+    nested: the time spent in nested phases
+    """
+    name: str
+    start: float
+    nested: float
+
+    def __init__(self, name: str):
+        self.name = name
+        self.nested = 0.0
+
+    def __enter__(self):
+        _get_stack().append(self)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stack = _get_stack()
+        stack.pop()
+
+        if stack:
+            stack[-1].nested += elapsed
+
+        with _lock:
+            _totals[self.name] = _totals.get(self.name, 0.0) + elapsed - self.nested
+
+
+def phase(name: str) -> ContextManager:
+    """Return a context which adds the time spent in it to the phase <name>, if timing is
+    enabled.
+
+    Time spent in a nested phase only counts towards the nested phase. When timing is disabled,
+    the context does nothing.
+
+    Phases are timed in each thread and summed over all threads, so phases running in worker
+    threads overlap with the phase of the thread waiting on them. The time a thread spends
+    waiting on workers counts towards its own phase. With more than one worker, the totals can
+    therefore add up to more than the elapsed time.
+    """
+    return _PhaseTimer(name) if _enabled else _NO_TIMER
+
+
+def enable():
+    """Enable timing of phases, and reset the timings."""
+    global _enabled
+
+    with _lock:
+        _totals.clear()
+    _enabled = True
+
+
+def get_timings() -> Dict[str, float]:
+    """Get the total seconds spent in each phase, summed over all threads."""
+    with _lock:
+        return dict(_totals)
+
+
+def start_profile(path: str):
+    """Start profiling the running command with cProfile, and enable timing of phases.
+
+    The profile is written to <path> by stop_profile.
+    """
+    global _profiler, _profile_path, _profile_start
+    import cProfile
+
+    enable()
+    _profile_path = path
+    _profile_start = time.perf_counter()
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+
+
+def stop_profile() -> float:
+    """Stop profiling, and write the pstats dump to the path given to start_profile.
+
+    Return the number of seconds since profiling started.
+
+    Precondition: profiling was started.
+    """
+    global _profiler
+
+    _profiler.disable()
+    elapsed = time.perf_counter() - _profile_start
+    _profiler.dump_stats(_profile_path)
+    _profiler = None
+
+    return elapsed
+
+
+def get_profile_path() -> Optional[str]:
+    """Get the path of the pstats dump of the last profile started."""
+    return _profile_path
+
+
+def _get_stack() -> List[_PhaseTimer]:
+    """Get the stack of running timers of the current thread."""
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
@@ -1,11 +1,29 @@
 import json
-from typing import List, Tuple, Union
+import os
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from course_manager.models.todo_item import TodoItem
-from course_manager.helpers import path_helper
+from course_manager.helpers import codec_helper, file_helper, io_stats_helper, path_helper
+from course_manager.helpers import timing_helper
 
 TodoScope = Union[None, str, Tuple[str, str]]
 TODO_FILENAME = '.cm_todos.json'
 
+# Operations recorded in the todo journal
+OP_ADD = 'add'
+OP_REMOVE = 'remove'
+OP_MARK = 'mark'
+
+# The journal is checked for compaction each time an append grows it past another multiple of
+# this many bytes, and compacted if more than half of its records no longer describe a live item
+COMPACTION_THRESHOLD = 64 * 1024
+
+Record = Dict[str, Any]
+
+
+class TodoFileError(Exception):
+    """Exception indicating that a todo file cannot be changed, with a message explaining why."""
+
 
 def get_todo_items(scope: TodoScope) -> List[TodoItem]:
     """Get the todo items from <scope>.
@@ -16,13 +34,15 @@ def get_todo_items(scope: TodoScope) -> List[TodoItem]:
 
 
 def add_todo_item(scope: TodoScope, item: TodoItem):
-    """Add a todo item to <scope>.
+    """Add a todo item to <scope>, and set its item id.
+
+    Only a single record is appended to the journal of <scope>. Raise TodoFileError if the file
+    of <scope> is in the old format and cannot be parsed.
 
     Precondition: <scope> is a valid scope.
     """
-    items = _read_todo_items(scope)
-    items.append(item)
-    _write_todo_items(scope, items)
+    item.item_id = _new_item_id()
+    _append_records(scope, [_add_record(item)])
 
 
 def remove_todo_item(scope: TodoScope, index: int):
@@ -32,43 +52,269 @@ def remove_todo_item(scope: TodoScope, index: int):
     - <scope> is a valid scope
     - <index> is less than the number of todo items in <scope>
     """
-    items = _read_todo_items(scope)
-    items.pop(index)
-    _write_todo_items(scope, items)
+    remove_todo_items(scope, [_read_todo_items(scope)[index].item_id])
+
+
+def mark_todo_item(scope: TodoScope, index: int, is_complete: bool = True):
+    """Mark the todo item at <index> from <scope> as complete or incomplete.
+
+    Preconditions:
+    - <scope> is a valid scope
+    - <index> is less than the number of todo items in <scope>
+    """
+    mark_todo_items(scope, [_read_todo_items(scope)[index].item_id], is_complete)
+
+
+def remove_todo_items(scope: TodoScope, item_ids: Iterable[str]):
+    """Remove the todo items with <item_ids> from <scope>.
+
+    All removals are appended to the journal of <scope> at once, without reading it. Since
+    items are identified by their item ids, removing an item does not change which items the
+    other ids refer to. Ids of items which no longer exist are ignored. Raise TodoFileError as
+    in add_todo_item.
+
+    Precondition: <scope> is a valid scope.
+    """
+    records = [{'op': OP_REMOVE, 'id': item_id} for item_id in item_ids]
+
+    if records:
+        _append_records(scope, records)
+
+
+def mark_todo_items(scope: TodoScope, item_ids: Iterable[str], is_complete: bool = True):
+    """Mark the todo items with <item_ids> from <scope> as complete or incomplete.
+
+    All marks are appended to the journal of <scope> at once, as in remove_todo_items. Raise
+    TodoFileError as in add_todo_item.
+
+    Precondition: <scope> is a valid scope.
+    """
+    records = [{'op': OP_MARK, 'id': item_id, 'is_complete': is_complete}
+               for item_id in item_ids]
+
+    if records:
+        _append_records(scope, records)
 
 
 def _read_todo_items(scope: TodoScope) -> List[TodoItem]:
-    """Read the list of todo items from <scope>.
+    """Read the list of todo items from <scope>, by folding the records of its journal.
+
+    Files in the old format, a json array of todo items, are read as well. A file in the old
+    format which cannot be parsed has no items.
 
     Precondition: <scope> is a valid scope.
     """
-    path = _get_file_path(scope)
+    content = _read_content(get_todo_file_path(scope))
 
-    try:
-        with open(path, 'r') as f:
-            content = f.read()
-            # Return the list of parsed todo items, where items that cannot be parsed are discarded
-            return [item for obj in json.loads(content)
-                    if (item := TodoItem.from_json(obj)) is not None]
+    with timing_helper.phase(timing_helper.PHASE_DECODE):
+        if _is_legacy_format(content):
+            return _parse_legacy_items(content) or []
 
-    except FileNotFoundError:
-        return []
+        return _fold_records(_parse_records(content))
+
+
+def _read_content(path: str) -> str:
+    """Return the content of the todo file at <path>, or '' if it does not exist."""
+    with timing_helper.phase(timing_helper.PHASE_SCAN):
+        try:
+            with open(path, 'r') as f:
+                content = f.read()
+        except FileNotFoundError:
+            return ''
+
+    io_stats_helper.count_read('todo_helper', content)
+    return content
 
 
 def _write_todo_items(scope: TodoScope, items: List[TodoItem]):
-    """Write the todo items in <items> to <scope>.
+    """Write the todo items in <items> to <scope>, replacing its journal with one record per item.
 
     Precondition: <scope> is a valid scope.
     """
-    path = _get_file_path(scope)
+    path = get_todo_file_path(scope)
+    content = _serialize_records(_add_record(item) for item in items)
+
+    io_stats_helper.count_write('todo_helper', content)
+    file_helper.write_atomic(path, content)
+
+
+def _append_records(scope: TodoScope, records: List[Record]):
+    """Append <records> to the journal of <scope>.
+
+    If the file of <scope> is in the old format, it is migrated to a journal first. A file in
+    the old format which cannot be parsed is left as is, and TodoFileError is raised.
+
+    If the append grows the journal past another multiple of COMPACTION_THRESHOLD and most of
+    its records are obsolete, it is compacted into one record per item.
+
+    Precondition: <scope> is a valid scope.
+    """
+    path = get_todo_file_path(scope)
+
+    if _file_is_legacy_format(path):
+        # Migrate, keeping the item ids that were given when reading the old format
+        items = _parse_legacy_items(_read_content(path))
+
+        if items is None:
+            raise TodoFileError(f'The todo file "{path}" cannot be read, so it was not changed.')
+
+        _write_todo_items(scope, items)
+
+    size = _get_file_size(path)
+
+    # Start on a new line in case the last write was interrupted
+    prefix = '' if _ends_with_newline(path) else '\n'
+    content = prefix + _serialize_records(records)
+
+    io_stats_helper.count_write('todo_helper', content)
+    file_helper.append_durable(path, content)
+
+    new_size = size + len(content.encode())
+    if new_size // COMPACTION_THRESHOLD > size // COMPACTION_THRESHOLD:
+        _compact(scope)
+
+
+def _compact(scope: TodoScope):
+    """Compact the journal of <scope> into one record per item, if most of its records are
+    obsolete.
+
+    Precondition: <scope> is a valid scope, and its file is not in the old format.
+    """
+    records = _parse_records(_read_content(get_todo_file_path(scope)))
+    items = _fold_records(records)
+
+    if len(records) > 2 * len(items):
+        _write_todo_items(scope, items)
+
+
+def _get_file_size(path: str) -> int:
+    """Return the size in bytes of the file at <path>, or 0 if it does not exist."""
+    io_stats_helper.count('todo_helper', io_stats_helper.STATS)
+
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+def _ends_with_newline(path: str) -> bool:
+    """Return True iff the file at <path> is empty, does not exist, or ends with a newline."""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, 2)
+            if f.tell() == 0:
+                return True
+
+            f.seek(-1, 2)
+            last = f.read(1)
+
+        io_stats_helper.count_read('todo_helper', last)
+        return last == b'\n'
+
+    except FileNotFoundError:
+        return True
+
+
+def _add_record(item: TodoItem) -> Record:
+    """Return the journal record that adds <item>."""
+    return {'op': OP_ADD, 'id': item.item_id, 'item': item.to_json()}
+
+
+def _serialize_records(records: Iterable[Record]) -> str:
+    """Return the journal representation of <records>, one json object per line."""
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+
+def _parse_records(content: str) -> List[Record]:
+    """Parse the journal <content> into a list of records.
+
+    Lines that cannot be parsed, such as a partially written last line, are discarded.
+    """
+    records = []
+
+    for line in content.splitlines():
+        io_stats_helper.count('todo_helper', io_stats_helper.JSON_DECODED)
+
+        try:
+            record = json.loads(line)
+        except json.decoder.JSONDecodeError:
+            continue
+
+        if isinstance(record, dict) and 'op' in record and 'id' in record:
+            records.append(record)
+
+    return records
+
+
+def _fold_records(records: List[Record]) -> List[TodoItem]:
+    """Apply the journal <records> in order, and return the resulting todo items.
+
+    Items are in the order they were added. Records that cannot be applied are discarded.
+    """
+    items: Dict[str, TodoItem] = {}
+
+    for record in records:
+        op, item_id = record['op'], record['id']
+
+        if op == OP_ADD:
+            if (item := TodoItem.from_json(record.get('item', {}))) is not None:
+                item.item_id = item_id
+                items[item_id] = item
+        elif op == OP_REMOVE:
+            items.pop(item_id, None)
+        elif op == OP_MARK and item_id in items:
+            items[item_id].is_complete = bool(record.get('is_complete', True))
+
+    return list(items.values())
+
+
+def _is_legacy_format(content: str) -> bool:
+    """Return True iff <content> is in the old format, a json array of todo items."""
+    return content.lstrip().startswith('[')
+
+
+def _file_is_legacy_format(path: str) -> bool:
+    """Return True iff the file at <path> exists and is in the old format.
+
+    Only the start of the file is read.
+    """
+    try:
+        with open(path, 'r') as f:
+            start = f.read(64)
+    except FileNotFoundError:
+        return False
+
+    io_stats_helper.count_read('todo_helper', start)
+    return _is_legacy_format(start)
+
+
+def _parse_legacy_items(content: str) -> Optional[List[TodoItem]]:
+    """Parse the todo items from <content> in the old format, or return None if <content>
+    cannot be parsed.
+
+    Items are given their index in the array as item id, so the ids are the same every time
+    the file is read. Items that cannot be parsed are discarded.
+    """
+    try:
+        objs = json.loads(content)
+    except json.decoder.JSONDecodeError:
+        return None
+
+    items = []
+    for i, item in enumerate(codec_helper.decode_todo_items(objs)):
+        if item is not None:
+            item.item_id = str(i)
+            items.append(item)
+
+    return items
 
-    json_str = json.dumps([item.to_json() for item in items])
 
-    with open(path, 'w') as f:
-        f.write(json_str)
+def _new_item_id() -> str:
+    """Return a new unique todo item id."""
+    return uuid.uuid4().hex[:16]
 
 
-def _get_file_path(scope: TodoScope) -> str:
+def get_todo_file_path(scope: TodoScope) -> str:
     """Get the path string to the todo json file given <scope>."""
     if scope is None:
         return str(path_helper.get_path(TODO_FILENAME))
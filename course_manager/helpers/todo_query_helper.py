@@ -0,0 +1,279 @@
+import os
+import json
+import heapq
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from course_manager.models.todo_item import TodoItem
+from course_manager.helpers import course_helper, date_helper, file_helper, io_stats_helper
+from course_manager.helpers import path_helper, project_helper, scan_helper, timing_helper
+from course_manager.helpers import todo_helper
+
+# Summaries of the todo files of every scope, used to skip files that cannot match a query
+SUMMARY_FILE = '.cm_todo_summaries.json'
+SUMMARY_VERSION = 1
+
+SORT_DUE = 'due'
+SORT_PRIORITY = 'priority'
+SORT_SCOPE = 'scope'
+SORT_KEYS = [SORT_DUE, SORT_PRIORITY, SORT_SCOPE]
+
+
+class TodoFilter(NamedTuple):
+    """The conditions a todo item must meet to be listed.
+
+    === Attributes ===
+    due_before: if given, only items due before this date
+    min_priority: if given, only items with at least this priority
+    incomplete: whether to only include incomplete items
+    course_codes: if given, only items of scopes in these courses, which excludes the
+    todo items for all courses
+    """
+    due_before: Optional[datetime] = None
+    min_priority: Optional[int] = None
+    incomplete: bool = False
+    course_codes: Optional[List[str]] = None
+
+
+class TodoMatch(NamedTuple):
+    """A todo item matching a query.
+
+    === Attributes ===
+    scope: the scope of the item
+    index: the index of the item in its scope, as used by todo_helper
+    item: the todo item
+    """
+    scope: todo_helper.TodoScope
+    index: int
+    item: TodoItem
+
+
+def item_matches(item: TodoItem, todo_filter: TodoFilter) -> bool:
+    """Return True iff <item> meets the conditions of <todo_filter>."""
+    return ((not todo_filter.incomplete or not item.is_complete)
+            and (todo_filter.min_priority is None or item.priority >= todo_filter.min_priority)
+            and (todo_filter.due_before is None
+                 or (item.due_date is not None and item.due_date < todo_filter.due_before)))
+
+
+def list_todo_items(todo_filter: TodoFilter, sort: str = SORT_SCOPE, top: Optional[int] = None,
+                    workers: Optional[int] = None) -> List[TodoMatch]:
+    """Get the todo items of all scopes matching <todo_filter>, sorted by <sort>.
+
+    Items are sorted by due date, by priority, or in the order of their scopes, which is the
+    global scope followed by each course and its projects. Ties keep the order of scopes. If
+    <top> is given, only the first <top> items are selected, with a heap instead of sorting
+    all items.
+
+    Scopes are read concurrently by at most <workers> threads, or the configured number of scan
+    workers if not given. Files whose summary shows that none of their items can match are
+    not read.
+
+    Precondition: <sort> is in SORT_KEYS, and all courses in <todo_filter> exist.
+    """
+    matches = iter_todo_items(todo_filter, workers)
+    key = _get_sort_key(sort)
+
+    with timing_helper.phase(timing_helper.PHASE_MODEL):
+        if top is not None:
+            numbered = heapq.nsmallest(top, enumerate(matches),
+                                       key=lambda numbered_match: (key(numbered_match[1]),
+                                                                   numbered_match[0]))
+            return [match for _, match in numbered]
+
+        # Sorting is stable, which keeps the order of scopes for ties
+        return sorted(matches, key=key) if sort != SORT_SCOPE else list(matches)
+
+
+def iter_todo_items(todo_filter: TodoFilter,
+                    workers: Optional[int] = None) -> Iterator[TodoMatch]:
+    """Yield the todo items of all scopes matching <todo_filter>, in the order of scopes.
+
+    See list_todo_items for how scopes are read.
+
+    Precondition: all courses in <todo_filter> exist.
+    """
+    summaries = _read_summaries()
+    scopes = _get_scopes(todo_filter.course_codes)
+    changed = False
+
+    results = scan_helper.imap_ordered(
+        lambda scope: _read_scope(scope, todo_filter, summaries['scopes'].get(_scope_key(scope))),
+        scopes, workers)
+
+    try:
+        for scope, (matches, summary) in zip(scopes, results):
+            key = _scope_key(scope)
+
+            if summary is None:
+                changed = changed or summaries['scopes'].pop(key, None) is not None
+            elif summaries['scopes'].get(key) != summary:
+                summaries['scopes'][key] = summary
+                changed = True
+
+            yield from matches
+    finally:
+        results.close()
+
+        if changed:
+            _write_summaries(summaries)
+
+
+def get_scope_label(scope: todo_helper.TodoScope) -> str:
+    """Get the label of <scope> shown to users."""
+    if scope is None:
+        return 'all'
+    elif isinstance(scope, str):
+        return scope
+    return '/'.join(scope)
+
+
+def _get_scopes(course_codes: Optional[List[str]]) -> List[todo_helper.TodoScope]:
+    """Get the scopes of <course_codes> and their projects, or of all courses and the scope
+    for all courses if not given."""
+    scopes: List[todo_helper.TodoScope] = []
+
+    if course_codes is None:
+        scopes.append(None)
+
+    for course_code in course_helper.get_course_codes():
+        if course_codes is None or course_code in course_codes:
+            scopes.append(course_code)
+            scopes.extend((course_code, project_id)
+                          for project_id in sorted(project_helper.get_project_ids(course_code)))
+
+    return scopes
+
+
+def _read_scope(scope: todo_helper.TodoScope, todo_filter: TodoFilter,
+                summary: Optional[Dict[str, Any]]
+                ) -> Tuple[List[TodoMatch], Optional[Dict[str, Any]]]:
+    """Read the todo items of <scope> matching <todo_filter>.
+
+    The file is not read if its <summary> is up to date and shows that no item can match.
+    Return a tuple containing (matches, up to date summary), where the summary is None if the
+    scope has no todo file.
+    """
+    io_stats_helper.count('todo_query_helper', io_stats_helper.STATS)
+
+    try:
+        with timing_helper.phase(timing_helper.PHASE_SCAN):
+            stat = os.stat(todo_helper.get_todo_file_path(scope))
+    except FileNotFoundError:
+        return [], None
+
+    key = [stat.st_mtime_ns, stat.st_size]
+
+    if summary is not None and summary['key'] == key and not _summary_may_match(summary,
+                                                                                 todo_filter):
+        return [], summary
+
+    items = todo_helper.get_todo_items(scope)
+    matches = [TodoMatch(scope, i, item) for i, item in enumerate(items)
+               if item_matches(item, todo_filter)]
+
+    return matches, _summarize(key, items)
+
+
+def _summarize(key: List[int], items: List[TodoItem]) -> Dict[str, Any]:
+    """Return the summary of the todo file with stat <key> containing <items>."""
+    due_dates = [item.due_date for item in items if item.due_date is not None]
+
+    return {
+        'key': key,
+        'incomplete': sum(1 for item in items if not item.is_complete),
+        'max_priority': max((item.priority for item in items), default=None),
+        'min_due_date': date_helper.str_from_date(min(due_dates)) if due_dates else None,
+    }
+
+
+def _summary_may_match(summary: Dict[str, Any], todo_filter: TodoFilter) -> bool:
+    """Return False if no item of the todo file with <summary> can match <todo_filter>."""
+    if summary['max_priority'] is None:
+        # The file has no items
+        return False
+    if todo_filter.incomplete and summary['incomplete'] == 0:
+        return False
+    if todo_filter.min_priority is not None and summary['max_priority'] < todo_filter.min_priority:
+        return False
+    if todo_filter.due_before is not None:
+        if summary['min_due_date'] is None:
+            return False
+
+        # A date which cannot be parsed may match, so that the file is read
+        min_due_date = date_helper.date_from_str(summary['min_due_date'])
+        return min_due_date is None or min_due_date < todo_filter.due_before
+    return True
+
+
+def _summary_is_valid(summary: Any) -> bool:
+    """Return True iff <summary> has the fields of a todo file summary."""
+    return (isinstance(summary, dict) and isinstance(summary.get('key'), list)
+            and len(summary['key']) == 2
+            and all(isinstance(value, int) for value in summary['key'])
+            and isinstance(summary.get('incomplete'), int)
+            and isinstance(summary.get('max_priority'), (int, type(None)))
+            and isinstance(summary.get('min_due_date'), (str, type(None))))
+
+
+def _get_sort_key(sort: str) -> Callable[[TodoMatch], Any]:
+    """Get the key function sorting todo matches by <sort>."""
+    far_future = datetime.max
+
+    if sort == SORT_DUE:
+        return lambda match: (match.item.due_date or far_future, -match.item.priority)
+    elif sort == SORT_PRIORITY:
+        return lambda match: (-match.item.priority, match.item.due_date or far_future)
+    return lambda match: 0
+
+
+def _scope_key(scope: todo_helper.TodoScope) -> str:
+    """Get the key of <scope> in the summaries."""
+    if scope is None:
+        return ''
+    elif isinstance(scope, str):
+        return scope
+    return '/'.join(scope)
+
+
+def _read_summaries() -> Dict[str, Any]:
+    """Read the todo summaries from the base directory.
+
+    Return empty summaries if the file does not exist, cannot be parsed, or has another version.
+    Summaries which are corrupt are dropped, so that their files are read.
+    """
+    summaries = {'version': SUMMARY_VERSION, 'scopes': {}}
+
+    try:
+        with open(path_helper.get_path(SUMMARY_FILE), 'r') as f:
+            content = f.read()
+
+        io_stats_helper.count_read('todo_query_helper', content)
+        io_stats_helper.count('todo_query_helper', io_stats_helper.JSON_DECODED)
+
+        with timing_helper.phase(timing_helper.PHASE_DECODE):
+            stored = json.loads(content)
+
+        if stored.get('version') == SUMMARY_VERSION and isinstance(stored.get('scopes'), dict):
+            summaries['scopes'] = {key: summary for key, summary in stored['scopes'].items()
+                                   if _summary_is_valid(summary)}
+
+    except (FileNotFoundError, json.decoder.JSONDecodeError, AttributeError):
+        pass
+
+    return summaries
+
+
+def _write_summaries(summaries: Dict[str, Any]):
+    """Write the todo summaries to the base directory, if the base directory exists.
+
+    The summaries are replaced atomically but not flushed to disk, since they can be rebuilt.
+    """
+    path = path_helper.get_path(SUMMARY_FILE)
+
+    if not path.parent.is_dir():
+        return
+
+    content = json.dumps(summaries)
+
+    io_stats_helper.count_write('todo_query_helper', content)
+    file_helper.write_atomic(path, content, sync=False)
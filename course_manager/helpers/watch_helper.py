@@ -0,0 +1,410 @@
+import os
+import abc
+import time
+import errno
+import select
+import struct
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+from course_manager.helpers import course_helper, path_helper, project_helper, scan_helper
+from course_manager.helpers import template_helper, todo_helper
+
+PathLike = Union[str, os.PathLike]
+
+# Kinds of change events
+COURSE_ADDED = 'course_added'
+COURSE_REMOVED = 'course_removed'
+PROJECT_ADDED = 'project_added'
+PROJECT_REMOVED = 'project_removed'
+SETTINGS_CHANGED = 'settings_changed'
+TODOS_CHANGED = 'todos_changed'
+# Changes may have been missed, so everything must be rescanned
+RESCAN = 'rescan'
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_ONLYDIR)
+
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+# A watched directory, as a tuple of (course code, project id), where both are None for the
+# base directory and the project id is None for a course directory
+Location = Tuple[Optional[str], Optional[str]]
+
+
+class ChangeEvent(NamedTuple):
+    """A change to the course tree.
+
+    === Attributes ===
+    kind: the kind of change, one of the kinds defined in this module
+    course_code: the code of the changed course, or None for the base directory, such as for
+    the global todo list or a rescan
+    project_id: the id of the changed project, or None for changes to a course or the base
+    directory
+    """
+    kind: str
+    course_code: Optional[str] = None
+    project_id: Optional[str] = None
+
+
+class Watcher(abc.ABC):
+    """Tracks changes to courses, projects, and todo lists under a base directory.
+
+    Archived courses and templates are not tracked.
+    """
+
+    @abc.abstractmethod
+    def read_events(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        """Return the changes since the last call, in the order they happened.
+
+        Wait at most <timeout> seconds for changes if there are none yet, or until there are
+        changes if <timeout> is None. Duplicate events are reported once.
+        """
+
+    def close(self):
+        """Stop tracking changes."""
+
+    def __enter__(self) -> 'Watcher':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class InotifyWatcher(Watcher):
+    """A watcher using inotify, which is notified of changes by the Linux kernel.
+
+    The base directory, each course directory, and each project directory are watched, and
+    watches are added as courses and projects are created.
+
+    === Private attributes ===
+    _libc: the C library providing the inotify functions
+    _base_path: the path to the watched base directory
+    _fd: the inotify file descriptor
+    _locations: the watched location of each watch descriptor
+    """
+    _base_path: str
+    _fd: int
+    _locations: Dict[int, Location]
+
+    def __init__(self, base_path: PathLike):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._locations = {}
+        self._base_path = os.fspath(base_path)
+
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            _raise_errno(ctypes.get_errno())
+
+        try:
+            self._add_watch(self._base_path, (None, None))
+            for entry in scan_helper.list_directories(self._base_path):
+                if _is_course_name(entry.name):
+                    self._add_course(entry.name)
+        except BaseException:
+            self.close()
+            raise
+
+    def read_events(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+
+            events.extend(self._parse_events(data))
+
+        return _unique(events)
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _parse_events(self, data: bytes) -> Iterable[ChangeEvent]:
+        """Yield the change events from the raw inotify events in <data>."""
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                yield ChangeEvent(RESCAN)
+            elif mask & IN_IGNORED:
+                # The directory was removed, the kernel removes its watch
+                self._locations.pop(wd, None)
+            elif wd in self._locations:
+                yield from self._classify(self._locations[wd], name, mask)
+
+    def _classify(self, location: Location, name: str, mask: int) -> Iterable[ChangeEvent]:
+        """Yield the change events of a change to entry <name> of the watched <location>."""
+        course_code, project_id = location
+        is_dir = bool(mask & IN_ISDIR)
+        added = bool(mask & (IN_CREATE | IN_MOVED_TO))
+        removed = bool(mask & (IN_DELETE | IN_MOVED_FROM))
+
+        if not is_dir:
+            # A created file is also reported when it is closed after writing
+            if not mask & IN_CREATE:
+                yield from _classify_file(location, name)
+        elif course_code is None and _is_course_name(name):
+            if added:
+                yield ChangeEvent(COURSE_ADDED, name)
+                # Projects may have been created before the watch was added
+                yield from self._add_course(name)
+            elif removed:
+                yield ChangeEvent(COURSE_REMOVED, name)
+                # A moved directory keeps its watches, which no longer match their location
+                self._remove_watches(name)
+        elif project_id is None and course_code is not None and _is_project_name(name):
+            if added:
+                yield ChangeEvent(PROJECT_ADDED, course_code, name)
+                self._add_watch(os.path.join(self._base_path, course_code, name),
+                                (course_code, name))
+            elif removed:
+                yield ChangeEvent(PROJECT_REMOVED, course_code, name)
+                self._remove_watches(course_code, name)
+
+    def _add_course(self, course_code: str) -> List[ChangeEvent]:
+        """Watch the course with <course_code> and its projects.
+
+        Return the events of the projects found in the course.
+        """
+        course_path = os.path.join(self._base_path, course_code)
+        if not self._add_watch(course_path, (course_code, None)):
+            return []
+
+        events = []
+        for entry in scan_helper.list_directories(course_path):
+            if _is_project_name(entry.name):
+                self._add_watch(entry.path, (course_code, entry.name))
+                events.append(ChangeEvent(PROJECT_ADDED, course_code, entry.name))
+        return events
+
+    def _add_watch(self, path: PathLike, location: Location) -> bool:
+        """Watch the directory at <path>, which is <location>.
+
+        Return False if the directory no longer exists.
+        """
+        import ctypes
+
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return False
+            _raise_errno(err)
+
+        self._locations[wd] = location
+        return True
+
+    def _remove_watches(self, course_code: str, project_id: Optional[str] = None):
+        """Stop watching the course with <course_code>, or only its project with <project_id>
+        if given."""
+        for wd, (watched_course, watched_project) in list(self._locations.items()):
+            if (watched_course == course_code
+                    and (project_id is None or watched_project == project_id)):
+                # Fails harmlessly if the kernel already removed the watch
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._locations[wd]
+
+
+class PollingWatcher(Watcher):
+    """A watcher which compares the modification times of the course tree every interval.
+
+    Directories are listed again only when their modification time changed, but the settings
+    and todo files are checked every time.
+
+    === Private attributes ===
+    _base_path: the path to the watched base directory
+    _interval: the number of seconds between checks when waiting for changes
+    _listings: the modification time and sorted subdirectories of each watched location
+    _files: the key of each watched file by its location and name, as a tuple of
+    (modification time, size)
+    """
+    _base_path: str
+    _interval: float
+    _listings: Dict[Location, Tuple[int, List[str]]]
+    _files: Dict[Tuple[Location, str], Tuple[int, int]]
+
+    def __init__(self, base_path: PathLike, interval: float = DEFAULT_POLL_INTERVAL):
+        self._base_path = os.fspath(base_path)
+        self._interval = interval
+        self._listings = {}
+        self._files = {}
+        self._poll()
+
+    def read_events(self, timeout: Optional[float] = None) -> List[ChangeEvent]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            events = self._poll()
+            if events:
+                return _unique(events)
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return []
+
+            delay = self._interval
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def _poll(self) -> List[ChangeEvent]:
+        """Check the course tree once, and return the changes since the last check."""
+        events = []
+        listings = {}
+        files = {}
+
+        def check_files(location: Location, path: str, names: Iterable[str]):
+            for name in names:
+                key = _stat_key(os.path.join(path, name))
+                if key is not None:
+                    files[(location, name)] = key
+                if key != self._files.get((location, name)):
+                    events.extend(_classify_file(location, name))
+
+        courses = self._list((None, None), self._base_path, listings)
+        check_files((None, None), self._base_path, [todo_helper.TODO_FILENAME])
+        events.extend(_diff((None, None), self._listings.get((None, None)), courses))
+
+        for course_code in courses:
+            course_path = os.path.join(self._base_path, course_code)
+            projects = self._list((course_code, None), course_path, listings)
+            check_files((course_code, None), course_path, [todo_helper.TODO_FILENAME])
+            events.extend(_diff((course_code, None), self._listings.get((course_code, None)),
+                                projects))
+
+            for project_id in projects:
+                check_files((course_code, project_id), os.path.join(course_path, project_id),
+                            [project_helper.PROJECT_SETTINGS_FILE, todo_helper.TODO_FILENAME])
+
+        self._listings = listings
+        self._files = files
+        return events
+
+    def _list(self, location: Location, path: str,
+              listings: Dict[Location, Tuple[int, List[str]]]) -> List[str]:
+        """Return the sorted course or project names in the directory <path> at <location>.
+
+        The previous listing is reused if the directory did not change, and the listing is
+        stored in <listings>.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        previous = self._listings.get(location)
+        if previous is not None and previous[0] == mtime:
+            names = previous[1]
+        else:
+            is_valid = _is_course_name if location[0] is None else _is_project_name
+            names = sorted(entry.name for entry in scan_helper.list_directories(path)
+                           if is_valid(entry.name))
+
+        listings[location] = (mtime, names)
+        return names
+
+
+def open_watcher(base_path: Optional[PathLike] = None, poll: bool = False,
+                 interval: float = DEFAULT_POLL_INTERVAL) -> Watcher:
+    """Start tracking changes under <base_path>, or the base directory if not given.
+
+    Use inotify where available, unless <poll> is True, and poll every <interval> seconds
+    otherwise.
+
+    Precondition: <base_path> is an existing directory.
+    """
+    if base_path is None:
+        base_path = path_helper.get_base_path()
+
+    if not poll:
+        try:
+            return InotifyWatcher(base_path)
+        except (OSError, AttributeError):
+            # Not Linux, or the limit of inotify instances or watches is reached
+            pass
+
+    return PollingWatcher(base_path, interval)
+
+
+def _classify_file(location: Location, name: str) -> List[ChangeEvent]:
+    """Return the change events of a change to the file <name> in <location>."""
+    course_code, project_id = location
+
+    if name == todo_helper.TODO_FILENAME:
+        return [ChangeEvent(TODOS_CHANGED, course_code, project_id)]
+    elif name == project_helper.PROJECT_SETTINGS_FILE and project_id is not None:
+        return [ChangeEvent(SETTINGS_CHANGED, course_code, project_id)]
+    return []
+
+
+def _diff(location: Location, previous: Optional[Tuple[int, List[str]]],
+          names: List[str]) -> List[ChangeEvent]:
+    """Return the events of the courses or projects of <location> added or removed since
+    the <previous> listing."""
+    course_code = location[0]
+    old_names: Set[str] = set(previous[1]) if previous is not None else set()
+    added = [name for name in names if name not in old_names]
+    removed = sorted(old_names - set(names))
+
+    if course_code is None:
+        return ([ChangeEvent(COURSE_ADDED, name) for name in added]
+                + [ChangeEvent(COURSE_REMOVED, name) for name in removed])
+
+    return ([ChangeEvent(PROJECT_ADDED, course_code, name) for name in added]
+            + [ChangeEvent(PROJECT_REMOVED, course_code, name) for name in removed])
+
+
+def _is_course_name(name: str) -> bool:
+    """Return True iff the directory <name> in the base directory is a course."""
+    return name != course_helper.ARCHIVED_DIRECTORY and course_helper.course_code_is_valid(name)
+
+
+def _is_project_name(name: str) -> bool:
+    """Return True iff the directory <name> in a course directory is a project."""
+    return name != template_helper.TEMPLATES_DIRECTORY and not name.startswith('.')
+
+
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    """Return the (modification time, size) of the file at <path>, or None if it does not
+    exist."""
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+    except FileNotFoundError:
+        return None
+
+
+def _unique(events: Iterable[ChangeEvent]) -> List[ChangeEvent]:
+    """Return <events> without duplicates, keeping the first occurrence of each."""
+    return list(dict.fromkeys(events))
+
+
+def _raise_errno(err: int):
+    """Raise the OSError with error number <err>."""
+    raise OSError(err, os.strerror(err))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 import json
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
 from course_manager.helpers import date_helper
 
@@ -27,8 +27,17 @@ class ProjectSettings:
         Return None if the string is invalid.
         """
         try:
-            obj = json.loads(json_str)
+            return ProjectSettings.from_obj(json.loads(json_str))
+        except json.decoder.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def from_obj(obj: Dict[str, Any]) -> Optional[ProjectSettings]:
+        """Parse a decoded json object into ProjectSettings.
 
+        Return None if the object is invalid.
+        """
+        try:
             try:
                 due_date = date_helper.date_from_str(obj['due_date'])
             except KeyError:
@@ -41,11 +50,15 @@ class ProjectSettings:
 
             return ProjectSettings(obj['name'], obj['project_id'], due_date, open_method)
 
-        except (json.decoder.JSONDecodeError, KeyError):
+        except (KeyError, TypeError):
             return None
 
     def to_json(self) -> str:
         """Convert to json string representation."""
+        return json.dumps(self.to_obj())
+
+    def to_obj(self) -> Dict[str, Any]:
+        """Convert to json object representation."""
         obj = {
             'name': self.name,
             'project_id': self.project_id,
@@ -57,4 +70,4 @@ class ProjectSettings:
         if self.open_method is not None:
             obj['open_method'] = self.open_method
 
-        return json.dumps(obj)
+        return obj
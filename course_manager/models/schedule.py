@@ -1,30 +1,94 @@
-from dataclasses import dataclass
-from typing import Tuple, List, Optional, Dict
-from course_manager.helpers import date_helper
+import sys
+from bisect import bisect_left
+from datetime import datetime, date
+from typing import Tuple, List, Optional
 from course_manager.models.project_settings import ProjectSettings
 
+ScheduledProjects = List[Tuple[str, List['ScheduleProject']]]
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
 
-@dataclass
 class ScheduleProject:
+    """A project in a schedule.
+
+    The due date is stored as an integer sort key, and only formatted when it is read.
+
+    === Attributes ===
+    project_id: the id of the project
+    name: the name of the project
+    course_code: the code of the project's course, which is interned
+    sort_key: the ordinal of the due date times SECONDS_PER_DAY plus the seconds of the due
+    time, or None if the project is unscheduled
+    """
+    __slots__ = ('project_id', 'name', 'course_code', 'sort_key')
+
     project_id: str
     name: str
     course_code: str
-    due_time: Optional[str] = None
+    sort_key: Optional[int]
+
+    def __init__(self, project_id: str, name: str, course_code: str,
+                 sort_key: Optional[int] = None):
+        self.project_id = project_id
+        self.name = name
+        self.course_code = sys.intern(course_code)
+        self.sort_key = sort_key
+
+    @property
+    def due_date(self) -> Optional[str]:
+        """The due date of the project, in the format YYYY-MM-DD."""
+        if self.sort_key is None:
+            return None
+        return date.fromordinal(self.sort_key // SECONDS_PER_DAY).isoformat()
+
+    @property
+    def due_time(self) -> Optional[str]:
+        """The due time of the project, in the format HH:MM."""
+        if self.sort_key is None:
+            return None
+        hours, seconds = divmod(self.sort_key % SECONDS_PER_DAY, 60 * 60)
+        return f'{hours:02}:{seconds // 60:02}'
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, ScheduleProject)
+                and all(getattr(self, attr) == getattr(other, attr) for attr in self.__slots__))
+
+    def __repr__(self) -> str:
+        return (f'ScheduleProject(project_id={self.project_id!r}, name={self.name!r}, '
+                f'course_code={self.course_code!r}, due_time={self.due_time!r})')
+
+
+def get_sort_key(due_date: datetime) -> int:
+    """Return the sort key of <due_date>, to the second."""
+    return (due_date.toordinal() * SECONDS_PER_DAY
+            + (due_date.hour * 60 + due_date.minute) * 60 + due_date.second)
 
 
 class Schedule:
     """Represents a schedule containing projects.
 
+    Scheduled projects are sorted by due date once, when the schedule is first queried after
+    projects were added, so that building a schedule of n projects takes O(n log n) time and
+    ranges of the schedule can be queried without sorting the whole schedule.
+
     === Private attributes ===
-    _schedule: dictionary matching date to a list of unsorted projects on that date
+    _sort_keys: sorted list of the sort keys of scheduled projects, when _is_sorted is True
+    _projects: list of scheduled projects, where the sort key of _projects[i] is _sort_keys[i]
+    when _is_sorted is True
     _unscheduled: a list of unscheduled projects
+    _is_sorted: whether _projects is sorted, and _sort_keys is up to date
     """
-    _schedule: Dict[str, List[ScheduleProject]]
+    _sort_keys: List[int]
+    _projects: List[ScheduleProject]
     _unscheduled: List[ScheduleProject]
+    _is_sorted: bool
 
     def __init__(self):
-        self._schedule = {}
+        self._sort_keys = []
+        self._projects = []
         self._unscheduled = []
+        self._is_sorted = True
 
     def add_project(self, course_code: str, project_settings: ProjectSettings):
         """Add project into schedule."""
@@ -33,22 +97,12 @@ class Schedule:
             self._unscheduled.append(ScheduleProject(project_settings.project_id,
                                                      project_settings.name, course_code, None))
         else:
-            # Get date and time string
-            date = date_helper.str_from_date(project_settings.due_date,
-                                             date_helper.DATE_FORMAT_DATE)
-            time = date_helper.str_from_date(project_settings.due_date,
-                                             date_helper.DATE_FORMAT_TIME)
-
-            # Create new list if needed
-            if date not in self._schedule:
-                self._schedule[date] = []
-
-            # Add project to schedule at the date
-            self._schedule[date].append(ScheduleProject(project_settings.project_id,
-                                                        project_settings.name, course_code, time))
-
-    def get_schedule(self) -> Tuple[List[Tuple[str, List[ScheduleProject]]],
-                                    List[ScheduleProject]]:
+            self._projects.append(ScheduleProject(project_settings.project_id,
+                                                  project_settings.name, course_code,
+                                                  get_sort_key(project_settings.due_date)))
+            self._is_sorted = False
+
+    def get_schedule(self) -> Tuple[ScheduledProjects, List[ScheduleProject]]:
         """Get a tuple containing (scheduled, unscheduled) where:
 
         scheduled: a sorted list of tuples containing (date, projects) where projects
@@ -56,14 +110,72 @@ class Schedule:
 
         unscheduled: a list of unscheduled projects
         """
-        sorted_schedule = []
+        self._sort()
+        return self._group_by_date(0, len(self._projects)), self._unscheduled
+
+    def range(self, start: Optional[datetime] = None,
+              end: Optional[datetime] = None) -> ScheduledProjects:
+        """Get the scheduled projects due at or after <start> and before <end>.
+
+        If <start> or <end> is not given, the range is not bounded on that side.
+        Return a sorted list of tuples containing (date, projects), as in get_schedule.
+        """
+        self._sort()
+        return self._group_by_date(self._lower_index(start), self._upper_index(end))
+
+    def next(self, n: int, now: Optional[datetime] = None,
+             end: Optional[datetime] = None) -> ScheduledProjects:
+        """Get the first <n> scheduled projects due at or after <now>, and before <end> if given.
+
+        <now> defaults to the current time.
+        Return a sorted list of tuples containing (date, projects), as in get_schedule.
+        """
+        self._sort()
+        lo = self._lower_index(now or datetime.now())
+        hi = min(lo + max(n, 0), self._upper_index(end))
+        return self._group_by_date(lo, hi)
+
+    def overdue(self, now: Optional[datetime] = None) -> ScheduledProjects:
+        """Get the scheduled projects due before <now>, which defaults to the current time.
+
+        Return a sorted list of tuples containing (date, projects), as in get_schedule.
+        """
+        return self.range(end=now or datetime.now())
+
+    def _sort(self):
+        """Sort the scheduled projects by due date, if projects were added since the last sort.
+
+        The sort is stable, so projects due at the same time stay in order of addition.
+        """
+        if not self._is_sorted:
+            self._projects.sort(key=lambda project: project.sort_key)
+            self._sort_keys = [project.sort_key for project in self._projects]
+            self._is_sorted = True
+
+    def _lower_index(self, start: Optional[datetime]) -> int:
+        """Return the index of the first project due at or after <start>."""
+        return 0 if start is None else bisect_left(self._sort_keys, get_sort_key(start))
+
+    def _upper_index(self, end: Optional[datetime]) -> int:
+        """Return the index after the last project due before <end>."""
+        return len(self._sort_keys) if end is None else bisect_left(self._sort_keys,
+                                                                    get_sort_key(end))
+
+    def _group_by_date(self, lo: int, hi: int) -> ScheduledProjects:
+        """Group the scheduled projects from index <lo> to <hi> by their due date.
+
+        Return a sorted list of tuples containing (date, projects).
+        """
+        grouped: ScheduledProjects = []
+        prev_day = None
 
-        for date in self._schedule:
-            # Sort each date's schedule by time
-            sorted_projects = sorted(self._schedule[date], key=lambda p: p.due_time or '00:00')
-            sorted_schedule.append((date, sorted_projects))
+        for i in range(lo, hi):
+            day = self._sort_keys[i] // SECONDS_PER_DAY
 
-        # Sort by date
-        sorted_schedule.sort()
+            if day != prev_day:
+                # Only format the date once for each day
+                grouped.append((self._projects[i].due_date, []))
+                prev_day = day
+            grouped[-1][1].append(self._projects[i])
 
-        return sorted_schedule, self._unscheduled
+        return grouped
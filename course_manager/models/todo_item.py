@@ -12,6 +12,7 @@ class TodoItem:
     is_complete: bool = False
     due_date: Optional[date_helper.datetime] = None
     priority: int = 0
+    item_id: Optional[str] = None
 
     @staticmethod
     def from_json(obj: Dict[str, Any]) -> Optional[TodoItem]:
@@ -22,11 +23,14 @@ class TodoItem:
         try:
             due_date = date_helper.date_from_str(obj['due_date']) if 'due_date' in obj else None
             return TodoItem(obj['title'], obj['description'], obj['is_complete'], due_date, obj['priority'])
-        except (json.decoder.JSONDecodeError, KeyError):
+        except (json.decoder.JSONDecodeError, KeyError, TypeError):
             return None
 
     def to_json(self) -> Dict[str, Any]:
-        """Return the JSON representation of TodoItem."""
+        """Return the JSON representation of TodoItem.
+
+        The item id is not included, since it is stored by the todo journal.
+        """
         obj = {
             'title': self.title,
             'description': self.description,
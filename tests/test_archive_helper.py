@@ -0,0 +1,86 @@
+import io
+import os
+import gzip
+import tarfile
+import tempfile
+import unittest
+from course_manager.helpers import archive_helper
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+
+        self.course_path = os.path.join(self.root, 'csc108')
+        os.makedirs(os.path.join(self.course_path, 'a0'))
+        with open(os.path.join(self.course_path, 'a0', 'notes.txt'), 'w') as f:
+            f.write('notes')
+
+    def extract(self, archive_path: str, compression: str) -> str:
+        destination = os.path.join(self.root, 'out')
+        os.mkdir(destination)
+        archive_helper.extract_archive(archive_path, destination, compression)
+        return os.path.join(destination, 'csc108')
+
+    def test_round_trip(self):
+        for compression in archive_helper.ARCHIVE_EXTENSIONS:
+            with self.subTest(compression=compression):
+                archive_path = os.path.join(
+                    self.root, archive_helper.get_archive_name('csc108', compression))
+                archive_helper.create_archive(self.course_path, archive_path, compression, 2)
+
+                extracted = self.extract(archive_path, compression)
+                with open(os.path.join(extracted, 'a0', 'notes.txt')) as f:
+                    self.assertEqual(f.read(), 'notes')
+
+                os.remove(archive_path)
+                os.rename(extracted, os.path.join(self.root, 'extracted_' + compression))
+                os.rmdir(os.path.join(self.root, 'out'))
+
+    def test_absolute_symlink_is_kept(self):
+        target = os.path.join(self.root, 'template.txt')
+        os.symlink(target, os.path.join(self.course_path, 'a0', 'link.txt'))
+
+        archive_path = os.path.join(self.root, 'csc108.tar.gz')
+        archive_helper.create_archive(self.course_path, archive_path, 'gz', 1)
+
+        extracted = self.extract(archive_path, 'gz')
+        self.assertEqual(os.readlink(os.path.join(extracted, 'a0', 'link.txt')), target)
+
+    @unittest.skipUnless(hasattr(tarfile, 'data_filter'), 'tarfile cannot filter members')
+    def test_special_file_is_not_archived(self):
+        os.mkfifo(os.path.join(self.course_path, 'a0', 'pipe'))
+        archive_path = os.path.join(self.root, 'csc108.tar.gz')
+
+        with self.assertRaises(archive_helper.FilterError):
+            archive_helper.create_archive(self.course_path, archive_path, 'gz', 1)
+        self.assertEqual(sorted(os.listdir(self.root)), ['csc108'])
+
+    @unittest.skipUnless(hasattr(tarfile, 'data_filter'), 'tarfile cannot filter members')
+    def test_member_through_link_is_rejected(self):
+        outside = os.path.join(self.root, 'outside')
+        os.mkdir(outside)
+
+        content = io.BytesIO()
+        with tarfile.open(fileobj=content, mode='w') as tar:
+            link = tarfile.TarInfo('csc108/link')
+            link.type, link.linkname = tarfile.SYMTYPE, outside
+            tar.addfile(link)
+
+            member = tarfile.TarInfo('csc108/link/escaped')
+            member.size = 1
+            tar.addfile(member, io.BytesIO(b'x'))
+
+        archive_path = os.path.join(self.root, 'csc108.tar.gz')
+        with open(archive_path, 'wb') as f:
+            f.write(gzip.compress(content.getvalue()))
+
+        with self.assertRaises(archive_helper.FilterError):
+            self.extract(archive_path, 'gz')
+        self.assertEqual(os.listdir(outside), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
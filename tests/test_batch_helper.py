@@ -0,0 +1,71 @@
+import os
+import json
+from datetime import datetime
+from course_manager.helpers import batch_helper, project_helper, todo_helper
+from tests.utils import BaseDirectoryTestCase
+
+NOW = datetime(2026, 10, 18, 14, 30)
+
+
+class TestRunBatch(BaseDirectoryTestCase):
+    def run_batch(self, *ops, stop_on_error: bool = False) -> list:
+        lines = [op if isinstance(op, str) else json.dumps(op) for op in ops]
+        return list(batch_helper.run_batch(lines, stop_on_error,
+                                           batch_helper.BatchState(NOW)))
+
+    def test_adds_course_project_and_todo(self):
+        results = self.run_batch(
+            {'op': 'course.add', 'course_code': 'CSC108'},
+            {'op': 'project.add', 'course_code': 'CSC108', 'project_id': 'a0',
+             'due_date': '2026-10-20 23:59'},
+            {'op': 'todo.add', 'course_code': 'csc108', 'project_id': 'a0', 'title': 'Read'})
+
+        self.assertTrue(all(result['ok'] for result in results), results)
+        settings = project_helper.read_project_settings('csc108', 'a0')
+        self.assertEqual(settings.due_date, datetime(2026, 10, 20, 23, 59))
+        self.assertEqual([item.title for item in todo_helper.get_todo_items(('csc108', 'a0'))],
+                         ['Read'])
+
+    def test_invalid_operation_does_not_stop_later_operations(self):
+        results = self.run_batch('{"op": []}', '{"op": {}}', 'not json', '[1]',
+                                 {'op': 'course.add', 'course_code': 'csc108'})
+
+        self.assertEqual([result['ok'] for result in results], [False] * 4 + [True])
+        self.assertEqual([result['line'] for result in results], [1, 2, 3, 4, 5])
+        self.assertTrue(os.path.isdir(self.get_path('csc108')))
+
+    def test_stops_on_first_error(self):
+        results = self.run_batch({'op': 'course.add', 'course_code': 1},
+                                 {'op': 'course.add', 'course_code': 'csc108'},
+                                 stop_on_error=True)
+
+        self.assertEqual(len(results), 1)
+        self.assertFalse(os.path.exists(self.get_path('csc108')))
+
+    def test_invalid_field_values_are_errors(self):
+        self.run_batch({'op': 'course.add', 'course_code': 'csc108'})
+        results = self.run_batch(
+            {'op': 'todo.add', 'title': ['a']},
+            {'op': 'todo.add', 'title': 'a', 'priority': True},
+            {'op': 'todo.add', 'title': 'a', 'due_date': '99999999999999999999'},
+            {'op': 'project.add', 'course_code': 'csc108', 'project_id': 'a0', 'due_date': 5})
+
+        self.assertEqual([result['ok'] for result in results], [False] * 4)
+        self.assertEqual(todo_helper.get_todo_items(None), [])
+
+    def test_paths_outside_base_directory_are_rejected(self):
+        results = self.run_batch(
+            {'op': 'course.add', 'course_code': '..'},
+            {'op': 'project.add', 'course_code': '..', 'project_id': 'a0'},
+            {'op': 'todo.add', 'course_code': '../x', 'title': 'a'})
+
+        self.assertEqual([result['ok'] for result in results], [False] * 3)
+        self.assertEqual(os.listdir(self.base_path), [])
+
+    def test_existing_project_is_rejected(self):
+        results = self.run_batch(
+            {'op': 'course.add', 'course_code': 'csc108'},
+            {'op': 'project.add', 'course_code': 'csc108', 'project_id': 'a0'},
+            {'op': 'project.add', 'course_code': 'csc108', 'project_id': 'a0'})
+
+        self.assertEqual([result['ok'] for result in results], [True, True, False])
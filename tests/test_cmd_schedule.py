@@ -0,0 +1,73 @@
+import json
+from datetime import datetime
+from unittest import mock
+from click.testing import CliRunner
+from course_manager import app
+from course_manager.commands import cmd_show
+from course_manager.helpers import course_helper, index_helper, project_helper
+from course_manager.models.project_settings import ProjectSettings
+from tests.utils import BaseDirectoryTestCase
+
+
+class TestSchedule(BaseDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        for course_code, project_id, due_date in [
+                ('csc108', 'a0', datetime(2026, 10, 21, 23, 59)),
+                ('csc108', 'a1', None),
+                ('mat137', 'ps1', datetime(2026, 10, 20, 12, 0)),
+                ('mat137', 'ps2', datetime(2026, 10, 21, 9, 0))]:
+            if not course_helper.course_exists(course_code):
+                course_helper.add_course(course_code)
+            project_helper.create_project(course_code, ProjectSettings(
+                project_id.upper(), project_id, due_date, None))
+
+    def invoke(self, *argv: str) -> str:
+        result = CliRunner().invoke(app.run, list(argv), catch_exceptions=False)
+        self.assertEqual(result.exit_code, 0, result.output)
+        return result.output
+
+    def test_text_is_ordered_across_courses(self):
+        lines = [line.strip() for line in self.invoke('schedule').splitlines() if line.strip()]
+
+        self.assertTrue(lines[0].startswith('Date/Time'))
+        self.assertEqual([line.split()[-1] for line in lines[1:]],
+                         ['2026-10-20', '(ps1)', '2026-10-21', '(ps2)', '(a0)', 'Unscheduled',
+                          '(a1)'])
+
+    def test_records(self):
+        records = [json.loads(line) for line in self.invoke('schedule', '--format', 'ndjson')
+                   .splitlines()]
+
+        self.assertEqual([(record['project_id'], record['due_time']) for record in records],
+                         [('ps1', '12:00'), ('ps2', '09:00'), ('a0', '23:59'), ('a1', None)])
+
+    def test_limit(self):
+        output = self.invoke('schedule', '--format', 'csv', '--limit', '2')
+        self.assertEqual([line.split(',')[1] for line in output.splitlines()],
+                         ['project_id', 'ps1', 'ps2'])
+
+
+class TestShowStreaming(BaseDirectoryTestCase):
+    def test_each_course_is_written_before_the_next_is_scanned(self):
+        for course_code in ['csc108', 'mat137']:
+            course_helper.add_course(course_code)
+
+        written = []
+        iter_projects = index_helper.iter_projects
+
+        def tracking_iter_projects(*args, **kwargs):
+            for course in iter_projects(*args, **kwargs):
+                yield course
+                written.append(stdout.getvalue().decode())
+
+        runner = CliRunner()
+        with runner.isolation() as (stdout, _, _):
+            with mock.patch.object(cmd_show.index_helper, 'iter_projects',
+                                   tracking_iter_projects):
+                exit_code = app.invoke(['show'])
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn('csc108', written[0])
+        self.assertNotIn('mat137', written[0])
+        self.assertIn('mat137', written[1])
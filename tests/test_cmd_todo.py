@@ -0,0 +1,70 @@
+import unittest
+from click.testing import CliRunner
+from course_manager import app
+from course_manager.commands import cmd_todo
+from course_manager.helpers import course_helper, todo_helper
+from course_manager.models.todo_item import TodoItem
+from tests.utils import BaseDirectoryTestCase
+
+
+class TestParseIndexes(unittest.TestCase):
+    def parse(self, *index_strs: str, num_items: int = 10) -> list:
+        return list(cmd_todo._parse_indexes(list(index_strs), num_items, 'remove'))
+
+    def test_numbers_and_ranges(self):
+        self.assertEqual(self.parse('3'), [3])
+        self.assertEqual(self.parse('1,3-5', '9'), [1, 3, 4, 5, 9])
+        self.assertEqual(self.parse('5-3'), [3, 4, 5])
+        self.assertEqual(self.parse('0-9'), list(range(10)))
+
+    def test_invalid_ranges_are_not_expanded(self):
+        for index_strs in [('10',), ('2-10',), ('1', '0-99999999999999999999')]:
+            with self.subTest(index_strs=index_strs):
+                with self.assertRaises(SystemExit):
+                    self.parse(*index_strs)
+
+    def test_no_items(self):
+        with self.assertRaises(SystemExit):
+            self.parse('0', num_items=0)
+
+
+class TestRemove(BaseDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        course_helper.add_course('csc108')
+        course_helper.add_course('108')
+        for title in 'abcdef':
+            todo_helper.add_todo_item('csc108', TodoItem(title, is_complete=title in 'ace'))
+        todo_helper.add_todo_item('108', TodoItem('g'))
+
+    def invoke(self, *argv: str):
+        return CliRunner().invoke(app.run, ['todo', 'remove', *argv], catch_exceptions=False)
+
+    def get_titles(self, scope: str) -> str:
+        return ''.join(item.title for item in todo_helper.get_todo_items(scope))
+
+    def test_ranges_refer_to_items_before_removal(self):
+        result = self.invoke('4-3,0', '1', 'csc108')
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.get_titles('csc108'), 'cf')
+
+    def test_filters(self):
+        result = self.invoke('0-4', 'csc108', '--completed')
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.get_titles('csc108'), 'bdf')
+
+    def test_course_code_which_is_a_number(self):
+        result = self.invoke('0', '108')
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self.get_titles('108'), '')
+        self.assertEqual(self.get_titles('csc108'), 'abcdef')
+
+    def test_invalid_index(self):
+        result = self.invoke('2-6', 'csc108')
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(result.output, 'Invalid index, enter a number between 0 and 5.\n')
+        self.assertEqual(self.get_titles('csc108'), 'abcdef')
+
+        result = self.invoke('0')
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(result.output, 'There are no todo items to remove.\n')
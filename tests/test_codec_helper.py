@@ -0,0 +1,71 @@
+import unittest
+from datetime import datetime
+from course_manager.helpers import codec_helper, date_helper
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.models.todo_item import TodoItem
+
+SETTINGS = [
+    ProjectSettings('Assignment 0', 'a0', datetime(2026, 10, 20, 23, 59, 30), 'code .'),
+    ProjectSettings('Problem set', 'ps1', datetime(2027, 1, 1), None),
+    ProjectSettings('No due date', 'x', None, 'open .'),
+]
+
+
+def _fields(settings: ProjectSettings) -> tuple:
+    return settings.name, settings.project_id, settings.due_date, settings.open_method
+
+
+class TestProjectSettingsCodec(unittest.TestCase):
+    def test_round_trip(self):
+        for compact in [False, True]:
+            for settings in SETTINGS:
+                with self.subTest(compact=compact, settings=settings.project_id):
+                    raw = codec_helper.encode_project_settings(settings, compact)
+                    self.assertEqual(raw.startswith('['), compact)
+                    self.assertEqual(_fields(codec_helper.decode_project_settings(raw)),
+                                     _fields(settings))
+                    self.assertEqual(_fields(codec_helper.decode_project_settings(raw.encode())),
+                                     _fields(settings))
+
+    def test_invalid_documents(self):
+        for raw in ['', '{', '5', 'null', '{"name": "a"}', '["cm1", "a", "a0"]',
+                    '["cm0", "a", "a0", null, null]', '["cm1", "a", "a0", "soon", null]',
+                    '["cm1", "a", "a0", -5, null]', b'\xff']:
+            with self.subTest(raw=raw):
+                self.assertIsNone(codec_helper.decode_project_settings(raw))
+
+    def test_decode_many(self):
+        raws = [codec_helper.encode_project_settings(settings, compact=i % 2 == 0)
+                for i, settings in enumerate(SETTINGS)]
+        decoded = codec_helper.decode_project_settings_many(raws)
+        self.assertEqual([_fields(settings) for settings in decoded],
+                         [_fields(settings) for settings in SETTINGS])
+
+    def test_decode_many_with_invalid_documents(self):
+        raws = [SETTINGS[0].to_json(), '{', '1, 2', b'{"name": "b", "project_id": "b"}']
+        decoded = codec_helper.decode_project_settings_many(raws)
+
+        self.assertEqual(_fields(decoded[0]), _fields(SETTINGS[0]))
+        self.assertEqual(decoded[1:3], [None, None])
+        self.assertEqual(_fields(decoded[3]), ('b', 'b', None, None))
+
+
+class TestTodoItemCodec(unittest.TestCase):
+    def test_decode_todo_items(self):
+        item = TodoItem('Read', 'chapter 1', True, datetime(2026, 10, 20, 9), 2)
+        decoded = codec_helper.decode_todo_items([item.to_json(), {'title': 'a'}])
+        self.assertEqual(decoded, [item, None])
+
+
+class TestDateFromStr(unittest.TestCase):
+    def test_fast_path_matches_strptime(self):
+        for date_str in ['2026-10-20 23:59:30', '0001-01-01 00:00:00']:
+            with self.subTest(date_str=date_str):
+                self.assertEqual(date_helper.date_from_str(date_str),
+                                 datetime.strptime(date_str, date_helper.DATE_FORMAT_FULL))
+
+    def test_rejects_other_shapes(self):
+        # fromisoformat would accept these, but the settings format does not
+        for date_str in ['2026-10-20T23:59:30', '2026-10-20 23:59', '2026-10-20 25:00:00']:
+            with self.subTest(date_str=date_str):
+                self.assertIsNone(date_helper.date_from_str(date_str))
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from course_manager.helpers import config_helper, path_helper
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.home = Path(directory.name)
+
+        # Start from an environment without overrides, and a home without a config file
+        env = {key: value for key, value in os.environ.items()
+               if not key.startswith(config_helper.ENV_PREFIX)}
+        for patcher in [mock.patch.dict(os.environ, env, clear=True),
+                        mock.patch.object(path_helper, 'HOME_PATH', self.home)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        config_helper.reload_config()
+        self.addCleanup(config_helper.reload_config)
+
+    def test_defaults_are_written_on_first_read(self):
+        self.assertEqual(config_helper.get_config(config_helper.KEY_BASE_DIRECTORY),
+                         path_helper.DEFAULT_BASE_DIRECTORY)
+        self.assertTrue(config_helper.get_config_file_path().is_file())
+
+    def test_missing_key_has_default(self):
+        config_helper.get_config_file_path().write_text('[DEFAULT]\nbase_directory = mine\n')
+
+        self.assertEqual(config_helper.get_config(config_helper.KEY_BASE_DIRECTORY), 'mine')
+        self.assertEqual(config_helper.get_config(config_helper.KEY_SCAN_WORKERS), '1')
+
+    def test_config_file_is_read_once(self):
+        config_helper.set_config(config_helper.KEY_SCAN_WORKERS, '3')
+        config_helper.get_config_file_path().write_text('[DEFAULT]\nscan_workers = 5\n')
+        self.assertEqual(config_helper.get_config(config_helper.KEY_SCAN_WORKERS), '3')
+
+        config_helper.reload_config()
+        self.assertEqual(config_helper.get_config(config_helper.KEY_SCAN_WORKERS), '5')
+
+    def test_base_path_is_cached_until_changed(self):
+        self.assertEqual(path_helper.get_base_path(), self.home / 'courses')
+        config_helper.get_config_file_path().write_text('[DEFAULT]\nbase_directory = edited\n')
+        self.assertEqual(path_helper.get_base_path(), self.home / 'courses')
+
+        config_helper.set_config(config_helper.KEY_BASE_DIRECTORY, 'other')
+        self.assertEqual(path_helper.get_base_path(), self.home / 'other')
+
+        os.mkdir(self.home / 'other')
+        self.assertTrue(path_helper.rename_base_directory('other', 'renamed'))
+        config_helper.set_config(config_helper.KEY_BASE_DIRECTORY, 'renamed')
+        self.assertEqual(path_helper.get_path('csc108'), self.home / 'renamed' / 'csc108')
+
+    def test_environment_overrides(self):
+        with mock.patch.dict(os.environ, {'CM_SCAN_WORKERS': '4'}):
+            self.assertEqual(config_helper.get_config(config_helper.KEY_SCAN_WORKERS), '4')
+            with self.assertRaises(config_helper.ConfigOverriddenError):
+                config_helper.set_config(config_helper.KEY_SCAN_WORKERS, '2')
+
+    def test_overridden_base_directory_bypasses_config_file(self):
+        base = str(self.home / 'base')
+
+        with mock.patch.dict(os.environ, {'CM_BASE_DIRECTORY': base}):
+            config_helper.reload_config()
+            self.assertEqual(path_helper.get_base_path(), Path(base))
+            self.assertEqual(config_helper.get_config(config_helper.KEY_SCAN_WORKERS), '1')
+            with self.assertRaises(config_helper.ConfigOverriddenError):
+                config_helper.set_config(config_helper.KEY_SCAN_WORKERS, '2')
+
+        self.assertFalse(config_helper.get_config_file_path().exists())
+
+    def test_invalid_key(self):
+        with self.assertRaises(config_helper.ConfigKeyInvalidError):
+            config_helper.get_config('not_a_key')
+        self.assertFalse(config_helper.get_config_bool(config_helper.KEY_COMPACT_SETTINGS))
@@ -0,0 +1,104 @@
+import os
+from datetime import datetime
+from course_manager.helpers import course_helper, project_helper
+from course_manager.models.project_settings import ProjectSettings
+from tests.utils import BaseDirectoryTestCase
+
+
+class TestArchiveCourse(BaseDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        course_helper.add_course('csc108')
+        project_helper.create_project('csc108', ProjectSettings('A0', 'a0',
+                                                                datetime(2026, 10, 20), None))
+
+    def test_compressed_round_trip(self):
+        target = self.get_path('template.txt')
+        os.symlink(target, self.get_path('csc108', 'a0', 'link.txt'))
+
+        course_helper.archive_course('csc108', 'gz', 1)
+        self.assertFalse(course_helper.course_exists('csc108'))
+        self.assertTrue(course_helper.course_archived('csc108'))
+        self.assertEqual(course_helper.get_archived_course_codes(), ['csc108'])
+        self.assertEqual([(project_id, settings.name) for project_id, settings
+                          in course_helper.get_archived_projects('csc108')], [('a0', 'A0')])
+
+        course_helper.unarchive_course('csc108')
+        self.assertFalse(course_helper.course_archived('csc108'))
+        self.assertEqual(project_helper.read_project_settings('csc108', 'a0').name, 'A0')
+        self.assertEqual(os.readlink(self.get_path('csc108', 'a0', 'link.txt')), target)
+        self.assertEqual(os.listdir(self.get_path(course_helper.ARCHIVED_DIRECTORY)), [])
+
+    def test_uncompressed_round_trip(self):
+        course_helper.archive_course('csc108', 'none')
+        self.assertEqual(course_helper.get_archived_course_codes(), ['csc108'])
+        self.assertEqual([project_id for project_id, _
+                          in course_helper.get_archived_projects('csc108')], ['a0'])
+
+        course_helper.unarchive_course('csc108')
+        self.assertTrue(course_helper.course_exists('csc108'))
+
+    def test_corrupt_manifest_is_reported(self):
+        course_helper.archive_course('csc108', 'xz', 1)
+        manifest_path = self.get_path(course_helper.ARCHIVED_DIRECTORY,
+                                      'csc108' + course_helper.MANIFEST_SUFFIX)
+
+        for content in ['{"version": 1', '{"version": 1}', '[]',
+                        '{"version": 1, "compression": "xz", "archive": "../x.tar.xz", '
+                        '"projects": []}']:
+            with self.subTest(content=content):
+                with open(manifest_path, 'w') as f:
+                    f.write(content)
+
+                with self.assertRaises(course_helper.ArchiveManifestError):
+                    course_helper.unarchive_course('csc108')
+                self.assertFalse(course_helper.course_exists('csc108'))
+                self.assertTrue(os.path.exists(self.get_path(course_helper.ARCHIVED_DIRECTORY,
+                                                             'csc108.tar.xz')))
+
+        os.remove(manifest_path)
+        self.assertFalse(course_helper.course_archived('csc108'))
+
+    def test_archived_course_codes(self):
+        course_helper.add_course('mat137')
+        course_helper.archive_course('csc108', 'gz', 1)
+        course_helper.archive_course('mat137', 'none')
+
+        self.assertEqual(course_helper.get_archived_course_codes(), ['csc108', 'mat137'])
+        self.assertEqual(course_helper.get_all_course_codes(), ['csc108', 'mat137'])
+
+
+class TestScanCourses(BaseDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        for course_code in ['mat137', 'csc108']:
+            course_helper.add_course(course_code)
+
+        project_helper.create_project('csc108', ProjectSettings('A0', 'a0', None, None))
+        os.mkdir(self.get_path('csc108', 'a1'))
+        # Neither is a course: a file, and a directory with an invalid code
+        open(self.get_path('notes.txt'), 'w').close()
+        os.mkdir(self.get_path('Not-A-Course'))
+
+    def test_course_codes(self):
+        self.assertEqual(course_helper.get_course_codes(), ['csc108', 'mat137'])
+
+    def test_projects_and_settings(self):
+        entries = {entry.project_id: entry.has_settings
+                   for entry in project_helper.scan_projects('csc108')}
+        self.assertEqual(entries, {'a0': True, 'a1': False})
+        self.assertEqual(sorted(project_helper.get_project_ids('csc108')), ['a0', 'a1'])
+
+    def test_scan_courses(self):
+        course_helper.archive_course('mat137', 'none')
+
+        entries = list(course_helper.scan_courses(include_archived=True))
+        self.assertEqual([(entry.course_code, entry.archived) for entry in entries],
+                         [('csc108', False), ('mat137', True)])
+        self.assertEqual(sorted(project.project_id for project in entries[0].projects),
+                         ['a0', 'a1'])
+        self.assertIsNone(entries[1].projects)
+
+        entries = list(course_helper.scan_courses(include_projects=False))
+        self.assertEqual([(entry.course_code, entry.projects) for entry in entries],
+                         [('csc108', None)])
@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+import socket
+import tempfile
+import subprocess
+import unittest
+from unittest import mock
+from course_manager.helpers import daemon_helper
+
+# Seconds to wait for the daemon started by a test to listen
+START_TIMEOUT = 5
+
+
+class TestSocketPath(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.path = os.path.join(self.directory, 'cm.sock')
+
+        patcher = mock.patch.dict(os.environ, {daemon_helper.ENV_SOCKET: self.path})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_regular_file_is_kept(self):
+        with open(self.path, 'w') as f:
+            f.write('data')
+
+        with self.assertRaises(daemon_helper.DaemonSocketError):
+            daemon_helper.remove_stale_socket()
+        with self.assertRaises(daemon_helper.DaemonNotRunningError):
+            daemon_helper.send_request({'type': daemon_helper.REQUEST_PING})
+        self.assertTrue(os.path.isfile(self.path))
+
+    def test_link_to_socket_is_kept(self):
+        target = os.path.join(self.directory, 'target.sock')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(target)
+        os.symlink(target, self.path)
+
+        with self.assertRaises(daemon_helper.DaemonSocketError):
+            daemon_helper.remove_stale_socket()
+        self.assertTrue(os.path.islink(self.path))
+
+    def test_stale_socket_is_removed(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(self.path)
+
+        daemon_helper.remove_stale_socket()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_missing_socket(self):
+        daemon_helper.remove_stale_socket()
+        with self.assertRaises(daemon_helper.DaemonNotRunningError):
+            daemon_helper.send_request({'type': daemon_helper.REQUEST_PING})
+
+
+class TestServe(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'cm.sock')
+
+        env = {daemon_helper.ENV_SOCKET: self.path, 'CM_BASE_DIRECTORY': directory.name}
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.process = subprocess.Popen(
+            [sys.executable, '-c', 'from course_manager.helpers import daemon_helper\n'
+                                   'daemon_helper.serve()'],
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        self.addCleanup(self.process.wait)
+        self.addCleanup(self.process.kill)
+
+        deadline = time.monotonic() + START_TIMEOUT
+        while not os.path.exists(self.path):
+            self.assertLess(time.monotonic(), deadline, 'The daemon did not start.')
+            time.sleep(0.05)
+
+    def test_socket_is_private(self):
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o600)
+
+    def test_ping_and_stop(self):
+        response = daemon_helper.send_request({'type': daemon_helper.REQUEST_PING})
+        self.assertEqual(response['pid'], self.process.pid)
+
+        with self.assertRaises(daemon_helper.DaemonSocketError):
+            daemon_helper.remove_stale_socket()
+        self.assertTrue(os.path.exists(self.path))
+
+        daemon_helper.send_request({'type': daemon_helper.REQUEST_STOP})
+        self.assertEqual(self.process.wait(START_TIMEOUT), 0)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_forward(self):
+        os.mkdir(os.path.join(os.environ['CM_BASE_DIRECTORY'], 'csc108'))
+        response = daemon_helper.send_request({
+            'type': daemon_helper.REQUEST_RUN,
+            'argv': ['show'],
+            'env': daemon_helper.get_forwarded_env(),
+            'color': False,
+        })
+
+        self.assertEqual(response['exit_code'], 0)
+        self.assertIn('csc108', response['stdout'])
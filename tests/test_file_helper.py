@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from course_manager.helpers import file_helper
+
+
+class FileTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+        # Record the paths flushed to disk
+        self.synced = []
+        fsync_path = file_helper._fsync_path
+        patcher = mock.patch.object(file_helper, '_fsync_path',
+                                    side_effect=lambda path, flags: (self.synced.append(path),
+                                                                     fsync_path(path, flags)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read(self, name: str) -> str:
+        with open(os.path.join(self.directory, name)) as f:
+            return f.read()
+
+
+class TestWriteAtomic(FileTestCase):
+    def test_replaces_content_and_keeps_permissions(self):
+        path = os.path.join(self.directory, 'settings')
+        file_helper.write_atomic(path, 'first')
+        os.chmod(path, 0o600)
+
+        file_helper.write_atomic(path, 'second')
+        self.assertEqual(self.read('settings'), 'second')
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o600)
+        self.assertEqual(os.listdir(self.directory), ['settings'])
+        self.assertEqual(self.synced, [self.directory, self.directory])
+
+    def test_failed_write_keeps_old_content(self):
+        path = os.path.join(self.directory, 'settings')
+        file_helper.write_atomic(path, 'first')
+
+        with mock.patch.object(os, 'replace', side_effect=OSError('interrupted')):
+            with self.assertRaises(OSError):
+                file_helper.write_atomic(path, 'second')
+
+        self.assertEqual(self.read('settings'), 'first')
+        self.assertEqual(os.listdir(self.directory), ['settings'])
+
+    def test_without_sync(self):
+        file_helper.write_atomic(os.path.join(self.directory, 'index'), 'data', sync=False)
+        self.assertEqual(self.read('index'), 'data')
+        self.assertEqual(self.synced, [])
+
+
+class TestGroupCommit(FileTestCase):
+    def test_directory_is_flushed_once_at_end_of_group(self):
+        with file_helper.group_commit():
+            for i in range(5):
+                file_helper.write_atomic(os.path.join(self.directory, f'file{i}'), str(i))
+            self.assertEqual(self.synced, [])
+
+        self.assertEqual(self.synced, [self.directory])
+        self.assertEqual(self.read('file3'), '3')
+
+    def test_nested_groups_flush_at_outermost_exit(self):
+        path = os.path.join(self.directory, 'journal')
+
+        with file_helper.group_commit():
+            with file_helper.group_commit():
+                file_helper.append_durable(path, 'a\n')
+            self.assertEqual(self.synced, [])
+
+            file_helper.append_durable(path, 'b\n')
+
+        # The file is flushed before the directory holding its new entry
+        self.assertEqual(self.synced, [path, self.directory])
+        self.assertEqual(self.read('journal'), 'a\nb\n')
+
+    def test_group_is_flushed_when_interrupted(self):
+        with self.assertRaises(KeyError):
+            with file_helper.group_commit():
+                file_helper.write_atomic(os.path.join(self.directory, 'file'), 'data')
+                raise KeyError
+
+        self.assertEqual(self.synced, [self.directory])
+
+        file_helper.write_atomic(os.path.join(self.directory, 'file'), 'data')
+        self.assertEqual(self.synced, [self.directory] * 2)
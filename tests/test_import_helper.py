@@ -0,0 +1,62 @@
+import io
+import json
+from course_manager.helpers import course_helper, import_helper, project_helper
+from tests.utils import BaseDirectoryTestCase
+
+
+class TestReadRows(BaseDirectoryTestCase):
+    def test_csv(self):
+        file = io.StringIO('course_code,project_id,name,due_date,open_method\n'
+                           'csc108,a0,A0,2026-10-20,\n')
+        self.assertEqual(import_helper.read_rows(file, 'csv'),
+                         [{'course_code': 'csc108', 'project_id': 'a0', 'name': 'A0',
+                           'due_date': '2026-10-20', 'open_method': ''}])
+
+    def test_json(self):
+        rows = [{'course_code': 'csc108', 'project_id': 'a0'}]
+        self.assertEqual(import_helper.read_rows(io.StringIO(json.dumps(rows))), rows)
+
+    def test_invalid_files(self):
+        for content in ['[{"course_code": ', '{"course_code": "csc108"}']:
+            with self.subTest(content=content):
+                with self.assertRaises(import_helper.ImportFileError):
+                    import_helper.read_rows(io.StringIO(content), 'json')
+
+
+class TestImportProjects(BaseDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        course_helper.add_course('csc108')
+
+    def test_valid_rows_are_created(self):
+        results = import_helper.import_projects([
+            {'course_code': 'CSC108', 'project_id': 'a0', 'name': 'A0',
+             'due_date': '2026-10-20 23:59'},
+            {'project_id': 'a1', 'due_date': '', 'open_method': ''},
+        ], default_course_code='csc108', workers=2)
+
+        self.assertEqual([(result.row, result.course_code, result.project_id, result.error)
+                          for result in results],
+                         [(1, 'csc108', 'a0', None), (2, 'csc108', 'a1', None)])
+        settings = project_helper.read_project_settings('csc108', 'a1')
+        self.assertEqual((settings.name, settings.due_date, settings.open_method),
+                         ('a1', None, import_helper.DEFAULT_OPEN_METHOD))
+
+    def test_invalid_rows_do_not_stop_other_rows(self):
+        results = import_helper.import_projects([
+            {'course_code': 'csc108', 'project_id': 'a0'},
+            {'course_code': 'csc108', 'project_id': 'a0'},
+            {'course_code': 'mat137', 'project_id': 'a1'},
+            {'course_code': '..', 'project_id': 'a1'},
+            {'course_code': 'csc108', 'project_id': '../a1'},
+            {'course_code': 'csc108', 'project_id': 'a1', 'due_date': 'someday'},
+            {'course_code': 'csc108', 'project_id': 'a1', 'due_date': '99999999999999999999'},
+            {'course_code': 'csc108', 'project_id': 5},
+            'csc108,a1',
+            {'course_code': 'csc108', 'project_id': 'a2'},
+        ], workers=1)
+
+        self.assertEqual([result.error is None for result in results],
+                         [True] + [False] * 8 + [True])
+        self.assertEqual(sorted(project_helper.get_project_ids('csc108')), ['a0', 'a2'])
+        self.assertEqual(sorted(course_helper.get_course_codes()), ['csc108'])
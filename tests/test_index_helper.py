@@ -0,0 +1,90 @@
+import os
+import shutil
+from datetime import datetime
+from unittest import mock
+from course_manager.helpers import course_helper, index_helper, project_helper
+from course_manager.models.project_settings import ProjectSettings
+from tests.utils import BaseDirectoryTestCase
+
+
+class TestIndex(BaseDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        course_helper.add_course('csc108')
+        for project_id in ['a0', 'a1']:
+            project_helper.create_project('csc108', ProjectSettings(
+                project_id.upper(), project_id, datetime(2026, 10, 20), None))
+
+        read_raw = project_helper.read_project_settings_raw
+        patcher = mock.patch.object(project_helper, 'read_project_settings_raw',
+                                    side_effect=read_raw)
+        self.read_raw = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_names(self) -> dict:
+        """Return the name of each project of csc108, read through the index."""
+        projects = index_helper.get_projects(['csc108'], workers=1)['csc108']
+        return {project_id: settings.name if settings is not None else None
+                for project_id, settings in projects}
+
+    def bump_mtime(self, *paths: str):
+        """Move the modification time of <paths> forward, as a later edit would."""
+        path = self.get_path(*paths)
+        mtime_ns = os.stat(path).st_mtime_ns + 10 ** 9
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_reuses_index_when_nothing_changed(self):
+        self.assertEqual(self.get_names(), {'a0': 'A0', 'a1': 'A1'})
+        self.assertEqual(self.read_raw.call_count, 2)
+        self.assertTrue(os.path.isfile(self.get_path(index_helper.INDEX_FILE)))
+
+        self.read_raw.reset_mock()
+        self.assertEqual(self.get_names(), {'a0': 'A0', 'a1': 'A1'})
+        self.read_raw.assert_not_called()
+
+    def test_added_and_removed_projects(self):
+        self.get_names()
+
+        project_helper.create_project('csc108', ProjectSettings('A2', 'a2', None, None))
+        shutil.rmtree(self.get_path('csc108', 'a0'))
+        self.bump_mtime('csc108')
+        self.read_raw.reset_mock()
+
+        self.assertEqual(self.get_names(), {'a1': 'A1', 'a2': 'A2'})
+        self.assertEqual([call.args[1] for call in self.read_raw.call_args_list], ['a2'])
+
+    def test_edited_settings(self):
+        self.get_names()
+
+        settings = project_helper.read_project_settings('csc108', 'a1')
+        settings.name = 'A1 edited'
+        project_helper.write_project_settings('csc108', settings)
+        self.bump_mtime('csc108', 'a1', project_helper.PROJECT_SETTINGS_FILE)
+        self.read_raw.reset_mock()
+
+        self.assertEqual(self.get_names(), {'a0': 'A0', 'a1': 'A1 edited'})
+        self.assertEqual([call.args[1] for call in self.read_raw.call_args_list], ['a1'])
+
+    def test_removed_settings(self):
+        self.get_names()
+        os.remove(self.get_path('csc108', 'a1', project_helper.PROJECT_SETTINGS_FILE))
+
+        self.assertEqual(self.get_names(), {'a0': 'A0', 'a1': None})
+
+    def test_recovers_from_corrupt_index(self):
+        index_path = self.get_path(index_helper.INDEX_FILE)
+
+        for content in ['{"version": 2, "cour', '[]', '{"version": 2, "courses": []}',
+                        '{"version": 2, "courses": {"csc108": {"mtime": "x"}}}',
+                        '{"version": 2, "courses": {"csc108": {"mtime": 1, '
+                        '"projects": {"a0": 5}}}}']:
+            with self.subTest(content=content):
+                with open(index_path, 'w') as f:
+                    f.write(content)
+
+                self.assertEqual(self.get_names(), {'a0': 'A0', 'a1': 'A1'})
+
+        # The rebuilt index is written back and reused
+        self.read_raw.reset_mock()
+        self.assertEqual(self.get_names(), {'a0': 'A0', 'a1': 'A1'})
+        self.read_raw.assert_not_called()
@@ -0,0 +1,70 @@
+import os
+import unittest
+from unittest import mock
+from click.testing import CliRunner
+from course_manager import app
+from course_manager.helpers import course_helper, io_stats_helper
+from tests.utils import BaseDirectoryTestCase
+
+
+class StatsTestCase(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # Counting starts without counts, and stays disabled for other tests
+        for patcher in [mock.patch.object(io_stats_helper, '_enabled', False),
+                        mock.patch.dict(io_stats_helper._counts, clear=True)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestCount(StatsTestCase):
+    def test_disabled(self):
+        io_stats_helper.count('course_helper', io_stats_helper.STATS)
+        io_stats_helper.count_read('course_helper', 'content')
+        self.assertEqual(io_stats_helper.get_counts(), {})
+
+    def test_reads_and_writes(self):
+        io_stats_helper.enable()
+        io_stats_helper.count_read('todo_helper', 'é')
+        io_stats_helper.count_read('todo_helper', b'ab')
+        io_stats_helper.count_write('index_helper', '{}')
+
+        self.assertEqual(io_stats_helper.get_counts(), {
+            'todo_helper': {io_stats_helper.FILES_OPENED: 2, io_stats_helper.BYTES_READ: 4},
+            'index_helper': {io_stats_helper.FILES_OPENED: 1, io_stats_helper.BYTES_WRITTEN: 2},
+        })
+
+
+class TestCourseStats(StatsTestCase, BaseDirectoryTestCase):
+    def get_stats(self) -> int:
+        return io_stats_helper.get_counts()['course_helper'][io_stats_helper.STATS]
+
+    def test_each_stat_is_counted(self):
+        io_stats_helper.enable()
+        self.assertFalse(course_helper.course_archived('csc108'))
+        self.assertEqual(self.get_stats(), 2)
+
+        os.makedirs(self.get_path(course_helper.ARCHIVED_DIRECTORY, 'csc108'))
+        io_stats_helper.enable()
+        self.assertTrue(course_helper.course_archived('csc108'))
+        self.assertEqual(self.get_stats(), 1)
+
+        io_stats_helper.enable()
+        self.assertFalse(course_helper.course_exists('csc108'))
+        self.assertEqual(self.get_stats(), 1)
+
+    def test_debug_stats(self):
+        course_helper.add_course('csc108')
+        result = CliRunner().invoke(app.run, ['debug', 'stats', 'show'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0, result.stderr)
+        self.assertIn('csc108', result.stdout)
+        lines = result.stderr.splitlines()
+        self.assertEqual(lines[1].split(), ['Helper', 'Listed', 'Stats', 'Opened', 'Read',
+                                            'Written', 'Decoded'])
+        self.assertEqual(lines[-1].split()[0], 'total')
+
+    def test_debug_stats_keeps_exit_code(self):
+        result = CliRunner().invoke(app.run, ['debug', 'stats', 'show', 'csc999'])
+        self.assertEqual(result.exit_code, 1)
@@ -0,0 +1,44 @@
+import unittest
+from datetime import datetime
+from course_manager.helpers import readable_date_parser
+
+NOW = datetime(2026, 10, 18, 14, 30)
+
+
+class TestParse(unittest.TestCase):
+    def assertParses(self, phrase: str, expected: datetime):
+        self.assertEqual(readable_date_parser.parse(phrase, NOW), expected)
+
+    def test_date_only_is_midnight(self):
+        self.assertParses('tmr', datetime(2026, 10, 19, 0, 0))
+
+    def test_hour_and_minute(self):
+        self.assertParses('today 7:45', datetime(2026, 10, 18, 7, 45))
+        self.assertParses('tmr 7:30pm', datetime(2026, 10, 19, 19, 30))
+
+    def test_twelve_am_is_midnight(self):
+        self.assertParses('today 12am', datetime(2026, 10, 18, 0, 0))
+        self.assertParses('today 12:15am', datetime(2026, 10, 18, 0, 15))
+
+    def test_twelve_pm_is_noon(self):
+        self.assertParses('today 12pm', datetime(2026, 10, 18, 12, 0))
+
+    def test_time_of_day(self):
+        self.assertParses('next monday evening', datetime(2026, 10, 19, 18, 0))
+
+    def test_relative_time(self):
+        self.assertParses('today in 2 hours', datetime(2026, 10, 18, 16, 30))
+
+    def test_invalid_hour_rejects_phrase(self):
+        self.assertIsNone(readable_date_parser.parse('tmr 25', NOW))
+        self.assertIsNone(readable_date_parser.parse('today 24:00', NOW))
+
+    def test_invalid_minute_rejects_phrase(self):
+        self.assertIsNone(readable_date_parser.parse('today 7:99', NOW))
+
+    def test_no_specifier(self):
+        self.assertIsNone(readable_date_parser.parse('whenever', NOW))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+import unittest
+import click
+from click.testing import CliRunner
+from course_manager.cli import record_writer
+
+RECORDS = [
+    {'project_id': 'a0', 'due_date': '2026-10-20', 'is_complete': True, 'tags': ['x', 'y']},
+    {'project_id': 'a,1', 'due_date': None, 'is_complete': False, 'tags': []},
+]
+FIELDS = ['project_id', 'due_date', 'is_complete', 'tags', 'missing']
+
+
+def _write(records, output_format: str) -> str:
+    """Return the output of writing <records> in <output_format>."""
+    @click.command()
+    def command():
+        record_writer.write_records(records, output_format, FIELDS)
+
+    result = CliRunner().invoke(command, color=True, catch_exceptions=False)
+    return result.output
+
+
+class TestWriteRecords(unittest.TestCase):
+    def test_json(self):
+        self.assertEqual(json.loads(_write(RECORDS, record_writer.FORMAT_JSON)), RECORDS)
+        self.assertEqual(_write([], record_writer.FORMAT_JSON), '[]\n')
+
+    def test_ndjson(self):
+        output = _write(RECORDS, record_writer.FORMAT_NDJSON)
+        self.assertEqual([json.loads(line) for line in output.splitlines()], RECORDS)
+        self.assertEqual(_write([], record_writer.FORMAT_NDJSON), '')
+
+    def test_csv(self):
+        rows = list(csv.reader(io.StringIO(_write(RECORDS, record_writer.FORMAT_CSV))))
+        self.assertEqual(rows, [FIELDS, ['a0', '2026-10-20', 'true', 'x;y', ''],
+                                ['a,1', '', 'false', '', '']])
+
+    def test_records_are_written_as_produced(self):
+        written = []
+
+        def records():
+            for i in range(200):
+                written.append(len(stdout.getvalue()))
+                yield {'index': i, 'padding': 'x' * 1000}
+
+        with CliRunner().isolation() as (stdout, _, _):
+            record_writer.write_records(records(), record_writer.FORMAT_NDJSON, FIELDS)
+
+        # Output is written in chunks of the renderer's buffer size while records are produced
+        self.assertEqual(written[0], 0)
+        self.assertGreater(written[-1], 0)
+        self.assertEqual(len(stdout.getvalue().splitlines()), 200)
@@ -0,0 +1,51 @@
+import click
+import unittest
+from unittest import mock
+from click.testing import CliRunner
+from course_manager.cli.renderer import Renderer
+
+
+class TestRenderer(unittest.TestCase):
+    def render(self, color=None, renderer_color=None) -> str:
+        """Render styled lines with <renderer_color> in a command run with <color>, and return
+        the output."""
+        @click.command()
+        def command():
+            with Renderer(renderer_color) as renderer:
+                renderer.line(renderer.style('csc108', fg='blue'))
+                renderer.write('plain')
+                renderer.line()
+
+        result = CliRunner().invoke(command, color=color, catch_exceptions=False)
+        return result.output
+
+    def test_colors_follow_the_command(self):
+        styled = click.style('csc108', fg='blue')
+
+        # Output is not a terminal
+        self.assertEqual(self.render(), 'csc108\nplain\n')
+        self.assertEqual(self.render(color=True), f'{styled}\nplain\n')
+        self.assertEqual(self.render(color=True, renderer_color=False), 'csc108\nplain\n')
+
+    def test_styles_are_memoized(self):
+        renderer = Renderer(color=True)
+
+        with mock.patch.object(click, 'style', wraps=click.style) as style:
+            first = renderer.style('csc108', fg='blue', bold=True)
+            second = renderer.style('csc108', bold=True, fg='blue')
+            renderer.style('mat137', fg='blue', bold=True)
+
+        self.assertIs(first, second)
+        self.assertEqual(style.call_count, 2)
+
+    def test_buffer_is_flushed_when_full(self):
+        with mock.patch.object(click, 'echo') as echo:
+            with Renderer(color=False, buffer_size=10) as renderer:
+                renderer.write('12345')
+                self.assertEqual(echo.call_count, 0)
+                renderer.line('6789')
+                self.assertEqual(echo.call_count, 1)
+                renderer.write('abc')
+            renderer.flush()
+
+        self.assertEqual([call.args[0] for call in echo.call_args_list], ['123456789\n', 'abc'])
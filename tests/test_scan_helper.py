@@ -0,0 +1,95 @@
+import os
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from course_manager.helpers import scan_helper
+
+
+class TestMapOrdered(unittest.TestCase):
+    def test_results_are_in_order_of_items(self):
+        def delayed(i: int) -> int:
+            # Later items finish first
+            time.sleep((5 - i) * 0.01)
+            return i * i
+
+        for workers in [1, 2, 8]:
+            with self.subTest(workers=workers):
+                self.assertEqual(scan_helper.map_ordered(delayed, range(5), workers),
+                                 [0, 1, 4, 9, 16])
+
+    def test_at_most_workers_run_at_once(self):
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def track(_):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+        scan_helper.map_ordered(track, range(12), workers=3)
+        self.assertLessEqual(max(max_running), 3)
+
+    def test_single_worker_runs_in_calling_thread(self):
+        threads = scan_helper.map_ordered(lambda _: threading.get_ident(), range(3), workers=1)
+        self.assertEqual(threads, [threading.get_ident()] * 3)
+
+    def test_closing_early_cancels_remaining_calls(self):
+        called = []
+
+        def record(i: int) -> int:
+            called.append(i)
+            time.sleep(0.01)
+            return i
+
+        results = scan_helper.imap_ordered(record, range(50), workers=2)
+        self.assertEqual(next(results), 0)
+        results.close()
+
+        self.assertLess(len(called), 50)
+
+    def test_errors_are_raised_in_order(self):
+        def fail_on_two(i: int) -> int:
+            if i == 2:
+                raise ValueError(i)
+            return i
+
+        results = scan_helper.imap_ordered(fail_on_two, range(4), workers=2)
+        self.assertEqual([next(results), next(results)], [0, 1])
+        with self.assertRaises(ValueError):
+            next(results)
+
+
+class TestScanWorkers(unittest.TestCase):
+    def test_configured_workers(self):
+        for value, expected in [('4', 4), ('0', 1), ('-2', 1), ('many', 1)]:
+            with self.subTest(value=value):
+                with mock.patch.dict(os.environ, {'CM_SCAN_WORKERS': value}):
+                    self.assertEqual(scan_helper.get_scan_workers(), expected)
+
+
+class TestListDirectories(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = directory.name
+
+    def test_only_directories_are_listed(self):
+        os.mkdir(os.path.join(self.path, 'a0'))
+        os.mkdir(os.path.join(self.path, 'a1'))
+        open(os.path.join(self.path, 'notes.txt'), 'w').close()
+
+        entries = scan_helper.list_directories(self.path)
+        self.assertEqual(sorted(entry.name for entry in entries), ['a0', 'a1'])
+        self.assertEqual(sorted(entry.name for entry in scan_helper.list_entries(self.path)),
+                         ['a0', 'a1', 'notes.txt'])
+
+    def test_missing_directory_is_empty(self):
+        self.assertEqual(scan_helper.list_directories(os.path.join(self.path, 'missing')), [])
+        open(os.path.join(self.path, 'file'), 'w').close()
+        self.assertEqual(scan_helper.list_directories(os.path.join(self.path, 'file')), [])
@@ -0,0 +1,69 @@
+import unittest
+from datetime import datetime
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.models.schedule import Schedule, ScheduleProject, get_sort_key
+
+
+def _make_schedule(*projects: tuple) -> Schedule:
+    """Return a schedule of <projects>, which are tuples containing (project id, due date)."""
+    schedule = Schedule()
+    for project_id, due_date in projects:
+        schedule.add_project('csc108', ProjectSettings(project_id, project_id, due_date, None))
+    return schedule
+
+
+def _get_ids(scheduled: list) -> list:
+    return [project.project_id for _, projects in scheduled for project in projects]
+
+
+class TestSchedule(unittest.TestCase):
+    def test_sorted_by_due_date(self):
+        schedule = _make_schedule(('c', datetime(2026, 10, 20, 9)), ('a', datetime(2026, 10, 18)),
+                                  ('u', None), ('b', datetime(2026, 10, 19, 23, 59)))
+        scheduled, unscheduled = schedule.get_schedule()
+
+        self.assertEqual([day for day, _ in scheduled], ['2026-10-18', '2026-10-19', '2026-10-20'])
+        self.assertEqual(_get_ids(scheduled), ['a', 'b', 'c'])
+        self.assertEqual([project.project_id for project in unscheduled], ['u'])
+        self.assertEqual(scheduled[1][1][0].due_time, '23:59')
+
+    def test_same_due_time_keeps_order_of_addition(self):
+        due_date = datetime(2026, 10, 18, 12)
+        schedule = _make_schedule(('b', due_date), ('a', due_date), ('c', due_date))
+        self.assertEqual(_get_ids(schedule.get_schedule()[0]), ['b', 'a', 'c'])
+
+    def test_seconds_are_kept(self):
+        schedule = _make_schedule(('b', datetime(2026, 10, 18, 12, 0, 30)),
+                                  ('a', datetime(2026, 10, 18, 12, 0, 10)))
+        self.assertEqual(_get_ids(schedule.get_schedule()[0]), ['a', 'b'])
+        self.assertEqual(_get_ids(schedule.range(start=datetime(2026, 10, 18, 12, 0, 20))), ['b'])
+
+    def test_adding_after_query(self):
+        schedule = _make_schedule(('b', datetime(2026, 10, 19)))
+        self.assertEqual(_get_ids(schedule.next(5, datetime(2026, 10, 18))), ['b'])
+
+        schedule.add_project('csc108', ProjectSettings('a', 'a', datetime(2026, 10, 18, 1), None))
+        self.assertEqual(_get_ids(schedule.next(5, datetime(2026, 10, 18))), ['a', 'b'])
+        self.assertEqual(_get_ids(schedule.overdue(datetime(2026, 10, 18, 2))), ['a'])
+
+
+class TestScheduleProject(unittest.TestCase):
+    def test_due_date_and_time_from_sort_key(self):
+        project = ScheduleProject('a0', 'A0', 'csc108',
+                                  get_sort_key(datetime(2026, 10, 18, 23, 59, 30)))
+        self.assertEqual(project.due_date, '2026-10-18')
+        self.assertEqual(project.due_time, '23:59')
+
+    def test_unscheduled(self):
+        project = ScheduleProject('a0', 'A0', 'csc108')
+        self.assertIsNone(project.due_date)
+        self.assertIsNone(project.due_time)
+
+    def test_compact_representation(self):
+        first = ScheduleProject('a0', 'A0', ''.join(['csc', '108']))
+        second = ScheduleProject('a1', 'A1', ''.join(['csc1', '08']))
+
+        self.assertFalse(hasattr(first, '__dict__'))
+        self.assertIs(first.course_code, second.course_code)
+        self.assertEqual(first, ScheduleProject('a0', 'A0', 'csc108'))
+        self.assertNotEqual(first, second)
@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import tempfile
+import subprocess
+import unittest
+
+# Modules which would show that startup imports more than the command being run needs
+HEAVY_MODULES = [
+    'csv',
+    'dateutil',
+    'gzip',
+    'json',
+    'lzma',
+    'shutil',
+    'socket',
+    'tarfile',
+    'course_manager.commands.cmd_schedule',
+    'course_manager.helpers.file_helper',
+    'course_manager.helpers.index_helper',
+]
+
+# Number of modules cm may import on top of click to run a light command
+MAX_EXTRA_MODULES = 35
+
+_COUNT_SCRIPT = '''
+import sys
+import json
+
+before = set(sys.modules)
+sys.argv = sys.argv[1:]
+
+if sys.argv[1] == 'click':
+    import click
+else:
+    from course_manager.__main__ import main
+    try:
+        main()
+    except SystemExit:
+        pass
+
+print(json.dumps(sorted(set(sys.modules) - before)), file=sys.stderr)
+'''
+
+
+def _get_imported_modules(*argv: str):
+    """Return the modules imported by running cm with <argv> in a new interpreter, or by
+    importing click if <argv> is ('click',)."""
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, CM_BASE_DIRECTORY=home,
+                   CM_DAEMON_SOCKET=os.path.join(home, 'missing.sock'))
+        env['PYTHONPATH'] = os.pathsep.join(
+            [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+            + [path for path in [os.environ.get('PYTHONPATH')] if path])
+
+        process = subprocess.run([sys.executable, '-c', _COUNT_SCRIPT, 'cm', *argv],
+                                 env=env, capture_output=True, text=True, check=True)
+
+    return set(json.loads(process.stderr.splitlines()[-1]))
+
+
+class TestStartup(unittest.TestCase):
+    def test_config_command_imports_few_modules(self):
+        modules = _get_imported_modules('config', 'base_directory')
+        click_modules = _get_imported_modules('click')
+
+        self.assertLessEqual(len(modules - click_modules), MAX_EXTRA_MODULES,
+                             sorted(modules - click_modules))
+
+    def test_config_command_does_not_import_heavy_modules(self):
+        modules = _get_imported_modules('config', 'base_directory')
+
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_show_command_does_not_import_archive_modules(self):
+        modules = _get_imported_modules('show')
+
+        for module in ['gzip', 'tarfile', 'course_manager.helpers.archive_helper']:
+            self.assertNotIn(module, modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
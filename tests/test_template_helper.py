@@ -0,0 +1,87 @@
+import errno
+import os
+import tempfile
+import unittest
+from unittest import mock
+from course_manager.helpers import file_helper, template_helper
+
+
+class TestInstantiateTemplate(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.template = os.path.join(directory.name, 'template')
+        self.destination = os.path.join(directory.name, 'project')
+        os.mkdir(self.destination)
+
+        # template/
+        #   run.sh, src/main.py, src/lib -> ../lib, lib/util.py, main.py -> src/main.py, .cm
+        os.makedirs(os.path.join(self.template, 'src'))
+        os.mkdir(os.path.join(self.template, 'lib'))
+        for name, content in [('run.sh', 'python main.py\n'), ('src/main.py', 'print(1)\n'),
+                              ('lib/util.py', ''), ('.cm', 'settings')]:
+            with open(os.path.join(self.template, name), 'w') as f:
+                f.write(content)
+        os.chmod(os.path.join(self.template, 'run.sh'), 0o755)
+        os.symlink('../lib', os.path.join(self.template, 'src', 'lib'))
+        os.symlink('src/main.py', os.path.join(self.template, 'main.py'))
+
+    def get_path(self, *paths: str) -> str:
+        return os.path.join(self.destination, *paths)
+
+    def assert_instantiated(self):
+        self.assertEqual(sorted(os.listdir(self.destination)), ['lib', 'main.py', 'run.sh', 'src'])
+        self.assertEqual(os.stat(self.get_path('run.sh')).st_mode & 0o777, 0o755)
+        with open(self.get_path('main.py')) as f:
+            self.assertEqual(f.read(), 'print(1)\n')
+
+        # Symbolic links are recreated with the same target, and not followed
+        self.assertEqual(os.readlink(self.get_path('main.py')), 'src/main.py')
+        self.assertEqual(os.readlink(self.get_path('src', 'lib')), '../lib')
+        self.assertTrue(os.path.isfile(self.get_path('src', 'lib', 'util.py')))
+
+    def test_copy(self):
+        methods = template_helper.instantiate_template(self.template, self.destination,
+                                                       exclude={'.cm'}, workers=2)
+        self.assert_instantiated()
+
+        self.assertEqual(sum(methods.values()), 3)
+        self.assertTrue(set(methods) <= {'reflink', 'copy'})
+        self.assertNotEqual(os.stat(self.get_path('run.sh')).st_ino,
+                            os.stat(os.path.join(self.template, 'run.sh')).st_ino)
+
+    def test_link(self):
+        methods = template_helper.instantiate_template(self.template, self.destination,
+                                                       link=True, exclude={'.cm'})
+        self.assert_instantiated()
+
+        self.assertEqual(methods, {'link': 3})
+        self.assertEqual(os.stat(self.get_path('run.sh')).st_ino,
+                         os.stat(os.path.join(self.template, 'run.sh')).st_ino)
+
+    def test_link_falls_back_to_copy(self):
+        with mock.patch.object(os, 'link', side_effect=OSError(errno.EXDEV, 'cross-device')):
+            methods = template_helper.instantiate_template(self.template, self.destination,
+                                                           link=True, exclude={'.cm'})
+        self.assert_instantiated()
+        self.assertNotIn('link', methods)
+
+
+class TestCopyFile(unittest.TestCase):
+    def test_copy_without_kernel_support(self):
+        with tempfile.TemporaryDirectory() as directory:
+            src = os.path.join(directory, 'src')
+            dst = os.path.join(directory, 'dst')
+            content = os.urandom(3 * 1024 * 1024 + 5)
+            with open(src, 'wb') as f:
+                f.write(content)
+
+            unsupported = OSError(errno.EOPNOTSUPP, 'not supported')
+            with mock.patch.object(file_helper, '_clone', return_value=False), \
+                    mock.patch.object(file_helper, '_copy_file_range_chunk',
+                                      side_effect=unsupported), \
+                    mock.patch.object(file_helper, '_sendfile_chunk', side_effect=unsupported):
+                self.assertEqual(file_helper.copy_file(src, dst), 'copy')
+
+            with open(dst, 'rb') as f:
+                self.assertEqual(f.read(), content)
@@ -0,0 +1,87 @@
+import os
+import pstats
+import threading
+import unittest
+from unittest import mock
+from click.testing import CliRunner
+from course_manager import app
+from course_manager.helpers import timing_helper
+from tests.utils import BaseDirectoryTestCase
+
+
+class TimingTestCase(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # Timing starts without totals, and stays disabled for other tests
+        for patcher in [mock.patch.object(timing_helper, '_enabled', False),
+                        mock.patch.dict(timing_helper._totals, clear=True)]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestPhase(TimingTestCase):
+    def test_disabled(self):
+        with timing_helper.phase(timing_helper.PHASE_SCAN):
+            pass
+        self.assertEqual(timing_helper.get_timings(), {})
+
+    def test_nested_phases_are_not_counted_twice(self):
+        timing_helper.enable()
+
+        # scan from 0 to 10, with decode from 2 to 5 and model from 6 to 7 in it
+        with mock.patch.object(timing_helper.time, 'perf_counter',
+                               side_effect=[0.0, 2.0, 5.0, 6.0, 7.0, 10.0]):
+            with timing_helper.phase(timing_helper.PHASE_SCAN):
+                with timing_helper.phase(timing_helper.PHASE_DECODE):
+                    pass
+                with timing_helper.phase(timing_helper.PHASE_MODEL):
+                    pass
+
+        self.assertEqual(timing_helper.get_timings(), {timing_helper.PHASE_SCAN: 6.0,
+                                                       timing_helper.PHASE_DECODE: 3.0,
+                                                       timing_helper.PHASE_MODEL: 1.0})
+
+    def test_threads_are_summed(self):
+        timing_helper.enable()
+        barrier = threading.Barrier(3)
+
+        def work():
+            with timing_helper.phase(timing_helper.PHASE_DECODE):
+                barrier.wait()
+
+        with timing_helper.phase(timing_helper.PHASE_SCAN):
+            threads = [threading.Thread(target=work) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        timings = timing_helper.get_timings()
+        self.assertEqual(set(timings), {timing_helper.PHASE_SCAN, timing_helper.PHASE_DECODE})
+        # Time in worker threads is not subtracted from the phase of the waiting thread
+        self.assertGreater(timings[timing_helper.PHASE_SCAN], 0.0)
+
+    def test_enable_resets_timings(self):
+        timing_helper.enable()
+        with timing_helper.phase(timing_helper.PHASE_RENDER):
+            pass
+
+        timing_helper.enable()
+        self.assertEqual(timing_helper.get_timings(), {})
+
+
+class TestProfile(TimingTestCase, BaseDirectoryTestCase):
+    def test_profile_option(self):
+        path = self.get_path('cm.prof')
+        result = CliRunner().invoke(app.run, ['--profile', path, 'schedule'],
+                                    catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0, result.stderr)
+        self.assertEqual(result.stderr.split()[:2], ['Phase', 'Seconds'])
+        for phase in timing_helper.PHASES + ['total']:
+            self.assertIn(f'\n{phase} ', result.stderr)
+        self.assertIn(f'Profile written to {path}.', result.stderr)
+
+        self.assertTrue(os.path.isfile(path))
+        self.assertGreater(pstats.Stats(path).total_calls, 0)
@@ -0,0 +1,68 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+from course_manager.helpers import todo_helper
+from course_manager.models.todo_item import TodoItem
+
+
+class TestTodoFile(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, todo_helper.TODO_FILENAME)
+
+        patcher = mock.patch.object(todo_helper, 'get_todo_file_path', return_value=self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read_file(self) -> str:
+        with open(self.path) as f:
+            return f.read()
+
+    def write_file(self, content: str):
+        with open(self.path, 'w') as f:
+            f.write(content)
+
+    def test_legacy_file_is_migrated(self):
+        self.write_file(json.dumps([TodoItem('a', '', False, None, 0).to_json()]))
+        todo_helper.add_todo_item(None, TodoItem('b', '', False, None, 0))
+
+        items = todo_helper.get_todo_items(None)
+        self.assertEqual([item.title for item in items], ['a', 'b'])
+        self.assertFalse(self.read_file().startswith('['))
+
+    def test_corrupt_legacy_file_is_not_changed(self):
+        content = '[{"title": "a", '
+        self.write_file(content)
+
+        self.assertEqual(todo_helper.get_todo_items(None), [])
+        with self.assertRaises(todo_helper.TodoFileError):
+            todo_helper.add_todo_item(None, TodoItem('b', '', False, None, 0))
+        with self.assertRaises(todo_helper.TodoFileError):
+            todo_helper.remove_todo_items(None, ['0'])
+
+        self.assertEqual(self.read_file(), content)
+
+    def test_reading_does_not_compact(self):
+        item = TodoItem('a', '', False, None, 0)
+        todo_helper.add_todo_item(None, item)
+        records = [{'op': todo_helper.OP_MARK, 'id': item.item_id, 'is_complete': True}] * 2000
+        with open(self.path, 'a') as f:
+            f.write(''.join(json.dumps(record) + '\n' for record in records))
+        content = self.read_file()
+
+        self.assertEqual(len(todo_helper.get_todo_items(None)), 1)
+        self.assertEqual(self.read_file(), content)
+
+    def test_appending_compacts(self):
+        item = TodoItem('a', '', False, None, 0)
+        todo_helper.add_todo_item(None, item)
+
+        for _ in range(todo_helper.COMPACTION_THRESHOLD // 100):
+            todo_helper.mark_todo_items(None, [item.item_id] * 10)
+
+        self.assertLess(os.path.getsize(self.path), todo_helper.COMPACTION_THRESHOLD)
+        items = todo_helper.get_todo_items(None)
+        self.assertEqual([(i.item_id, i.is_complete) for i in items], [(item.item_id, True)])
@@ -0,0 +1,81 @@
+import json
+from datetime import datetime
+from unittest import mock
+from course_manager.helpers import course_helper, project_helper, todo_helper, todo_query_helper
+from course_manager.helpers.todo_query_helper import TodoFilter
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.models.todo_item import TodoItem
+from tests.utils import BaseDirectoryTestCase
+
+
+class TestListTodoItems(BaseDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        course_helper.add_course('csc108')
+        course_helper.add_course('mat137')
+        project_helper.create_project('csc108', ProjectSettings('A0', 'a0', None, None))
+
+        for scope, title, is_complete, due_date, priority in [
+                (None, 'sleep', False, None, 1),
+                ('csc108', 'read', True, datetime(2026, 10, 19), 2),
+                ('csc108', 'review', False, datetime(2026, 10, 25), 0),
+                (('csc108', 'a0'), 'start', False, datetime(2026, 10, 19), 3),
+                ('mat137', 'prove', False, datetime(2026, 10, 18), 1)]:
+            todo_helper.add_todo_item(scope, TodoItem(title, '', is_complete, due_date, priority))
+
+    def list_titles(self, todo_filter: TodoFilter = TodoFilter(), **kwargs) -> list:
+        return [match.item.title
+                for match in todo_query_helper.list_todo_items(todo_filter, **kwargs)]
+
+    def test_order_of_scopes(self):
+        matches = todo_query_helper.list_todo_items(TodoFilter())
+        self.assertEqual([(match.scope, match.index, match.item.title) for match in matches],
+                         [(None, 0, 'sleep'), ('csc108', 0, 'read'), ('csc108', 1, 'review'),
+                          (('csc108', 'a0'), 0, 'start'), ('mat137', 0, 'prove')])
+
+    def test_filters(self):
+        self.assertEqual(self.list_titles(TodoFilter(incomplete=True)),
+                         ['sleep', 'review', 'start', 'prove'])
+        self.assertEqual(self.list_titles(TodoFilter(min_priority=2)), ['read', 'start'])
+        self.assertEqual(self.list_titles(TodoFilter(due_before=datetime(2026, 10, 20))),
+                         ['read', 'start', 'prove'])
+        self.assertEqual(self.list_titles(TodoFilter(course_codes=['csc108'], incomplete=True)),
+                         ['review', 'start'])
+
+    def test_sort(self):
+        # Ties keep the order of scopes
+        self.assertEqual(self.list_titles(sort=todo_query_helper.SORT_DUE),
+                         ['prove', 'start', 'read', 'review', 'sleep'])
+        self.assertEqual(self.list_titles(sort=todo_query_helper.SORT_PRIORITY),
+                         ['start', 'read', 'prove', 'sleep', 'review'])
+
+    def test_top_matches_sorted_prefix(self):
+        for sort in todo_query_helper.SORT_KEYS:
+            expected = self.list_titles(sort=sort)
+            for top in range(len(expected) + 2):
+                with self.subTest(sort=sort, top=top):
+                    self.assertEqual(self.list_titles(sort=sort, top=top), expected[:top])
+
+    def test_summaries_skip_files_that_cannot_match(self):
+        self.list_titles()
+
+        with mock.patch.object(todo_query_helper.todo_helper, 'get_todo_items',
+                               wraps=todo_helper.get_todo_items) as get_todo_items:
+            self.assertEqual(self.list_titles(TodoFilter(min_priority=3)), ['start'])
+        self.assertEqual([call.args[0] for call in get_todo_items.call_args_list],
+                         [('csc108', 'a0')])
+
+        # Changed files are read again
+        todo_helper.add_todo_item('mat137', TodoItem('submit', '', False, None, 5))
+        self.assertEqual(self.list_titles(TodoFilter(min_priority=3)), ['start', 'submit'])
+
+    def test_invalid_summaries_are_ignored(self):
+        summary_path = self.get_path(todo_query_helper.SUMMARY_FILE)
+
+        for content in ['{', '[]', json.dumps({'version': 0, 'scopes': {}}),
+                        json.dumps({'version': 1}),
+                        json.dumps({'version': 1, 'scopes': {'': 5, 'csc108': {'key': []}}})]:
+            with self.subTest(content=content):
+                with open(summary_path, 'w') as f:
+                    f.write(content)
+                self.assertEqual(self.list_titles(TodoFilter(min_priority=3)), ['start'])
@@ -0,0 +1,122 @@
+import os
+import time
+import unittest
+from datetime import datetime
+from typing import List
+from unittest import mock
+from course_manager.helpers import course_helper, project_helper, todo_helper, watch_helper
+from course_manager.helpers.watch_helper import ChangeEvent
+from course_manager.models.project_settings import ProjectSettings
+from course_manager.models.todo_item import TodoItem
+from tests.utils import BaseDirectoryTestCase
+
+
+class WatcherTests:
+    """Checks the events reported for changes to the course tree, mixed into the test case of
+    each kind of watcher.
+
+    === Attributes ===
+    poll: whether to use the polling watcher
+    watcher: the watcher of the base directory
+    """
+    poll: bool
+    watcher: watch_helper.Watcher
+
+    def setUp(self):
+        super().setUp()
+        course_helper.add_course('csc108')
+        project_helper.create_project('csc108', ProjectSettings('A0', 'a0', None, None))
+
+        try:
+            self.watcher = watch_helper.open_watcher(poll=self.poll, interval=0.01)
+        except OSError as e:
+            self.skipTest(f'Cannot watch the base directory: {e}')
+        self.addCleanup(self.watcher.close)
+
+    def read_events(self) -> List[ChangeEvent]:
+        """Return the events of the changes made since the last call."""
+        return self.watcher.read_events(timeout=0.5)
+
+    def change(self):
+        """Wait before making a change, since modification times are only as precise as the
+        kernel clock tick."""
+        if self.poll:
+            time.sleep(0.02)
+
+    def test_no_changes(self):
+        self.assertEqual(self.watcher.read_events(timeout=0), [])
+
+    def test_settings_and_todos(self):
+        self.change()
+        project_helper.write_project_settings(
+            'csc108', ProjectSettings('Assignment 0', 'a0', datetime(2026, 10, 20), None))
+        todo_helper.add_todo_item('csc108', TodoItem('Read', None, False, None))
+        todo_helper.add_todo_item(None, TodoItem('Sleep', None, False, None))
+
+        events = self.read_events()
+        self.assertIn(ChangeEvent(watch_helper.SETTINGS_CHANGED, 'csc108', 'a0'), events)
+        self.assertIn(ChangeEvent(watch_helper.TODOS_CHANGED, 'csc108'), events)
+        self.assertIn(ChangeEvent(watch_helper.TODOS_CHANGED), events)
+        self.assertEqual(len(events), len(set(events)))
+
+    def test_projects_and_courses(self):
+        self.change()
+        project_helper.create_project('csc108', ProjectSettings('A1', 'a1', None, None))
+        project_helper.delete_project('csc108', 'a0')
+        course_helper.add_course('mat137')
+        project_helper.create_project('mat137', ProjectSettings('PS1', 'ps1', None, None))
+
+        events = self.read_events()
+        for event in [ChangeEvent(watch_helper.PROJECT_ADDED, 'csc108', 'a1'),
+                      ChangeEvent(watch_helper.PROJECT_REMOVED, 'csc108', 'a0'),
+                      ChangeEvent(watch_helper.COURSE_ADDED, 'mat137'),
+                      ChangeEvent(watch_helper.PROJECT_ADDED, 'mat137', 'ps1')]:
+            self.assertIn(event, events)
+
+        # Changes to projects of added courses are tracked
+        self.change()
+        todo_helper.add_todo_item(('mat137', 'ps1'), TodoItem('Prove', None, False, None))
+        self.assertIn(ChangeEvent(watch_helper.TODOS_CHANGED, 'mat137', 'ps1'), self.read_events())
+
+        self.change()
+        course_helper.remove_course('mat137')
+        self.assertIn(ChangeEvent(watch_helper.COURSE_REMOVED, 'mat137'), self.read_events())
+
+    def test_templates_and_archived_courses_are_ignored(self):
+        self.change()
+        os.makedirs(self.get_path('csc108', 'templates', 'basic'))
+        os.makedirs(self.get_path(course_helper.ARCHIVED_DIRECTORY, 'mat137'))
+        self.assertEqual(self.read_events(), [])
+
+
+class TestPollingWatcher(WatcherTests, BaseDirectoryTestCase):
+    poll = True
+
+    def test_open_watcher(self):
+        self.assertIsInstance(self.watcher, watch_helper.PollingWatcher)
+
+    def test_waits_for_changes(self):
+        start = time.monotonic()
+        self.assertEqual(self.watcher.read_events(timeout=0.05), [])
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_unchanged_directories_are_not_listed(self):
+        listings = []
+        list_directories = watch_helper.scan_helper.list_directories
+
+        def tracking_list_directories(path):
+            listings.append(os.fspath(path))
+            return list_directories(path)
+
+        with mock.patch.object(watch_helper.scan_helper, 'list_directories',
+                               tracking_list_directories):
+            self.assertEqual(self.watcher.read_events(timeout=0), [])
+        self.assertEqual(listings, [])
+
+
+@unittest.skipUnless(hasattr(os, 'uname') and os.uname().sysname == 'Linux', 'requires inotify')
+class TestInotifyWatcher(WatcherTests, BaseDirectoryTestCase):
+    poll = False
+
+    def test_open_watcher(self):
+        self.assertIsInstance(self.watcher, watch_helper.InotifyWatcher)
@@ -0,0 +1,33 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from course_manager.helpers import config_helper
+
+
+class BaseDirectoryTestCase(unittest.TestCase):
+    """A test case whose base directory of courses is a new empty temporary directory.
+
+    The config file is not read or written, since the base directory is overridden through
+    the environment.
+
+    === Attributes ===
+    base_path: the path to the base directory
+    """
+    base_path: str
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.base_path = os.path.realpath(directory.name)
+
+        patcher = mock.patch.dict(os.environ, {'CM_BASE_DIRECTORY': self.base_path})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        config_helper.reload_config()
+        self.addCleanup(config_helper.reload_config)
+
+    def get_path(self, *paths: str) -> str:
+        """Return the path to <paths> in the base directory."""
+        return os.path.join(self.base_path, *paths)